@@ -0,0 +1,29 @@
+import hashlib
+from fastapi import Response
+from app.schemas import todo as td_scheme
+
+# strong ETag / If-None-Match (304) 처리
+#  같은 데이터라도 limit/cursor 에 따라 본문이 다르므로 요청 변형(variant)도 ETag 에 포함
+
+def make_etag(*parts) -> str:
+    return '"' + hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()[:32] + '"'
+
+def list_etag(user_id, version: tuple, *variant) -> str:
+    return make_etag('todos', user_id, *version, *variant)
+
+def item_etag(todo) -> str:
+    # 단건은 이미 조회한 행의 응답 필드 전체로 계산
+    return make_etag('todo', *(getattr(todo, field) for field in td_scheme.TODO_RESPONSE_FIELDS))
+
+def matches(if_none_match: str | None, etag: str) -> bool:
+    # If-None-Match 는 약한 비교 (W/ 접두어 무시), '*' 는 리소스가 있으면 일치
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(','):
+        tag = tag.strip()
+        if tag == '*' or tag.removeprefix('W/') == etag:
+            return True
+    return False
+
+def not_modified(etag: str) -> Response:
+    return Response(status_code=304, headers={'ETag': etag})
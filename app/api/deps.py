@@ -1,31 +1,43 @@
-from fastapi import Depends, HTTPException, status
+import logging
+from fastapi import Depends, Form, HTTPException, Request, status
 from fastapi.security import APIKeyHeader
 from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.utils import jwt_handler as jwt
 from app.db.models import User
-from app.db.database import SessionLocal
+from app.db.database import SessionLocal, AsyncSessionLocal
+from app.crud import user as user_crud
+from app.crud import async_user as async_user_crud
+from app.core import config, principal_cache, rate_limiter, request_context, token_versions
+from app.utils import bcrypt as bc
 from jose import ExpiredSignatureError
 from app.schemas import auth
 
 #oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/login")
 api_key_scheme = APIKeyHeader(name="Authorization", auto_error=False)
 
+logger = logging.getLogger(__name__)
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
         
 
-def get_current_user(token: str = Depends(api_key_scheme), db: Session = Depends(get_db)):
+def decode_access_claims(token: str) -> dict:
     if token is None:
         raise HTTPException(status_code=401, detail="Invalid token")
     #print(f'token is str : {type(token)}')
     try:
-        print('wrong')
         payload = jwt.decode_token(str(token))
     except :
+        logger.debug('access token rejected', exc_info=True)
         raise HTTPException(
             status_code=401,
             detail="Token has expired.",
@@ -36,15 +48,91 @@ def get_current_user(token: str = Depends(api_key_scheme), db: Session = Depends
     if payload is None:
         raise HTTPException(status_code=401, detail="Invalid token")
 
-    id = payload.get("sub")
-    device_id = payload.get("device_id")
-    if id is None:
+    if payload.get("sub") is None:
         raise HTTPException(status_code=401, detail="Invalid token")
+    return payload
 
-    user = db.query(User).filter(User.id == id).first()
-    if user is None:
+def is_stateless(payload: dict) -> bool:
+    # email/ver 클레임이 없는 (이전에 발급된) 토큰은 users 조회로 검증
+    return config.AUTH_TOKEN_MODE == 'stateless' and 'email' in payload and 'ver' in payload
+
+def stateless_principal(payload: dict, version):
+    if version == token_versions.DELETED:
         raise HTTPException(status_code=401, detail="User not found")
-    result = auth.Access_token_Model(id =id,email=user.email,device_id=device_id)
-    return result
+    if payload["ver"] != version:
+        raise HTTPException(status_code=401, detail="Token has been revoked.")
+    return auth.Access_token_Model(id=payload["sub"], email=payload["email"], device_id=payload.get("device_id"))
+
+def get_current_user(token: str = Depends(api_key_scheme), db: Session = Depends(get_db)):
+    with request_context.phase('auth'):
+        cached = principal_cache.get(token) if token else None
+        if cached is not None:
+            return cached
+        payload = decode_access_claims(token)
+        id, device_id, exp = payload["sub"], payload.get("device_id"), payload.get("exp")
+        generation = principal_cache.generation(id)
+
+        if is_stateless(payload):
+            version = token_versions.get(id)
+            if version is None:
+                version_generation = token_versions.generation(id)
+                version = token_versions.put(id, user_crud.get_token_version(db, id), version_generation)
+            result = stateless_principal(payload, version)
+            principal_cache.put(token, result, exp, generation)
+            return result
+
+        user = db.query(User).filter(User.id == id).first()
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        result = auth.Access_token_Model(id =id,email=user.email,device_id=device_id)
+        principal_cache.put(token, result, exp, generation)
+        return result
+
+async def get_current_user_async(token: str = Depends(api_key_scheme), db: AsyncSession = Depends(get_async_db)):
+    with request_context.phase('auth'):
+        cached = principal_cache.get(token) if token else None
+        if cached is not None:
+            return cached
+        payload = decode_access_claims(token)
+        id, device_id, exp = payload["sub"], payload.get("device_id"), payload.get("exp")
+        generation = principal_cache.generation(id)
+
+        if is_stateless(payload):
+            version = token_versions.get(id)
+            if version is None:
+                version_generation = token_versions.generation(id)
+                version = token_versions.put(id, await async_user_crud.get_token_version(db, id), version_generation)
+            result = stateless_principal(payload, version)
+            principal_cache.put(token, result, exp, generation)
+            return result
+
+        user = await async_user_crud.get_user_by_id(db, id)
+        if user is None:
+            raise HTTPException(status_code=401, detail="User not found")
+        result = auth.Access_token_Model(id =id,email=user.email,device_id=device_id)
+        principal_cache.put(token, result, exp, generation)
+        return result
+
+
+# 암호 검증 route 요청 한도 : route 의 dependencies 로 지정하여 DB 조회/bcrypt 보다 먼저 실행
+def client_ip(request: Request) -> str:
+    if config.RATE_LIMIT_TRUST_FORWARDED:
+        # 여러 X-Forwarded-For 헤더는 순서대로 이어 붙여 하나의 목록으로 본다
+        forwarded = [address.strip() for value in request.headers.getlist('x-forwarded-for') for address in value.split(',') if address.strip()]
+        if forwarded:
+            # 오른쪽에서 RATE_LIMIT_TRUSTED_HOPS 번째 = 가장 바깥 신뢰 프록시가 기록한 주소
+            return forwarded[-min(max(config.RATE_LIMIT_TRUSTED_HOPS, 1), len(forwarded))]
+    return request.client.host if request.client else ''
+
+def limit_password_attempts(request: Request):
+    rate_limiter.check_ip(client_ip(request))
+    bc.check_capacity()
+
+def limit_login_email(email: str = Form(...)):
+    rate_limiter.check_email(email)
 
+def limit_user_email(current_user=Depends(get_current_user)):
+    rate_limiter.check_email(current_user.email)
 
+async def limit_user_email_async(current_user=Depends(get_current_user_async)):
+    rate_limiter.check_email(current_user.email)
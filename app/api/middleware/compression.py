@@ -0,0 +1,153 @@
+import time
+import zlib
+from app.core import config, metrics
+
+# 응답 압축 (gzip / deflate) pure ASGI 미들웨어
+#  - Accept-Encoding 의 q 값으로 협상 (같으면 gzip 우선), 압축 가능한 content-type 만 처리
+#  - 본문이 한 번에 오는 응답은 COMPRESSION_MINIMUM_SIZE 바이트 이상일 때만 압축
+#  - StreamingResponse 는 chunk 마다 압축 후 flush 하여 바로 전송 (크기를 미리 알 수 없으므로 threshold 미적용)
+#  - 압축한 응답의 strong ETag 는 weak 로 바꾼다 (표현이 달라지므로, If-None-Match 는 약한 비교라 304 는 그대로 동작)
+COMPRESSED_RESPONSES = metrics.Counter('http_compressed_responses_total', '압축한 응답 수', ['encoding'])
+COMPRESSION_INPUT_BYTES = metrics.Counter('http_compression_input_bytes_total', '압축 전 응답 본문 바이트', ['encoding'])
+COMPRESSION_OUTPUT_BYTES = metrics.Counter('http_compression_output_bytes_total', '압축 후 응답 본문 바이트', ['encoding'])
+COMPRESSION_SAVED_BYTES = metrics.Counter('http_compression_saved_bytes_total', '압축으로 줄어든 바이트', ['encoding'])
+COMPRESSION_CPU_SECONDS = metrics.Counter('http_compression_cpu_seconds_total', '압축에 사용한 CPU 시간 (thread time)', ['encoding'])
+
+COMPRESSIBLE_TYPES = ('text/', 'application/json', 'application/x-ndjson', 'application/xml', 'application/javascript')
+
+WBITS = {'gzip': 16 + zlib.MAX_WBITS, 'deflate': zlib.MAX_WBITS}
+
+
+def select_encoding(accept_encoding: str) -> str | None:
+    weights = {}
+    for item in accept_encoding.split(','):
+        coding, _, params = item.strip().partition(';')
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith('q='):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[coding] = q
+    # 명시되지 않은 방식은 '*' 의 q 값을 따른다
+    best, best_q = None, 0.0
+    for coding in WBITS:
+        q = weights.get(coding, weights.get('*', 0.0))
+        if q > best_q:
+            best, best_q = coding, q
+    return best
+
+def compressible(headers: dict) -> bool:
+    content_type = headers.get(b'content-type', b'').decode('latin-1').lower()
+    cache_control = headers.get(b'cache-control', b'').decode('latin-1').lower()
+    return (content_type.startswith(COMPRESSIBLE_TYPES) and b'content-encoding' not in headers
+            and 'no-transform' not in cache_control)
+
+
+class Compressor:
+    def __init__(self, encoding: str, level: int):
+        self.encoding = encoding
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, WBITS[encoding])
+        self.input_bytes = 0
+        self.output_bytes = 0
+        self.cpu_seconds = 0.0
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        start = time.thread_time()
+        output = self._compressor.compress(data)
+        output += self._compressor.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+        self.cpu_seconds += time.thread_time() - start
+        self.input_bytes += len(data)
+        self.output_bytes += len(output)
+        return output
+
+    def record(self):
+        COMPRESSED_RESPONSES.inc(encoding=self.encoding)
+        COMPRESSION_INPUT_BYTES.inc(self.input_bytes, encoding=self.encoding)
+        COMPRESSION_OUTPUT_BYTES.inc(self.output_bytes, encoding=self.encoding)
+        COMPRESSION_SAVED_BYTES.inc(self.input_bytes - self.output_bytes, encoding=self.encoding)
+        COMPRESSION_CPU_SECONDS.inc(self.cpu_seconds, encoding=self.encoding)
+
+
+class CompressionMiddleware:
+    def __init__(self, app, minimum_size: int | None = None, level: int | None = None):
+        self.app = app
+        self.minimum_size = config.COMPRESSION_MINIMUM_SIZE if minimum_size is None else minimum_size
+        self.level = config.COMPRESSION_LEVEL if level is None else level
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http' or scope['method'] == 'HEAD':
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = ''
+        for name, value in scope['headers']:
+            if name == b'accept-encoding':
+                accept_encoding += value.decode('latin-1') + ','
+        encoding = select_encoding(accept_encoding) if accept_encoding else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        compressor = None
+
+        async def send_wrapper(message):
+            nonlocal start_message, compressor
+            if message['type'] == 'http.response.start':
+                start_message = message
+                return
+            if message['type'] != 'http.response.body':
+                await send(message)
+                return
+
+            body = message.get('body', b'')
+            more_body = message.get('more_body', False)
+            if start_message is not None:
+                # 첫 본문 : 압축 여부 결정 후 헤더 전송
+                start, start_message = start_message, None
+                headers = dict(start['headers'])
+                if compressible(headers) and start['status'] not in (204, 304):
+                    vary = headers.get(b'vary', b'').decode('latin-1')
+                    vary = f'{vary}, Accept-Encoding' if vary else 'Accept-Encoding'
+                    if more_body or len(body) >= self.minimum_size:
+                        compressor = Compressor(encoding, self.level)
+                    start['headers'] = self._headers(start['headers'], vary, compressor)
+                if compressor is not None and not more_body:
+                    # 본문 전체가 한 번에 온 경우 압축 후 Content-Length 를 다시 계산
+                    data = compressor.compress(body, True)
+                    start['headers'].append((b'content-length', str(len(data)).encode('latin-1')))
+                    await send(start)
+                    await send({'type': 'http.response.body', 'body': data, 'more_body': False})
+                    compressor.record()
+                    return
+                await send(start)
+            if compressor is None:
+                await send(message)
+                return
+            data = compressor.compress(body, not more_body)
+            if data or not more_body:
+                await send({'type': 'http.response.body', 'body': data, 'more_body': more_body})
+            if not more_body:
+                compressor.record()
+
+        await self.app(scope, receive, send_wrapper)
+
+    def _headers(self, raw_headers, vary: str, compressor: Compressor | None) -> list:
+        headers = []
+        for name, value in raw_headers:
+            if name == b'vary':
+                continue
+            if compressor is not None:
+                if name == b'content-length':
+                    continue
+                if name == b'etag' and not value.startswith(b'W/'):
+                    value = b'W/' + value
+            headers.append((name, value))
+        headers.append((b'vary', vary.encode('latin-1')))
+        if compressor is not None:
+            headers.append((b'content-encoding', compressor.encoding.encode('latin-1')))
+        return headers
@@ -0,0 +1,39 @@
+import time
+from app.core import metrics, request_context
+
+# pure ASGI 미들웨어 (BaseHTTPMiddleware 는 StreamingResponse 를 한 번 더 감싸므로 사용하지 않음)
+#  route 라벨은 경로 템플릿(/todos/{id})
+class MetricsMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+
+        method = scope['method']
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message['type'] == 'http.response.start':
+                status_code = message['status']
+            await send(message)
+
+        # RequestContextMiddleware 가 만든 context
+        context = request_context.current()
+        metrics.HTTP_IN_PROGRESS.inc(method=method)
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - start
+            metrics.HTTP_IN_PROGRESS.dec(method=method)
+            route = context.route
+            metrics.HTTP_REQUESTS.inc(method=method, route=route, status=str(status_code))
+            metrics.HTTP_REQUEST_SECONDS.observe(elapsed, method=method, route=route)
+            metrics.REQUEST_DB_STATEMENTS.observe(context.db_statements, route=route)
+            metrics.REQUEST_PHASE_SECONDS.observe(context.db_seconds, route=route, phase='db')
+            for phase, seconds in context.phases.items():
+                metrics.REQUEST_PHASE_SECONDS.observe(seconds, route=route, phase=phase)
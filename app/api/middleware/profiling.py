@@ -0,0 +1,78 @@
+import hmac
+import os
+import random
+import time
+from datetime import datetime, timezone
+from starlette.concurrency import run_in_threadpool
+from app.core import config, profiler, request_context
+
+# 요청 단위 프로파일 pure ASGI 미들웨어 (PROFILING_ENABLED=true 일 때만 추가되므로 비활성 시 비용 없음)
+#  PROFILING_HEADER 값이 PROFILING_TOKEN 과 같은 요청 또는 PROFILING_SAMPLE_RATE 비율의 요청을 프로파일
+#  결과 파일에 route / 상태코드 / SQL 문 수 / 구간별(password_hash = bcrypt, jwt = jose) 소요시간을 함께 기록
+class ProfilingMiddleware:
+    def __init__(self, app, ring: profiler.ProfileRing | None = None):
+        self.app = app
+        self.ring = ring or profiler.ring
+        self.header = config.PROFILING_HEADER.lower().encode('latin-1')
+        self.token = config.PROFILING_TOKEN.encode('utf-8')
+        self.sample_rate = config.PROFILING_SAMPLE_RATE
+
+    def trigger(self, scope) -> str | None:
+        if self.token:
+            for name, value in scope['headers']:
+                if name == self.header and hmac.compare_digest(value, self.token):
+                    return 'header'
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return 'sample'
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        trigger = self.trigger(scope)
+        if trigger is None or not profiler.try_acquire():
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            path = self.ring.reserve()
+            status_code = 500
+
+            async def send_wrapper(message):
+                nonlocal status_code
+                if message['type'] == 'http.response.start':
+                    status_code = message['status']
+                    # 관리자 요청에는 결과 파일 이름을 알려줌
+                    if trigger == 'header':
+                        message['headers'] = [*message['headers'], (b'x-profile-id', os.path.basename(path).encode('latin-1'))]
+                await send(message)
+
+            # RequestContextMiddleware 가 만든 context
+            context = request_context.current()
+            collector = profiler.collector()
+            start = time.perf_counter()
+            collector.start()
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                collector.stop()
+                elapsed = time.perf_counter() - start
+                annotations = {
+                    'timestamp': datetime.now(timezone.utc).isoformat(),
+                    'request_id': request_context.request_id(),
+                    'trigger': trigger,
+                    'mode': config.PROFILING_MODE,
+                    'method': scope['method'],
+                    'path': scope['path'],
+                    'route': context.route,
+                    'status': status_code,
+                    'elapsed_ms': f'{elapsed * 1000:.3f}',
+                    'db_statements': context.db_statements,
+                    'db_ms': f'{context.db_seconds * 1000:.3f}',
+                }
+                for phase in ('auth', 'jwt', 'password_hash'):
+                    annotations[f'{phase}_ms'] = f'{context.phases.get(phase, 0.0) * 1000:.3f}'
+                await run_in_threadpool(self.ring.write, path, annotations, collector.render())
+        finally:
+            profiler.release()
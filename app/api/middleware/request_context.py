@@ -0,0 +1,17 @@
+from app.core import request_context
+
+# request 단위 계측 정보(app.core.request_context) 생성 - METRICS_ENABLED / PROFILING_ENABLED 와 무관하게 항상 추가
+#  N+1 감지(app.db.query_monitor), 메트릭/프로파일 미들웨어는 여기서 만든 context 를 사용
+class RequestContextMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        _, token = request_context.begin(scope)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            request_context.end(token)
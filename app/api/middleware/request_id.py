@@ -0,0 +1,33 @@
+import re
+import uuid
+from app.core import request_context
+
+# 요청마다 request ID 를 정해 로그 레코드(app.core.logging_setup)와 응답 X-Request-ID 헤더에 사용
+#  클라이언트/프록시가 보낸 X-Request-ID 가 안전한 형식이면 그대로 이어 쓴다
+REQUEST_ID_PATTERN = re.compile(rb'[A-Za-z0-9._-]{1,64}')
+
+class RequestIdMiddleware:
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] != 'http':
+            await self.app(scope, receive, send)
+            return
+        request_id = None
+        for name, value in scope['headers']:
+            if name == b'x-request-id' and REQUEST_ID_PATTERN.fullmatch(value):
+                request_id = value.decode('ascii')
+                break
+        request_id = request_id or uuid.uuid4().hex
+
+        async def send_wrapper(message):
+            if message['type'] == 'http.response.start':
+                message['headers'] = [*message['headers'], (b'x-request-id', request_id.encode('ascii'))]
+            await send(message)
+
+        token = request_context.set_request_id(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            request_context.reset_request_id(token)
@@ -0,0 +1,66 @@
+from fastapi import HTTPException, Response
+from datetime import datetime
+from app.utils import cursor as cursor_util
+
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
+def decode(cursor: str | None) -> dict | None:
+    if cursor is None:
+        return None
+    try:
+        return cursor_util.decode_cursor(cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+def decode_after_id(cursor: str | None) -> int | None:
+    if cursor is None:
+        return None
+    try:
+        return int(cursor_util.decode_cursor(cursor)['id'])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+# crud 에서 limit + 1 건을 조회해 다음 페이지 존재 여부를 판단
+def paginate(response: Response, items: list, limit: int | None, cursor_of=lambda item: {'id': item.id}) -> list:
+    if limit is None or len(items) <= limit:
+        return items
+    items = items[:limit]
+    response.headers[NEXT_CURSOR_HEADER] = cursor_util.encode_cursor(cursor_of(items[-1]))
+    return items
+
+def decode_search_cursor(cursor: str | None) -> dict | None:
+    values = decode(cursor)
+    if values is None:
+        return None
+    try:
+        return {'rank': float(values['rank']), 'id': int(values['id'])}
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+def search_cursor(row) -> dict:
+    return {'rank': row.rank, 'id': row.id}
+
+def decode_range_cursor(cursor: str | None) -> tuple | None:
+    values = decode(cursor)
+    if values is None:
+        return None
+    try:
+        return datetime.fromisoformat(values['date']), int(values['id'])
+    except (KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+def range_cursor(todo) -> dict:
+    return {'date': todo.todo_date.isoformat(), 'id': todo.id}
+
+# GET /todos/changes 커서 : 마지막으로 받은 변경 순번(seq), 전체 목록을 이어 받는 중이면 full
+def decode_changes_cursor(cursor: str | None) -> tuple[int | None, bool]:
+    values = decode(cursor)
+    if values is None:
+        return None, False
+    try:
+        return int(values['seq']), bool(values.get('full', False))
+    except (AttributeError, KeyError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+def changes_cursor(seq: int, full: bool = False) -> str:
+    return cursor_util.encode_cursor({'seq': seq, 'full': True} if full else {'seq': seq})
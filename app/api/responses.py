@@ -0,0 +1,20 @@
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from app.schemas import todo as td_scheme
+
+# 목록 응답 fast path : crud 가 조회한 Row 튜플을 행마다 모델을 만들지 않고 바로 orjson 으로 변환
+#  출력은 response_model(TodoResponse / TodoSearchResponse) 직렬화 결과와 같다 (tests/test_responses.py)
+#  Response 를 직접 반환하면 파라미터 response 에 설정한 헤더(X-Next-Cursor)가 빠지므로 복사한다
+def todo_rows(rows, response: Response, fields: tuple = td_scheme.TODO_RESPONSE_FIELDS) -> ORJSONResponse:
+    return ORJSONResponse([dict(zip(fields, row)) for row in rows], headers=dict(response.headers))
+
+def todo_search_rows(rows, response: Response) -> ORJSONResponse:
+    return todo_rows(rows, response, td_scheme.TODO_SEARCH_FIELDS)
+
+def todo_changes(changes: dict, cursor: str) -> ORJSONResponse:
+    return ORJSONResponse({
+        'changes': [dict(zip(td_scheme.TODO_CHANGE_FIELDS, row)) for row in changes['changed']],
+        'deleted': [dict(zip(td_scheme.TODO_TOMBSTONE_FIELDS, row)) for row in changes['deleted']],
+        'cursor': cursor,
+        'has_more': changes['has_more'],
+    })
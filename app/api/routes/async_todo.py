@@ -0,0 +1,118 @@
+from fastapi import APIRouter, Depends,Form,Query,Response,Header,Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import todo as td_scheme
+from typing import List
+from app.services import async_todo_service as todo_service
+from app.api import deps
+from fastapi import HTTPException
+from typing import Optional
+from datetime import datetime
+from app.schemas import response
+from app.api import pagination
+from app.api import responses
+from app.api import conditional
+from app.core import config
+from app.schemas.enum import TransferFormat
+from app.services import todo_transfer
+
+router = APIRouter()
+
+@router.post("/", response_model=td_scheme.TodoResponse,summary='일정 생성')
+async def create_todo(todo: td_scheme.TodoCreate, db: AsyncSession = Depends(deps.get_async_db), current_user = Depends(deps.get_current_user_async)):
+    user_id = current_user.id
+    return await todo_service.create_todo(db, user_id, todo)
+
+@router.post("/batch", response_model=td_scheme.TodoBatchResponse,summary='일정 일괄 처리', description='create/update/delete 작업을 하나의 트랜잭션으로 처리하고 항목별 결과를 반환합니다.')
+async def batch_todos(batch: td_scheme.TodoBatchRequest, db: AsyncSession = Depends(deps.get_async_db), current_user = Depends(deps.get_current_user_async)):
+    if len(batch.operations) > config.TODO_BATCH_MAX_OPERATIONS:
+        raise HTTPException(status_code=413, detail=f"Too many operations (max {config.TODO_BATCH_MAX_OPERATIONS}).")
+    user_id = current_user.id
+    return await todo_service.apply_batch(db, user_id, batch.operations)
+
+@router.post("/import", response_model=td_scheme.TodoImportResponse,summary='일정 가져오기', description='ndjson / csv 본문을 읽는 대로 파싱하여 TODO_IMPORT_CHUNK_ROWS 행씩 한 트랜잭션으로 추가합니다. 형식이 잘못된 행은 건너뛰고 errors 로 반환합니다.')
+async def import_todos(request: Request, format: TransferFormat=Query(TransferFormat.NDJSON,description='본문 형식'), db: AsyncSession = Depends(deps.get_async_db), current_user = Depends(deps.get_current_user_async)):
+    user_id = current_user.id
+    async def insert(rows):
+        return await todo_service.import_todos(db, user_id, rows)
+    try:
+        return await todo_transfer.import_stream(request.stream(), format, insert)
+    except todo_transfer.InvalidImport as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@router.get("/", response_model=List[td_scheme.TodoResponse],summary='일정 조회', description='limit 지정시 다음 페이지 커서를 X-Next-Cursor 헤더로 반환합니다. stream=true 이면 NDJSON 으로 스트리밍합니다. If-None-Match 가 ETag 와 같으면 304 를 반환합니다.')
+async def read_todos(response: Response, limit: Optional[int]=Query(None,ge=1,le=1000,description='페이지 크기'), cursor: Optional[str]=Query(None,description='다음 페이지 커서'), stream: bool=Query(False,description='NDJSON 스트리밍'), if_none_match: Optional[str]=Header(None,description='이전 응답의 ETag'), db: AsyncSession = Depends(deps.get_async_db),  current_user = Depends(deps.get_current_user_async)):
+    user_id = current_user.id
+    if stream:
+        return StreamingResponse(todo_service.stream_todos(user_id), media_type='application/x-ndjson')
+    # 목록을 조회하기 전에 버전(crud.todo.TODOS_VERSION : max seq, 건수, 삭제 기록 max seq)만으로 변경 여부 확인
+    etag = conditional.list_etag(user_id, await todo_service.get_todos_version(db, user_id), limit, cursor)
+    if conditional.matches(if_none_match, etag):
+        return conditional.not_modified(etag)
+    response.headers['ETag'] = etag
+    after_id = pagination.decode_after_id(cursor)
+    todos = await todo_service.get_todos(db, user_id, limit + 1 if limit else None, after_id)
+    return responses.todo_rows(pagination.paginate(response, todos, limit), response)
+
+@router.get("/range", response_model=List[td_scheme.TodoResponse],summary='기간별 일정 조회', description='todo_date 가 [from, to) 범위인 일정을 날짜순으로 반환합니다.')
+async def read_todos_in_range(response: Response, date_from: datetime=Query(...,alias='from',description='시작일시(포함)'), date_to: datetime=Query(...,alias='to',description='종료일시(미포함)'), limit: Optional[int]=Query(None,ge=1,le=1000,description='페이지 크기'), cursor: Optional[str]=Query(None,description='다음 페이지 커서'), db: AsyncSession = Depends(deps.get_async_db),  current_user = Depends(deps.get_current_user_async)):
+    # todo_date 는 timezone 없이 저장되므로 비교값도 naive 로 맞춤
+    date_from, date_to = date_from.replace(tzinfo=None), date_to.replace(tzinfo=None)
+    if date_to <= date_from:
+        raise HTTPException(status_code=400, detail="'to' must be later than 'from'.")
+    user_id = current_user.id
+    after = pagination.decode_range_cursor(cursor)
+    todos = await todo_service.get_todos_in_range(db, user_id, date_from, date_to, limit + 1 if limit else None, after)
+    return responses.todo_rows(pagination.paginate(response, todos, limit, pagination.range_cursor), response)
+
+@router.get("/changes", response_model=td_scheme.TodoChangesResponse,summary='일정 변경분 조회', description='since 커서 이후 생성/수정된 일정과 삭제된 일정 ID 를 반환합니다. 두 목록은 seq 순서대로 적용합니다 (삭제된 ID 는 새 일정에 재사용되지 않음). since 가 없으면 전체 일정을 반환하며, has_more 이면 cursor 로 이어서 요청합니다. 삭제 기록 보관기간(TOMBSTONE_RETENTION_DAYS)보다 오래된 cursor 는 410 을 반환하므로 since 없이 전체를 다시 받습니다.')
+async def read_todo_changes(since: Optional[str]=Query(None,description='이전 응답의 cursor'), limit: int=Query(500,ge=1,le=1000,description='최대 변경 건수'), db: AsyncSession = Depends(deps.get_async_db), current_user = Depends(deps.get_current_user_async)):
+    since, full = pagination.decode_changes_cursor(since)
+    changes = await todo_service.get_changes(db, current_user.id, since, limit, full)
+    if changes is None:
+        raise HTTPException(status_code=410, detail="Cursor expired, full resync required.")
+    return responses.todo_changes(changes, pagination.changes_cursor(changes['seq'], changes['full']))
+
+@router.get("/export", summary='일정 내보내기', description='전체 일정을 id 순으로 ndjson / csv 파일로 스트리밍합니다. (서버측 커서에서 TODO_EXPORT_BATCH_SIZE 행씩 전송)')
+async def export_todos(format: TransferFormat=Query(TransferFormat.NDJSON,description='파일 형식'), current_user = Depends(deps.get_current_user_async)):
+    return StreamingResponse(todo_service.export_todos(current_user.id, format), media_type=todo_transfer.MEDIA_TYPES[format],
+                             headers={'Content-Disposition': f'attachment; filename="todos.{format.value}"'})
+
+@router.get("/{id}", response_model=td_scheme.TodoResponse,summary='특정 일정 조회', description='If-None-Match 가 ETag 와 같으면 304 를 반환합니다.')
+async def read_todo(id: int, response: Response, if_none_match: Optional[str]=Header(None,description='이전 응답의 ETag'), db: AsyncSession = Depends(deps.get_async_db),  current_user = Depends(deps.get_current_user_async)):
+    user_id = current_user.id
+    todo = await todo_service.get_todo_by_id(db, id, user_id)
+    if not todo:
+        raise HTTPException(status_code=404, detail="Todo not found")
+    etag = conditional.item_etag(todo)
+    if conditional.matches(if_none_match, etag):
+        return conditional.not_modified(etag)
+    response.headers['ETag'] = etag
+    return todo
+
+@router.put("/{id}", response_model=td_scheme.TodoResponse,summary='일정 수정')
+async def update_todo(id: int, update_data: td_scheme.TodoUpdate, db: AsyncSession = Depends(deps.get_async_db),  current_user = Depends(deps.get_current_user_async)):
+    user_id = current_user.id
+    todo = await todo_service.update_todo(db, id, user_id, update_data)
+    return todo
+
+@router.delete("/{id}",response_model =response.CudResponseModel ,summary='일정 삭제')
+async def delete_todo(id: int, db: AsyncSession = Depends(deps.get_async_db),  current_user = Depends(deps.get_current_user_async)):
+    user_id = current_user.id
+    deleted = await todo_service.delete_todo(db, id, user_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Todo not found or unauthorized")
+    result = response.CudResponseModel(message="Todo deleted")
+    return result
+
+@router.get("/search/", response_model=List[td_scheme.TodoSearchResponse],summary='일정 정보 검색', description='q 는 제목과 설명을 전문검색(접두어 일치)하여 관련도 순으로 반환합니다.')
+async def search_todos(response: Response, title: Optional[str]=Query(None,description='타이틀'),q: Optional[str]=Query(None,description='검색어(제목+설명)'),date: Optional[datetime]=Query(None,description='날짜'), limit: Optional[int]=Query(None,ge=1,le=1000,description='페이지 크기'), cursor: Optional[str]=Query(None,description='다음 페이지 커서'), stream: bool=Query(False,description='NDJSON 스트리밍'), db: AsyncSession = Depends(deps.get_async_db),  current_user = Depends(deps.get_current_user_async)):
+    user_id = current_user.id
+    if stream:
+        return StreamingResponse(todo_service.stream_todos(user_id, title, date, q=q), media_type='application/x-ndjson')
+    if q and q.strip() != '':
+        rows = await todo_service.full_text_search(db, user_id, q, date, limit + 1 if limit else None, pagination.decode_search_cursor(cursor), title)
+        return responses.todo_search_rows(pagination.paginate(response, rows, limit, pagination.search_cursor), response)
+    after_id = pagination.decode_after_id(cursor)
+    todos = await todo_service.search_todos(db, user_id, title,date, limit + 1 if limit else None, after_id)
+    return responses.todo_search_rows(pagination.paginate(response, todos, limit), response)
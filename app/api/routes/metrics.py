@@ -0,0 +1,30 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+from app.core import metrics, principal_cache, rate_limiter, token_versions
+from app.utils import bcrypt as bc
+from app.services import token_purge_service, tombstone_purge_service, todo_service
+
+router = APIRouter()
+
+def render() -> str:
+    return ''.join([
+        metrics.REGISTRY.render(),
+        metrics.render_stats('principal_cache', principal_cache.stats(), '인증 principal 캐시',
+                             counters=('hits', 'misses', 'evictions', 'expirations', 'invalidations')),
+        metrics.render_stats('token_versions', token_versions.stats(), 'stateless 인증 사용자별 토큰 버전 맵',
+                             counters=('hits', 'misses', 'evictions', 'expirations', 'invalidations')),
+        metrics.render_stats('todo_cache', todo_service.cache_stats(), '일정 조회 캐시',
+                             counters=('hits', 'misses', 'evictions', 'expirations', 'invalidations')),
+        metrics.render_stats('rate_limit_store', rate_limiter.stats(), '요청 한도 저장소',
+                             counters=('allowed', 'rejected', 'evictions')),
+        metrics.render_stats('password_hasher', bc.stats(), '암호 해시 executor', counters=('rejected',)),
+        metrics.render_stats('token_purge', token_purge_service.stats(), '만료 refresh token 정리',
+                             counters=('rows_purged', 'batches', 'total_batch_seconds')),
+        metrics.render_stats('tombstone_purge', tombstone_purge_service.stats(), '보관기간이 지난 일정 삭제 기록 정리',
+                             counters=('rows_purged', 'batches', 'total_batch_seconds')),
+    ])
+
+# 동기 함수 -> threadpool 에서 실행 (렌더링 중 이벤트 루프를 막지 않음)
+@router.get('/metrics', response_class=PlainTextResponse, summary='메트릭 (Prometheus)')
+def read_metrics():
+    return PlainTextResponse(render(), media_type=metrics.CONTENT_TYPE)
@@ -30,7 +30,8 @@ def read_user(current_user=Depends(deps.get_current_user), db: Session = Depends
     return user_service.get_user(db, current_user.email)
 
 
-@router.post('/login', response_model=auth_schema.response_login, summary='로그인', description='로그인에 성공하면 refresh_token과 access_token을 발급합니다.')
+@router.post('/login', response_model=auth_schema.response_login, summary='로그인', description='로그인에 성공하면 refresh_token과 access_token을 발급합니다.',
+             dependencies=[Depends(deps.limit_password_attempts), Depends(deps.limit_login_email)])
 def login(
     email: str = Form(..., description="Email address"),
     password: str = Form(..., description="Password"),
@@ -59,10 +60,11 @@ def refresh(refresh: auth_schema.refresh, db: Session = Depends(deps.get_db)):
     elif result == valid.RefreshValidationResult.INVALID:
         raise HTTPException(status_code=400, detail="Invalid refresh token.")
 
-    return user_service.refresh(user_id, device_id)
+    return user_service.refresh(user_id, device_id, db)
 
 
-@router.delete('/me', response_model=response.CudResponseModel, summary="사용자정보 삭제")
+@router.delete('/me', response_model=response.CudResponseModel, summary="사용자정보 삭제",
+               dependencies=[Depends(deps.limit_password_attempts), Depends(deps.limit_user_email)])
 def delete_user(user: user_schema.UserDelete , current_user=Depends(deps.get_current_user), db: Session = Depends(deps.get_db)):
     login_model = user_schema.Login(email=current_user.email, password=user.password, device_id=current_user.device_id)
     validation_result, account = user_service.validate_login_and_get_user(db, login_model)
@@ -76,7 +78,8 @@ def delete_user(user: user_schema.UserDelete , current_user=Depends(deps.get_cur
     return result
 
 
-@router.put('/me', response_model=response.CudResponseModel, summary='사용자정보 수정')
+@router.put('/me', response_model=response.CudResponseModel, summary='사용자정보 수정',
+            dependencies=[Depends(deps.limit_password_attempts), Depends(deps.limit_user_email)])
 def user_update(user: user_schema.UserUpdate, current_user=Depends(deps.get_current_user), db: Session = Depends(deps.get_db)):
     login_model = user_schema.Login(email=current_user.email, password=user.old_password, device_id=current_user.device_id)
     validation_result, account = user_service.validate_login_and_get_user(db, login_model)
@@ -0,0 +1,138 @@
+import os
+
+# DB 백엔드 선택 : 'sync'(Session + threadpool) | 'async'(AsyncSession + aiosqlite)
+DB_BACKEND = os.getenv('DB_BACKEND', 'sync')
+
+# DB 접속 정보 (async URL 은 지정하지 않으면 DATABASE_URL 의 드라이버만 aiosqlite 로 변경)
+DATABASE_URL = os.getenv('DATABASE_URL', 'sqlite:///./test.db')
+ASYNC_DATABASE_URL = os.getenv('ASYNC_DATABASE_URL', DATABASE_URL.replace('sqlite://', 'sqlite+aiosqlite://', 1))
+
+# 커넥션 풀 (sync / async 엔진 각각 적용, 파일 DB 만 : 메모리 SQLite 는 QueuePool 을 쓰지 않으므로 무시)
+DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', '10'))
+DB_MAX_OVERFLOW = int(os.getenv('DB_MAX_OVERFLOW', '20'))
+DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', '30'))
+
+# SQLite PRAGMA (연결마다 적용)
+#  journal_mode=WAL : 읽기와 쓰기가 서로 막지 않음, synchronous=NORMAL : WAL 에서 안전한 최소 fsync
+#  cache_size 음수는 KiB 단위, busy_timeout 은 ms (잠금 대기 후 'database is locked')
+SQLITE_JOURNAL_MODE = os.getenv('SQLITE_JOURNAL_MODE', 'WAL')
+SQLITE_SYNCHRONOUS = os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL')
+SQLITE_CACHE_SIZE = int(os.getenv('SQLITE_CACHE_SIZE', '-65536'))
+SQLITE_MMAP_SIZE = int(os.getenv('SQLITE_MMAP_SIZE', str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT = int(os.getenv('SQLITE_BUSY_TIMEOUT', '5000'))
+SQLITE_TEMP_STORE = os.getenv('SQLITE_TEMP_STORE', 'MEMORY')
+
+# 인증 principal 캐시 (토큰 -> Access_token_Model), 0 이면 비활성
+#  'memory'(프로세스 내 LRU) | 'shared'(공유 캐시 로컬 대역 - 값 직렬화) | 'none'
+#  사용자 수정/삭제 시 무효화는 그 요청을 처리한 프로세스의 캐시에만 적용되므로, memory 로 worker 가 여러 개면
+#  다른 worker 는 최대 PRINCIPAL_CACHE_TTL 초 동안 삭제된 사용자 / 이전 email 로 인증할 수 있다 (shared 는 모든 worker 에 즉시 반영)
+PRINCIPAL_CACHE_BACKEND = os.getenv('PRINCIPAL_CACHE_BACKEND', 'memory')
+PRINCIPAL_CACHE_SIZE = int(os.getenv('PRINCIPAL_CACHE_SIZE', '10000'))
+PRINCIPAL_CACHE_TTL = float(os.getenv('PRINCIPAL_CACHE_TTL', '60'))
+
+# access_token 검증 방식
+#  'lookup'(기본) : 매 인증마다 users 행 조회 | 'stateless' : 토큰의 email/ver 클레임을 사용자별 버전 맵과 비교 (users 행 조회 없음)
+#  버전 맵은 users.token_version 을 TOKEN_VERSION_TTL 동안 보관 (사용자 수정/삭제 시 즉시 갱신, 다른 worker 는 TTL 후 반영)
+AUTH_TOKEN_MODE = os.getenv('AUTH_TOKEN_MODE', 'lookup')
+TOKEN_VERSION_CACHE_SIZE = int(os.getenv('TOKEN_VERSION_CACHE_SIZE', '100000'))
+TOKEN_VERSION_TTL = float(os.getenv('TOKEN_VERSION_TTL', '30'))
+
+# 암호 해시(bcrypt) 전용 executor 크기 / 대기열 한도 / 초과시 Retry-After(초)
+#  sync 라우터는 해시를 기다리는 동안 threadpool 스레드를 점유하므로 WORKERS + QUEUE_LIMIT 는 threadpool(기본 40)보다 충분히 작게
+PASSWORD_HASH_WORKERS = int(os.getenv('PASSWORD_HASH_WORKERS', str(min(4, os.cpu_count() or 1))))
+PASSWORD_HASH_QUEUE_LIMIT = int(os.getenv('PASSWORD_HASH_QUEUE_LIMIT', '4'))
+PASSWORD_HASH_RETRY_AFTER = int(os.getenv('PASSWORD_HASH_RETRY_AFTER', '1'))
+
+# 암호 해시 정책 : 'bcrypt' | 'scrypt' (calibrate_hasher.py 로 비용 산정)
+PASSWORD_HASH_SCHEME = os.getenv('PASSWORD_HASH_SCHEME', 'bcrypt')
+BCRYPT_ROUNDS = int(os.getenv('BCRYPT_ROUNDS', '12'))
+SCRYPT_LN = int(os.getenv('SCRYPT_LN', '14'))
+SCRYPT_R = int(os.getenv('SCRYPT_R', '8'))
+SCRYPT_P = int(os.getenv('SCRYPT_P', '1'))
+
+# 암호 검증 route(POST /users/login, PUT/DELETE /users/me) 요청 한도 (token bucket, 분당 요청 수), 초과시 429 + Retry-After
+#  RATE_LIMIT_BACKEND : 'memory'(프로세스 내, worker 별로 따로 계산), RATE_LIMIT_STORE_SIZE 개의 key 까지 보관(LRU)
+#  RATE_LIMIT_TRUST_FORWARDED : 프록시 뒤에서 X-Forwarded-For 로 클라이언트 IP 결정
+#   맨 앞 주소는 클라이언트가 임의로 보낼 수 있으므로, 신뢰하는 프록시 RATE_LIMIT_TRUSTED_HOPS 개가 덧붙인 오른쪽부터 센다
+#   (프록시 1단이면 마지막 주소 = 프록시가 본 접속 주소)
+RATE_LIMIT_ENABLED = os.getenv('RATE_LIMIT_ENABLED', 'true').lower() == 'true'
+RATE_LIMIT_BACKEND = os.getenv('RATE_LIMIT_BACKEND', 'memory')
+RATE_LIMIT_STORE_SIZE = int(os.getenv('RATE_LIMIT_STORE_SIZE', '100000'))
+RATE_LIMIT_IP_PER_MINUTE = int(os.getenv('RATE_LIMIT_IP_PER_MINUTE', '120'))
+RATE_LIMIT_EMAIL_PER_MINUTE = int(os.getenv('RATE_LIMIT_EMAIL_PER_MINUTE', '30'))
+RATE_LIMIT_TRUST_FORWARDED = os.getenv('RATE_LIMIT_TRUST_FORWARDED', 'false').lower() == 'true'
+RATE_LIMIT_TRUSTED_HOPS = int(os.getenv('RATE_LIMIT_TRUSTED_HOPS', '1'))
+
+# POST /todos/batch 한 번에 허용하는 작업 수
+TODO_BATCH_MAX_OPERATIONS = int(os.getenv('TODO_BATCH_MAX_OPERATIONS', '500'))
+
+# 일정 내보내기(GET /todos/export) 한 번에 가져와 전송하는 행 수 / 가져오기(POST /todos/import) 한 트랜잭션의 행 수
+#  가져오기는 TODO_IMPORT_CHUNK_ROWS 행마다 commit 하므로 도중에 실패하면 앞선 chunk 는 반영된 상태로 남는다
+TODO_EXPORT_BATCH_SIZE = int(os.getenv('TODO_EXPORT_BATCH_SIZE', '1000'))
+TODO_IMPORT_CHUNK_ROWS = int(os.getenv('TODO_IMPORT_CHUNK_ROWS', '1000'))
+TODO_IMPORT_MAX_ERRORS = int(os.getenv('TODO_IMPORT_MAX_ERRORS', '100'))
+
+# 만료된 refresh token 정리 (lifespan 백그라운드 작업)
+#  한 배치에 TOKEN_PURGE_BATCH_SIZE 행씩 삭제/커밋하여 쓰기 잠금을 짧게 유지
+TOKEN_PURGE_ENABLED = os.getenv('TOKEN_PURGE_ENABLED', 'true').lower() == 'true'
+TOKEN_PURGE_INTERVAL = float(os.getenv('TOKEN_PURGE_INTERVAL', '3600'))
+TOKEN_PURGE_BATCH_SIZE = int(os.getenv('TOKEN_PURGE_BATCH_SIZE', '500'))
+TOKEN_PURGE_BATCH_PAUSE = float(os.getenv('TOKEN_PURGE_BATCH_PAUSE', '0.05'))
+
+# 삭제된 일정 기록(todo_tombstone) 보관기간 (일), 지나면 정리 (lifespan 백그라운드 작업, 배치 방식은 TOKEN_PURGE_* 와 같음)
+#  GET /todos/changes 는 이 기간보다 오래된 커서에 410 (전체 재동기화) 을 반환
+TOMBSTONE_PURGE_ENABLED = os.getenv('TOMBSTONE_PURGE_ENABLED', 'true').lower() == 'true'
+TOMBSTONE_RETENTION_DAYS = float(os.getenv('TOMBSTONE_RETENTION_DAYS', '30'))
+TOMBSTONE_PURGE_INTERVAL = float(os.getenv('TOMBSTONE_PURGE_INTERVAL', '3600'))
+TOMBSTONE_PURGE_BATCH_SIZE = int(os.getenv('TOMBSTONE_PURGE_BATCH_SIZE', '500'))
+TOMBSTONE_PURGE_BATCH_PAUSE = float(os.getenv('TOMBSTONE_PURGE_BATCH_PAUSE', '0.05'))
+
+# 요청 메트릭 수집(MetricsMiddleware) 및 GET /metrics (Prometheus text format)
+METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'true').lower() == 'true'
+
+# 응답 압축 (CompressionMiddleware) : Accept-Encoding 으로 gzip / deflate 협상
+#  본문이 COMPRESSION_MINIMUM_SIZE 바이트 이상일 때만 압축 (스트리밍 응답은 chunk 마다 압축), 레벨 1(빠름) ~ 9(작음)
+COMPRESSION_ENABLED = os.getenv('COMPRESSION_ENABLED', 'true').lower() == 'true'
+COMPRESSION_MINIMUM_SIZE = int(os.getenv('COMPRESSION_MINIMUM_SIZE', '1024'))
+COMPRESSION_LEVEL = int(os.getenv('COMPRESSION_LEVEL', '6'))
+
+# 요청 단위 프로파일 (ProfilingMiddleware, 기본 비활성 - 비활성이면 미들웨어를 추가하지 않음)
+#  PROFILING_HEADER 헤더 값이 PROFILING_TOKEN 과 같은 요청(토큰이 비어 있으면 사용 안 함) 또는 PROFILING_SAMPLE_RATE 비율의 요청
+#  'sampler'(모든 스레드 스택 수집, PROFILING_SAMPLER_INTERVAL 초 간격) | 'cprofile'(이벤트 루프 스레드)
+#  결과는 PROFILING_DIR 에 PROFILING_MAX_FILES(1 이상) 개 파일을 돌려 쓴다
+PROFILING_ENABLED = os.getenv('PROFILING_ENABLED', 'false').lower() == 'true'
+PROFILING_HEADER = os.getenv('PROFILING_HEADER', 'X-Profile')
+PROFILING_TOKEN = os.getenv('PROFILING_TOKEN', '')
+PROFILING_SAMPLE_RATE = float(os.getenv('PROFILING_SAMPLE_RATE', '0'))
+PROFILING_MODE = os.getenv('PROFILING_MODE', 'sampler')
+PROFILING_SAMPLER_INTERVAL = float(os.getenv('PROFILING_SAMPLER_INTERVAL', '0.005'))
+PROFILING_TOP_FUNCTIONS = int(os.getenv('PROFILING_TOP_FUNCTIONS', '50'))
+PROFILING_DIR = os.getenv('PROFILING_DIR', 'profiles')
+PROFILING_MAX_FILES = int(os.getenv('PROFILING_MAX_FILES', '50'))
+
+# 로그 (app.core.logging_setup) : QueueHandler -> QueueListener 스레드에서 stdout 에 JSON 한 줄씩 기록
+#  LOG_LEVELS 는 모듈별 레벨 ('app.db.query_monitor=DEBUG,sqlalchemy.engine=INFO'), DEBUG 레코드는 LOG_DEBUG_SAMPLE_RATE 비율만 기록
+#  LOG_REDACT_KEYS 를 이름에 포함한 값(password=..., 'refresh_token': ...)은 *** 로 가림
+#  외부 로그 설정(uvicorn --log-config 등)을 쓰려면 LOGGING_ENABLED=false
+LOGGING_ENABLED = os.getenv('LOGGING_ENABLED', 'true').lower() == 'true'
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_LEVELS = os.getenv('LOG_LEVELS', '')
+LOG_DEBUG_SAMPLE_RATE = float(os.getenv('LOG_DEBUG_SAMPLE_RATE', '1.0'))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))
+LOG_REDACT_KEYS = os.getenv('LOG_REDACT_KEYS', 'password,secret,authorization,access_token,refresh_token')
+
+# 느린 SQL 로그 (app.db.query_monitor 로거) : 임계값 초과 문을 파라미터/route/EXPLAIN QUERY PLAN 과 함께 기록
+SLOW_QUERY_LOG_ENABLED = os.getenv('SLOW_QUERY_LOG_ENABLED', 'false').lower() == 'true'
+SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', '100'))
+# N+1 감지 : 한 request 에서 같은 형태의 SQL 이 QUERY_REPEAT_LIMIT 회를 넘으면 'warn'(로그) | 'raise'(테스트), 0 이면 비활성
+#  request context 는 RequestContextMiddleware 가 항상 만들므로 METRICS_ENABLED=false 에서도 동작
+QUERY_REPEAT_LIMIT = int(os.getenv('QUERY_REPEAT_LIMIT', '0'))
+QUERY_REPEAT_ACTION = os.getenv('QUERY_REPEAT_ACTION', 'warn')
+
+# 일정 조회 캐시 (사용자별 목록 페이지 / 단건 / ETag 버전), 쓰기 시 해당 사용자 항목 무효화
+#  'memory'(프로세스 내 LRU) | 'shared'(공유 캐시 로컬 대역 - 값 직렬화) | 'none'
+#  memory 는 프로세스마다 따로 무효화되므로 worker 가 여러 개면 TTL 동안 오래된 값이 보일 수 있다
+TODO_CACHE_BACKEND = os.getenv('TODO_CACHE_BACKEND', 'memory')
+TODO_CACHE_SIZE = int(os.getenv('TODO_CACHE_SIZE', '10000'))
+TODO_CACHE_USER_ENTRIES = int(os.getenv('TODO_CACHE_USER_ENTRIES', '64'))
+TODO_CACHE_TTL = float(os.getenv('TODO_CACHE_TTL', '30'))
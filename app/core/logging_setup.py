@@ -0,0 +1,126 @@
+import logging
+import queue
+import random
+import re
+import sys
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener
+import orjson
+from app.core import config, metrics, request_context
+
+# 비동기 JSON 로그 : 요청 스레드는 레코드를 정리(메시지 조립 / 비밀값 가림 / request ID)해 큐에 넣기만 하고
+#  stdout 쓰기는 QueueListener 스레드가 담당한다. 큐가 가득 차면 요청을 막지 않고 버린다 (log_records_dropped_total)
+#  모듈별 레벨 : LOG_LEVELS='app.db.query_monitor=DEBUG,sqlalchemy.engine=INFO'
+#  DEBUG 레코드는 LOG_DEBUG_SAMPLE_RATE 비율만 기록 (레벨로 걸러진 호출은 레코드도 만들지 않음)
+DROPPED_RECORDS = metrics.Counter('log_records_dropped_total', '로그 큐가 가득 차 버린 레코드 수')
+
+REDACTED = '***'
+_SECRET_KEY = '|'.join(re.escape(key.strip()) for key in config.LOG_REDACT_KEYS.split(',') if key.strip())
+# key=value / key: value / 'key': 'value' 형태 (pydantic repr, dict repr, 헤더 포함)
+_SECRET_PATTERN = re.compile(
+    rf'''(?i)(\b\w*(?:{_SECRET_KEY})\w*['"]?\s*[:=]\s*)('[^']*'|"[^"]*"|(?:bearer\s+)?[^\s,;'"}}\)]+)''')
+_SECRET_NAME = re.compile(rf'(?i)({_SECRET_KEY})')
+
+# LogRecord 기본 속성 - 나머지(extra=...)는 JSON 필드로 출력
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'request_id'}
+
+def _mask(match) -> str:
+    # 따옴표로 감싼 값은 따옴표 유지
+    quote = match.group(2)[0] if match.group(2)[0] in '\'"' else ''
+    return f'{match.group(1)}{quote}{REDACTED}{quote}'
+
+def redact(value):
+    if isinstance(value, str):
+        return _SECRET_PATTERN.sub(_mask, value)
+    if isinstance(value, dict):
+        return {key: REDACTED if isinstance(key, str) and _SECRET_NAME.search(key) else redact(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [redact(item) for item in value]
+    return value
+
+def parse_levels(text: str) -> dict:
+    levels = {}
+    for item in text.split(','):
+        name, _, level = item.partition('=')
+        if name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', None),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry['exc'] = record.exc_text
+        return orjson.dumps(entry, default=str).decode('utf-8')
+
+
+class DebugSampler(logging.Filter):
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno > logging.DEBUG or self.rate >= 1 or random.random() < self.rate
+
+
+class RequestQueueHandler(QueueHandler):
+    # 요청 스레드에서 실행 : contextvar(request ID) 는 여기서만 읽을 수 있다
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        prepared = logging.makeLogRecord(vars(record))
+        prepared.msg = redact(record.getMessage())
+        prepared.args = None
+        prepared.request_id = request_context.request_id()
+        if record.exc_info:
+            prepared.exc_text = redact(logging.Formatter().formatException(record.exc_info))
+        prepared.exc_info = None
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                setattr(prepared, key, REDACTED if _SECRET_NAME.search(key) else redact(value))
+        return prepared
+
+    def enqueue(self, record: logging.LogRecord):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            DROPPED_RECORDS.inc()
+
+
+_handler = None
+_listener = None
+
+def configure(stream=None):
+    # lifespan 시작 시 한 번 (이미 설정되어 있으면 무시)
+    global _handler, _listener
+    if _listener is not None:
+        return
+    records = queue.Queue(config.LOG_QUEUE_SIZE)
+    _handler = RequestQueueHandler(records)
+    _handler.addFilter(DebugSampler(config.LOG_DEBUG_SAMPLE_RATE))
+    output = logging.StreamHandler(stream or sys.stdout)
+    output.setFormatter(JsonFormatter())
+    root = logging.getLogger()
+    root.setLevel(config.LOG_LEVEL.upper())
+    root.addHandler(_handler)
+    for name, level in parse_levels(config.LOG_LEVELS).items():
+        logging.getLogger(name).setLevel(level)
+    _listener = QueueListener(records, output)
+    _listener.start()
+
+def shutdown():
+    # 큐에 남은 레코드를 모두 쓴 뒤 listener 스레드 종료
+    global _handler, _listener
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_handler)
+    _listener.stop()
+    _handler, _listener = None, None
@@ -0,0 +1,165 @@
+import bisect
+import math
+import threading
+
+# Prometheus text format(0.0.4) 메트릭 - 외부 의존성 없이 Counter / Gauge / Histogram 만 구현
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+def _escape(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+def _number(value) -> str:
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    return repr(float(value))
+
+def _labels(pairs) -> str:
+    if not pairs:
+        return ''
+    return '{' + ','.join(f'{name}="{_escape(value)}"' for name, value in pairs) + '}'
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+
+    def render(self) -> str:
+        with self._lock:
+            metrics = list(self._metrics)
+        return ''.join(metric.render() for metric in metrics)
+
+REGISTRY = Registry()
+
+
+class _Metric:
+    type = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), registry: Registry = REGISTRY):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        if registry is not None:
+            registry.register(self)
+
+    def _key(self, labels: dict) -> tuple:
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f'{self.name}: labels {sorted(labels)} != {sorted(self.labelnames)}')
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def _samples(self):
+        # (suffix, label pairs, value)
+        with self._lock:
+            return [('', list(zip(self.labelnames, key)), value) for key, value in self._values.items()]
+
+    def render(self) -> str:
+        lines = [f'# HELP {self.name} {_escape(self.documentation)}', f'# TYPE {self.name} {self.type}']
+        lines += [f'{self.name}{suffix}{_labels(pairs)} {_number(value)}' for suffix, pairs, value in self._samples()]
+        return '\n'.join(lines) + '\n'
+
+
+class Counter(_Metric):
+    type = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    type = 'gauge'
+
+    def inc(self, amount: float = 1, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels):
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    type = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS, registry: Registry = REGISTRY):
+        super().__init__(name, documentation, labelnames, registry)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, **labels):
+        key = self._key(labels)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                state = self._values[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            state[0][index] += 1
+            state[1] += value
+            state[2] += 1
+
+    def count(self, **labels) -> int:
+        state = self._values.get(self._key(labels))
+        return state[2] if state else 0
+
+    def _samples(self):
+        samples = []
+        with self._lock:
+            items = [(key, [list(state[0]), state[1], state[2]]) for key, state in self._values.items()]
+        for key, (counts, total, count) in items:
+            pairs = list(zip(self.labelnames, key))
+            cumulative = 0
+            for bound, bucket_count in zip(self.buckets + (math.inf,), counts):
+                cumulative += bucket_count
+                samples.append(('_bucket', pairs + [('le', _number(bound))], cumulative))
+            samples.append(('_sum', pairs, total))
+            samples.append(('_count', pairs, count))
+        return samples
+
+# 다른 모듈의 stats() dict 를 그대로 내보낼 때 사용 (숫자 값만, counters 에 지정한 키는 counter)
+def render_stats(prefix: str, stats: dict, documentation: str, counters=()) -> str:
+    lines = []
+    for key, value in stats.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        kind = 'counter' if key in counters else 'gauge'
+        name = f'{prefix}_{key}_total' if kind == 'counter' else f'{prefix}_{key}'
+        lines += [f'# HELP {name} {_escape(documentation)} ({key})', f'# TYPE {name} {kind}', f'{name} {_number(value)}']
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+# --- app 메트릭 ---
+HTTP_REQUESTS = Counter('http_requests_total', 'HTTP 요청 수', ['method', 'route', 'status'])
+HTTP_REQUEST_SECONDS = Histogram('http_request_duration_seconds', 'HTTP 요청 처리시간 (응답 본문 전송 포함)', ['method', 'route'])
+HTTP_IN_PROGRESS = Gauge('http_requests_in_progress', '처리 중인 HTTP 요청 수', ['method'])
+
+# request 안에서의 시간 분해 : auth(토큰 검증 + 사용자 조회) / password_hash(bcrypt 대기 포함) / db(SQL 실행 합계)
+#  auth 구간의 사용자 조회 SQL 은 db 에도 합산되므로 구간끼리 겹칠 수 있다
+REQUEST_PHASE_SECONDS = Histogram('http_request_phase_seconds', 'request 당 구간별 소요시간', ['route', 'phase'])
+REQUEST_DB_STATEMENTS = Histogram('http_request_db_statements', 'request 당 SQL 문 수', ['route'],
+                                  buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100))
+
+DB_QUERY_SECONDS = Histogram('db_query_duration_seconds', 'SQL 문 실행시간 (cursor.execute)')
+DB_COMPILE_CACHE = Counter('db_compiled_cache_total', 'SQL 문 컴파일 캐시 조회 결과 (hit | miss | disabled | no_key | unsupported)', ['result'])
+PASSWORD_HASH_SECONDS = Histogram('password_hash_duration_seconds', '암호 해시 계산시간 (executor 내부, 대기 제외)', ['operation'],
+                                  buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
@@ -0,0 +1,29 @@
+import time
+from app.core import config
+from app.utils.cache import build_cache
+
+# 검증된 access_token -> Access_token_Model
+# 항목 만료시간은 min(PRINCIPAL_CACHE_TTL, 토큰 exp) 이므로 토큰보다 오래 살지 않는다
+# 사용자별 무효화(tag = user_id)는 캐시 백엔드를 거치므로 shared 이면 모든 worker 에 반영된다
+cache = build_cache(config.PRINCIPAL_CACHE_BACKEND, config.PRINCIPAL_CACHE_SIZE, config.PRINCIPAL_CACHE_TTL)
+
+
+def get(token: str):
+    return cache.get(token) if cache is not None else None
+
+def generation(user_id) -> int:
+    return cache.generation(str(user_id)) if cache is not None else 0
+
+def put(token: str, principal, exp, generation: int):
+    if cache is None:
+        return
+    ttl = None
+    if exp is not None:
+        ttl = float(exp) - time.time()
+    cache.set(token, principal, ttl=ttl, tag=str(principal.id), generation=generation)
+
+def invalidate_user(user_id) -> int:
+    return cache.invalidate_tag(str(user_id)) if cache is not None else 0
+
+def stats() -> dict:
+    return cache.stats() if cache is not None else {}
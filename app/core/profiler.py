@@ -0,0 +1,125 @@
+import cProfile
+import io
+import os
+import pstats
+import sys
+import threading
+from app.core import config
+
+# 요청 단위 프로파일 (ProfilingMiddleware) - 결과는 PROFILING_DIR 에 PROFILING_MAX_FILES 개 파일을 돌려 쓰며 저장
+#  cprofile : 이벤트 루프 스레드만 측정 (sync 라우터 / threadpool 에서 실행되는 코드는 보이지 않음)
+#  sampler  : 모든 스레드의 스택을 주기적으로 수집하여 app 코드가 포함된 스택만 folded 형식(flamegraph 입력)으로 기록
+#             같은 시간에 처리 중인 다른 요청의 스택도 섞일 수 있다
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 한 번에 하나의 요청만 프로파일 (profiler 가 겹치지 않도록, 바쁘면 건너뜀)
+_busy = threading.Lock()
+
+def try_acquire() -> bool:
+    return _busy.acquire(blocking=False)
+
+def release():
+    _busy.release()
+
+
+class CProfileCollector:
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self):
+        self._profile.enable()
+
+    def stop(self):
+        self._profile.disable()
+
+    def render(self) -> str:
+        buffer = io.StringIO()
+        pstats.Stats(self._profile, stream=buffer).sort_stats('cumulative').print_stats(config.PROFILING_TOP_FUNCTIONS)
+        return buffer.getvalue()
+
+
+class StackSampler:
+    def __init__(self, interval: float | None = None):
+        self.interval = config.PROFILING_SAMPLER_INTERVAL if interval is None else interval
+        self.samples = 0
+        self.stacks = {}
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='profiling-sampler', daemon=True)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        own = threading.get_ident()
+        while not self._stop.wait(self.interval):
+            self.samples += 1
+            for ident, frame in sys._current_frames().items():
+                if ident != own:
+                    self._record(frame)
+
+    def _record(self, frame):
+        names = []
+        in_app = False
+        while frame is not None:
+            code = frame.f_code
+            in_app = in_app or code.co_filename.startswith(APP_DIR)
+            names.append(f'{os.path.basename(code.co_filename)}:{code.co_name}')
+            frame = frame.f_back
+        # 대기 중인 worker / 이벤트 루프 select 등 app 코드가 없는 스택은 제외
+        if in_app:
+            stack = ';'.join(reversed(names))
+            self.stacks[stack] = self.stacks.get(stack, 0) + 1
+
+    def render(self) -> str:
+        lines = [f'# samples: {self.samples} (interval {self.interval * 1000:g}ms)']
+        lines.extend(f'{stack} {count}' for stack, count in sorted(self.stacks.items(), key=lambda item: -item[1]))
+        return '\n'.join(lines) + '\n'
+
+def collector(mode: str | None = None):
+    return StackSampler() if (mode or config.PROFILING_MODE) == 'sampler' else CProfileCollector()
+
+
+class ProfileRing:
+    # profile-000.txt ~ profile-{max_files - 1}.txt 를 순서대로 덮어씀 (재시작 시 가장 최근 파일 다음부터)
+    def __init__(self, directory: str, max_files: int):
+        if max_files < 1:
+            raise ValueError(f'PROFILING_MAX_FILES must be at least 1: {max_files}')
+        self.directory = directory
+        self.max_files = max_files
+        self._next = None
+        self._lock = threading.Lock()
+
+    def path(self, slot: int) -> str:
+        return os.path.join(self.directory, f'profile-{slot:03d}.txt')
+
+    def reserve(self) -> str:
+        with self._lock:
+            if self._next is None:
+                os.makedirs(self.directory, exist_ok=True)
+                self._next = self._after_latest()
+            slot = self._next
+            self._next = (slot + 1) % self.max_files
+            return self.path(slot)
+
+    def _after_latest(self) -> int:
+        latest, latest_mtime = -1, None
+        for slot in range(self.max_files):
+            try:
+                mtime = os.stat(self.path(slot)).st_mtime
+            except FileNotFoundError:
+                continue
+            if latest_mtime is None or mtime > latest_mtime:
+                latest, latest_mtime = slot, mtime
+        return (latest + 1) % self.max_files
+
+    @staticmethod
+    def write(path: str, annotations: dict, body: str):
+        header = ''.join(f'# {name}: {value}\n' for name, value in annotations.items())
+        with open(path, 'w', encoding='utf-8') as file:
+            file.write(header + '\n' + body)
+
+ring = ProfileRing(config.PROFILING_DIR, config.PROFILING_MAX_FILES)
@@ -0,0 +1,39 @@
+import math
+from app.core import config, metrics
+from app.utils.rate_limit import MemoryRateLimitStore
+
+# 암호 검증 route(로그인, 사용자 수정/삭제) 요청 한도 : IP / email 별 token bucket (분당 한도만큼 채워지고 소모)
+RATE_LIMITED = metrics.Counter('rate_limited_total', '요청 한도를 넘어 거부한 요청 수', ['scope'])
+
+
+class RateLimited(Exception):
+    # 요청 한도 초과 -> 429
+    def __init__(self, retry_after: int):
+        super().__init__('rate limit exceeded')
+        self.retry_after = retry_after
+
+
+def build_store(backend: str):
+    if backend == 'memory':
+        return MemoryRateLimitStore(maxsize=config.RATE_LIMIT_STORE_SIZE)
+    raise ValueError(f'unknown RATE_LIMIT_BACKEND: {backend}')
+
+store = build_store(config.RATE_LIMIT_BACKEND)
+
+
+def check(scope: str, key: str, per_minute: int):
+    if not config.RATE_LIMIT_ENABLED or per_minute <= 0:
+        return
+    retry_after = store.hit(f'{scope}:{key}', per_minute, per_minute / 60.0)
+    if retry_after > 0:
+        RATE_LIMITED.inc(scope=scope)
+        raise RateLimited(max(1, math.ceil(retry_after)))
+
+def check_ip(ip: str):
+    check('ip', ip, config.RATE_LIMIT_IP_PER_MINUTE)
+
+def check_email(email: str):
+    check('email', email.strip().lower(), config.RATE_LIMIT_EMAIL_PER_MINUTE)
+
+def stats() -> dict:
+    return store.stats()
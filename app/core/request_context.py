@@ -0,0 +1,66 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# request 단위 계측 정보 (RequestContextMiddleware 가 생성)
+#  threadpool / AsyncSession greenlet 으로도 contextvar 가 복사되므로 같은 객체를 갱신한다
+class RequestContext:
+    __slots__ = ('scope', 'db_statements', 'db_seconds', 'phases', 'statement_shapes')
+
+    def __init__(self, scope=None):
+        self.scope = scope
+        self.db_statements = 0
+        self.db_seconds = 0.0
+        self.phases = {}
+        self.statement_shapes = {}
+
+    @property
+    def route(self) -> str:
+        return route_template(self.scope)
+
+UNMATCHED_ROUTE = '<unmatched>'
+
+# 경로 템플릿(/todos/{id}) - 라우팅 후 FastAPI 가 scope['route'] 에 기록
+def route_template(scope) -> str:
+    return getattr((scope or {}).get('route'), 'path', None) or UNMATCHED_ROUTE
+
+_current: ContextVar = ContextVar('request_context', default=None)
+# 로그 상관관계용 request ID (RequestIdMiddleware 가 설정, METRICS_ENABLED 와 무관)
+_request_id: ContextVar = ContextVar('request_id', default=None)
+
+def begin(scope=None):
+    context = RequestContext(scope)
+    return context, _current.set(context)
+
+def end(token):
+    _current.reset(token)
+
+def current():
+    return _current.get()
+
+def set_request_id(value: str):
+    return _request_id.set(value)
+
+def reset_request_id(token):
+    _request_id.reset(token)
+
+def request_id():
+    return _request_id.get()
+
+def record_db(elapsed: float):
+    context = _current.get()
+    if context is not None:
+        context.db_statements += 1
+        context.db_seconds += elapsed
+
+@contextmanager
+def phase(name: str):
+    context = _current.get()
+    if context is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        context.phases[name] = context.phases.get(name, 0.0) + time.perf_counter() - start
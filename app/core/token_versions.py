@@ -0,0 +1,33 @@
+from app.core import config
+from app.utils.cache import TTLCache
+
+# stateless 인증용 사용자별 access_token 버전 맵 : user_id -> users.token_version
+# 삭제된 사용자는 DELETED 로 기록하여 TTL 동안 DB 를 다시 조회하지 않고 거부한다
+cache = TTLCache(maxsize=config.TOKEN_VERSION_CACHE_SIZE, ttl=config.TOKEN_VERSION_TTL)
+
+DELETED = -1
+
+
+def get(user_id):
+    return cache.get(str(user_id))
+
+def generation(user_id) -> int:
+    return cache.generation(str(user_id))
+
+def put(user_id, version, generation: int):
+    # DB 에서 읽은 값 저장 (조회 도중 bump/revoke 가 있었다면 버림)
+    key = str(user_id)
+    version = DELETED if version is None else version
+    cache.set(key, version, tag=key, generation=generation)
+    return version
+
+def bump(user_id, version: int):
+    key = str(user_id)
+    cache.invalidate_tag(key)
+    cache.set(key, version, tag=key)
+
+def revoke(user_id):
+    bump(user_id, DELETED)
+
+def stats() -> dict:
+    return cache.stats()
@@ -0,0 +1,14 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import auth as auth_crud
+from app.schemas import auth as auth_schema
+from datetime import datetime
+
+
+async def store_refresh_token(db: AsyncSession, user_id: int, device_id: str, refresh_token_info: auth_schema.refresh_token_info):
+    return await db.run_sync(auth_crud.store_refresh_token, user_id, device_id, refresh_token_info)
+
+async def get_refresh_token(id: str, device_id: str, db: AsyncSession):
+    return await db.run_sync(lambda session: auth_crud.get_refresh_token(id, device_id, session))
+
+async def purge_expired_tokens(db: AsyncSession, now: datetime, batch_size: int) -> int:
+    return await db.run_sync(auth_crud.purge_expired_tokens, now, batch_size)
@@ -0,0 +1,61 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import todo as td_crud
+from app.schemas import todo as td_scheme
+from datetime import datetime
+from typing import Optional, List
+
+
+async def create_todo(db: AsyncSession, user_id: int, todo_data: td_scheme.TodoCreate):
+    return await db.run_sync(td_crud.create_todo, user_id, todo_data)
+
+async def get_todos(db: AsyncSession, user_id: int, limit: Optional[int] = None, after_id: Optional[int] = None):
+    return await db.run_sync(td_crud.get_todos, user_id, limit, after_id)
+
+async def iter_todos(db: AsyncSession, user_id: int, title: Optional[str] = None, date: Optional[datetime] = None, batch_size: int = 500, q: Optional[str] = None):
+    fts = bool(q) and await db.run_sync(td_crud.fts_available)
+    stmt = td_crud.todos_statement(user_id, title, date, q=q, fts=fts).execution_options(yield_per=batch_size)
+    result = await db.stream_scalars(stmt)
+    async for todo in result:
+        yield todo
+
+async def iter_todo_batches(db: AsyncSession, user_id: int, batch_size: int = 1000):
+    stmt = td_crud.todos_statement(user_id, columns=td_crud.TODO_COLUMNS).execution_options(yield_per=batch_size)
+    result = await db.stream(stmt)
+    async for rows in result.partitions():
+        yield rows
+
+async def insert_todos(db: AsyncSession, user_id: int, rows: List[dict]):
+    return await db.run_sync(td_crud.insert_todos, user_id, rows)
+
+async def get_changes(db: AsyncSession, user_id: int, since: Optional[int], limit: int, full: bool = False):
+    return await db.run_sync(td_crud.get_changes, user_id, since, limit, full)
+
+async def purge_tombstones(db: AsyncSession, before: datetime, batch_size: int) -> int:
+    return await db.run_sync(td_crud.purge_tombstones, before, batch_size)
+
+async def get_todos_version(db: AsyncSession, user_id: int):
+    return await db.run_sync(td_crud.get_todos_version, user_id)
+
+async def get_todo_by_id(db: AsyncSession, todo_id: int, user_id: int):
+    return await db.run_sync(td_crud.get_todo_by_id, todo_id, user_id)
+
+async def get_todo_row(db: AsyncSession, todo_id: int, user_id: int):
+    return await db.run_sync(td_crud.get_todo_row, todo_id, user_id)
+
+async def update_todo(db: AsyncSession, todo_id: int, user_id: int, update_data: td_scheme.TodoUpdate):
+    return await db.run_sync(td_crud.update_todo, todo_id, user_id, update_data)
+
+async def delete_todo(db: AsyncSession, todo_id: int, user_id: int):
+    return await db.run_sync(td_crud.delete_todo, todo_id, user_id)
+
+async def search_todos(db: AsyncSession, user_id: int, title: Optional[str], date: Optional[datetime], limit: Optional[int] = None, after_id: Optional[int] = None):
+    return await db.run_sync(td_crud.search_todos, user_id, title, date, limit, after_id)
+
+async def full_text_search(db: AsyncSession, user_id: int, q: str, date: Optional[datetime] = None, limit: Optional[int] = None, after: Optional[dict] = None, title: Optional[str] = None):
+    return await db.run_sync(td_crud.full_text_search, user_id, q, date, limit, after, title)
+
+async def get_todos_in_range(db: AsyncSession, user_id: int, date_from: datetime, date_to: datetime, limit: Optional[int] = None, after: Optional[tuple] = None):
+    return await db.run_sync(td_crud.get_todos_in_range, user_id, date_from, date_to, limit, after)
+
+async def apply_batch(db: AsyncSession, user_id: int, operations: List[td_scheme.TodoBatchOperation]):
+    return await db.run_sync(td_crud.apply_batch, user_id, operations)
@@ -0,0 +1,29 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.crud import user as user_crud
+from app.schemas import user as user_schema
+
+# AsyncSession.run_sync 로 동기 CRUD를 greenlet 위에서 실행 (DB I/O는 aiosqlite가 처리)
+
+async def create_user(db: AsyncSession, user: user_schema.UserCreate):
+    return await db.run_sync(user_crud.create_user, user)
+
+async def get_user(db: AsyncSession, user_email: str):
+    return await db.run_sync(user_crud.get_user, user_email)
+
+async def get_user_by_id(db: AsyncSession, id: str):
+    return await db.run_sync(user_crud.get_user_by_id, id)
+
+async def get_token_version(db: AsyncSession, id: str):
+    return await db.run_sync(user_crud.get_token_version, id)
+
+async def get_all_user(db: AsyncSession):
+    return await db.run_sync(user_crud.get_all_user)
+
+async def delete_user(id: int, db: AsyncSession):
+    return await db.run_sync(lambda session: user_crud.delete_user(id, session))
+
+async def user_update(user_update: user_schema.UserUpdate, user, db: AsyncSession):
+    return await db.run_sync(lambda session: user_crud.user_update(user_update, user, session))
+
+async def update_password(db: AsyncSession, user, hashed_password: str):
+    return await db.run_sync(user_crud.update_password, user, hashed_password)
@@ -1,31 +1,39 @@
 from sqlalchemy.orm import Session
+from sqlalchemy import select, delete, bindparam
+from datetime import datetime
+from sqlalchemy.dialects.sqlite import insert
 from app.db.models import User_Token as user_token_model
 from app.schemas import user as user_schema
 from app.schemas import auth as auth_schema
+from app.utils import jwt_handler as jwt
 
+# 토큰 갱신마다 실행하는 조회문 (crud.user 의 USER_BY_ID 와 같이 한 번 만들어 재사용)
+REFRESH_TOKEN_BY_DEVICE = (select(user_token_model)
+                           .where(user_token_model.user_id == bindparam('user_id'), user_token_model.device_id == bindparam('device_id'))
+                           .limit(1))
 
 def store_refresh_token(db: Session, user_id: int,device_id:str, refresh_token_info:auth_schema.refresh_token_info):
-    token_entry = user_token_model(user_id =user_id,
-                                    refresh_token=refresh_token_info.refresh_token,
-                                    device_id=device_id,
-                                    expired_at=refresh_token_info.expired_at)
-    exists = (
-        db.query(user_token_model)
-        .filter(user_token_model.user_id == token_entry.user_id,user_token_model.device_id == token_entry.device_id)
-        .first()
+    # uq_user_device (user_id, device_id, login_type) 기준 INSERT ... ON CONFLICT DO UPDATE 한 문장으로 저장
+    token_hash = jwt.hash_token(refresh_token_info.refresh_token)
+    stmt = insert(user_token_model).values(user_id=user_id,
+                                           device_id=device_id,
+                                           login_type='local',
+                                           refresh_token_hash=token_hash,
+                                           expired_at=refresh_token_info.expired_at)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[user_token_model.user_id, user_token_model.device_id, user_token_model.login_type],
+        set_={'refresh_token_hash': stmt.excluded.refresh_token_hash, 'expired_at': stmt.excluded.expired_at},
     )
-    if exists:
-        exists.refresh_token = refresh_token_info.refresh_token
-        exists.expired_at = refresh_token_info.expired_at
-        db.commit()
-        db.refresh(exists)
-    else :
-        db.add(token_entry)
-        db.commit()
-        db.refresh(token_entry)
-    return token_entry
+    db.execute(stmt)
+    db.commit()
+    return token_hash
 
 def get_refresh_token(id :str,device_id:str,db:Session):
-    user_token = db.query(user_token_model).filter(user_token_model.user_id == id,user_token_model.device_id ==device_id).first()
-    return user_token
-        
\ No newline at end of file
+    return db.scalars(REFRESH_TOKEN_BY_DEVICE, {'user_id': id, 'device_id': device_id}).first()
+
+def purge_expired_tokens(db: Session, now: datetime, batch_size: int) -> int:
+    # ix_users_token_expired_at 로 만료 행을 batch_size 개만 골라 삭제
+    expired_ids = select(user_token_model.id).where(user_token_model.expired_at < now).limit(batch_size)
+    result = db.execute(delete(user_token_model).where(user_token_model.id.in_(expired_ids)), execution_options={'synchronize_session': False})
+    db.commit()
+    return result.rowcount
@@ -1,9 +1,37 @@
 from sqlalchemy.orm import Session
-from app.db.models import Todo
+from app.db.models import Todo, Todo_Tombstone
 from app.schemas import todo as td_scheme
-from datetime import datetime
-from sqlalchemy import func
+from app.schemas.enum import BatchOperation
+from datetime import datetime, time, timedelta
+from sqlalchemy import func, select, insert, update, delete, or_, and_, text, table, column, literal_column, literal, null, tuple_, bindparam, Integer, Float
 from typing import List, Optional
+import re
+
+# FTS5 가상 테이블 (models.TODO_FTS_DDL 로 생성)
+todo_fts = table('todo_fts', column('rowid', Integer), column('rank', Float))
+_fts_available = False
+
+# 목록/검색 응답용 컬럼 - ORM 객체 대신 Row 튜플로 조회 (api.responses 에서 그대로 JSON 변환)
+TODO_COLUMNS = tuple(getattr(Todo, field) for field in td_scheme.TODO_RESPONSE_FIELDS)
+
+# 조건이 고정된 핫패스 조회문은 한 번 만들어 재사용 (crud.user 참고)
+#  목록 첫 페이지는 after_id=0, 전체 조회는 limit=-1 (SQLite 에서 제한 없음) 로 같은 문을 사용
+_TODO_OWNER = (Todo.id == bindparam('todo_id'), Todo.user_id == bindparam('user_id'))
+TODO_BY_ID = select(Todo).where(*_TODO_OWNER).limit(1)
+TODO_ROW_BY_ID = select(*TODO_COLUMNS).where(*_TODO_OWNER)
+TODOS_PAGE = (select(*TODO_COLUMNS)
+              .where(Todo.user_id == bindparam('user_id'), Todo.id > bindparam('after_id'))
+              .order_by(Todo.id)
+              .limit(bindparam('limit', type_=Integer)))
+# 목록 버전 : 생성/수정은 새 seq 를 발급하고(max(seq) 증가), 삭제는 tombstone seq 를 남기므로 쓰기마다 반드시 바뀐다
+#  (max(id) 는 마지막 일정을 삭제하면 줄어들고 updated_at 은 가져오기 값이 미래일 수 있어 버전으로 쓰지 않음)
+TODOS_VERSION = (select(func.max(Todo.seq), func.count(),
+                        select(func.max(Todo_Tombstone.seq)).where(Todo_Tombstone.user_id == bindparam('user_id')).scalar_subquery())
+                 .where(Todo.user_id == bindparam('user_id')))
+
+# 마지막으로 발급한 변경 순번 / 정리된 삭제 기록의 최대 seq (models.TODO_SEQ_DDL)
+CHANGE_SEQ = text('SELECT value FROM todo_change_seq')
+TOMBSTONES_PURGED = text('SELECT purged FROM todo_change_seq')
 
 def create_todo(db: Session, user_id: int, todo_data: td_scheme.TodoCreate):
     todo = Todo(
@@ -18,11 +46,86 @@ def create_todo(db: Session, user_id: int, todo_data: td_scheme.TodoCreate):
     db.refresh(todo)
     return todo
 
-def get_todos(db: Session, user_id: int):
-    return db.query(Todo).filter(Todo.user_id == user_id).all()
+def todos_statement(user_id: int, title: Optional[str] = None, date: Optional[datetime] = None, after_id: Optional[int] = None, limit: Optional[int] = None, q: Optional[str] = None, fts: bool = False, columns: Optional[tuple] = None):
+    # keyset(id) 페이지네이션 : user_id 인덱스가 rowid 순서를 가지므로 ORDER BY id 는 추가 정렬이 없음
+    stmt = select(*columns) if columns else select(Todo)
+    stmt = stmt.where(Todo.user_id == user_id)
+    if title and title.strip() != '':
+        stmt = stmt.where(Todo.title.ilike(f'%{title}%'))
+    if date :
+        stmt = stmt.where(date_filter(date))
+    if q and q.strip() != '':
+        match = fts_match(user_id, q) if fts else None
+        if match is not None:
+            stmt = stmt.where(Todo.id.in_(select(todo_fts.c.rowid).where(literal_column('todo_fts').op('MATCH')(match))))
+        else:
+            stmt = stmt.where(or_(Todo.title.ilike(f'%{q}%'), Todo.description.ilike(f'%{q}%')))
+    if after_id is not None:
+        stmt = stmt.where(Todo.id > after_id)
+    stmt = stmt.order_by(Todo.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return stmt
+
+def get_todos(db: Session, user_id: int, limit: Optional[int] = None, after_id: Optional[int] = None):
+    params = {'user_id': user_id, 'after_id': after_id or 0, 'limit': -1 if limit is None else limit}
+    return db.execute(TODOS_PAGE, params).all()
+
+def iter_todos(db: Session, user_id: int, title: Optional[str] = None, date: Optional[datetime] = None, batch_size: int = 500, q: Optional[str] = None):
+    # 서버측 커서에서 batch_size 건씩 가져오며 전체 목록을 메모리에 올리지 않음
+    stmt = todos_statement(user_id, title, date, q=q, fts=bool(q) and fts_available(db)).execution_options(yield_per=batch_size)
+    for todo in db.scalars(stmt):
+        yield todo
+
+def iter_todo_batches(db: Session, user_id: int, batch_size: int = 1000):
+    # 내보내기용 : 응답 컬럼 Row 를 서버측 커서에서 batch_size 건씩 묶어 반환 (id 순)
+    stmt = todos_statement(user_id, columns=TODO_COLUMNS).execution_options(yield_per=batch_size)
+    yield from db.execute(stmt).partitions()
+
+def insert_todos(db: Session, user_id: int, rows: List[dict]) -> int:
+    # 가져오기용 : 한 번의 executemany INSERT + commit (rows 는 같은 키를 가진 dict)
+    now = datetime.utcnow()
+    db.execute(insert(Todo), [{**row, 'user_id': user_id, 'created_at': row['created_at'] or now} for row in rows])
+    db.commit()
+    return len(rows)
+
+def get_changes(db: Session, user_id: int, since: Optional[int], limit: int, full: bool = False) -> Optional[tuple]:
+    # seq 가 since 보다 큰 (변경된 일정 Row, 삭제 기록 Row) 를 각각 seq 순으로 limit + 1 건 + 조회 직전의 전체 변경 순번
+    # ix_todo_user_seq / ix_todo_tombstone_user_seq 범위 검색이므로 변경 건수에만 비례, since 가 없으면 전체 목록(삭제 기록 제외)
+    # since 이후의 삭제 기록이 이미 정리되었으면 None (전체 재동기화 필요, 전체 목록을 이어 받는 중(full)이면 확인하지 않음)
+    current = db.execute(CHANGE_SEQ).scalar()
+    changed = db.execute(select(*TODO_COLUMNS, Todo.seq).where(Todo.user_id == user_id, Todo.seq > (since or 0)).order_by(Todo.seq).limit(limit + 1)).all()
+    if since is None:
+        return changed, [], current
+    deleted = db.execute(select(Todo_Tombstone.todo_id, Todo_Tombstone.seq, Todo_Tombstone.deleted_at)
+                         .where(Todo_Tombstone.user_id == user_id, Todo_Tombstone.seq > since).order_by(Todo_Tombstone.seq).limit(limit + 1)).all()
+    # 삭제 기록을 읽은 뒤 확인하므로 그 사이에 정리가 끝나도 놓치지 않음
+    if not full and since < db.execute(TOMBSTONES_PURGED).scalar():
+        return None
+    return changed, deleted, current
+
+def purge_tombstones(db: Session, before: datetime, batch_size: int) -> int:
+    # 보관기간이 지난 삭제 기록을 batch_size 개씩 삭제하고 정리한 최대 seq 를 기록
+    #  삭제 기록은 id(rowid) 순으로 쌓이므로 오래된 행부터 읽다가 batch_size 개에서 멈춤
+    rows = db.execute(select(Todo_Tombstone.id, Todo_Tombstone.seq).where(Todo_Tombstone.deleted_at < before)
+                      .order_by(Todo_Tombstone.id).limit(batch_size)).all()
+    if not rows:
+        return 0
+    db.execute(text('UPDATE todo_change_seq SET purged = max(purged, :seq)'), {'seq': max(row.seq for row in rows)})
+    db.execute(delete(Todo_Tombstone).where(Todo_Tombstone.id.in_([row.id for row in rows])), execution_options={'synchronize_session': False})
+    db.commit()
+    return len(rows)
+
+def get_todos_version(db: Session, user_id: int) -> tuple:
+    # 사용자 일정 목록의 변경 여부 판단용, ix_todo_user_seq / ix_todo_tombstone_user_seq 만 읽음
+    return tuple(db.execute(TODOS_VERSION, {'user_id': user_id}).one())
 
 def get_todo_by_id(db: Session, todo_id: int, user_id: int):
-    return db.query(Todo).filter(Todo.id == todo_id, Todo.user_id == user_id).first()
+    return db.scalars(TODO_BY_ID, {'todo_id': todo_id, 'user_id': user_id}).first()
+
+def get_todo_row(db: Session, todo_id: int, user_id: int):
+    # 응답 컬럼만 Row 로 조회 (캐시 저장용 - ORM 객체는 세션에 묶여 있어 공유하지 않음)
+    return db.execute(TODO_ROW_BY_ID, {'todo_id': todo_id, 'user_id': user_id}).first()
 
 def update_todo(db: Session, todo_id: int, user_id: int, update_data: td_scheme.TodoUpdate):
     todo = get_todo_by_id(db, todo_id, user_id)
@@ -43,10 +146,120 @@ def delete_todo(db: Session, todo_id: int, user_id: int):
     db.commit()
     return True
 
-def search_todos(db: Session, user_id: int, title: Optional[str],date:Optional[datetime]):
-    query =db.query(Todo).filter(Todo.user_id == user_id)
+def search_todos(db: Session, user_id: int, title: Optional[str],date:Optional[datetime], limit: Optional[int] = None, after_id: Optional[int] = None):
+    # TodoSearchResponse 형태 (snippet 은 q 검색에서만 채워짐)
+    stmt = todos_statement(user_id, title, date, after_id, limit, columns=TODO_COLUMNS)
+    return db.execute(stmt.add_columns(null().label('snippet'))).all()
+
+def date_filter(date: datetime):
+    # func.Date(todo_date) == date 는 인덱스를 쓸 수 없으므로 [당일 00:00, 다음날 00:00) 범위로 비교
+    start = datetime.combine(date.date(), time.min)
+    return and_(Todo.todo_date >= start, Todo.todo_date < start + timedelta(days=1))
+
+def get_todos_in_range(db: Session, user_id: int, date_from: datetime, date_to: datetime, limit: Optional[int] = None, after: Optional[tuple] = None):
+    # ix_todo_user_date (user_id, todo_date, rowid) 순서 그대로 읽으므로 정렬이 필요 없음
+    stmt = select(*TODO_COLUMNS).where(Todo.user_id == user_id, Todo.todo_date >= date_from, Todo.todo_date < date_to)
+    if after is not None:
+        stmt = stmt.where(tuple_(Todo.todo_date, Todo.id) > tuple_(*after))
+    stmt = stmt.order_by(Todo.todo_date, Todo.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return db.execute(stmt).all()
+
+def fts_available(db: Session) -> bool:
+    global _fts_available
+    if not _fts_available:
+        _fts_available = db.execute(text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'todo_fts'")).first() is not None
+    return _fts_available
+
+def fts_match(user_id: int, q: str) -> Optional[str]:
+    # 사용자 입력을 토큰 단위 접두어 검색식으로 변환 ("tok"* ...), FTS 문법 문자는 제거
+    tokens = re.findall(r'\w+', q)
+    if not tokens:
+        return None
+    terms = ' '.join(f'"{token}"*' for token in tokens)
+    return f'user_id:"{int(user_id)}" AND {{title description}}: ({terms})'
+
+def full_text_search(db: Session, user_id: int, q: str, date: Optional[datetime] = None, limit: Optional[int] = None, after: Optional[dict] = None, title: Optional[str] = None):
+    # 제목+설명 전문검색 (bm25 랭킹, 스니펫). FTS5 를 쓸 수 없으면 LIKE 로 대체
+    # 결과 Row : TODO_COLUMNS + snippet + rank
+    match = fts_match(user_id, q)
+    if match is None or not fts_available(db):
+        after_id = after.get('id') if after else None
+        stmt = todos_statement(user_id, title, date, after_id, limit, q=q, columns=TODO_COLUMNS)
+        return db.execute(stmt.add_columns(null().label('snippet'), literal(0.0).label('rank'))).all()
+
+    fts = literal_column('todo_fts')
+    stmt = (
+        select(*TODO_COLUMNS, func.snippet(fts, -1, '<b>', '</b>', '…', 12).label('snippet'), todo_fts.c.rank)
+        .join(todo_fts, todo_fts.c.rowid == Todo.id)
+        .where(fts.op('MATCH')(match), Todo.user_id == user_id)
+    )
     if title and title.strip() != '':
-        query = query.filter(Todo.title.ilike(f'%{title}%'))
-    if date :
-        query = query.filter( func.Date(Todo.todo_date)==date.date())
-    return query.all()
\ No newline at end of file
+        stmt = stmt.where(Todo.title.ilike(f'%{title}%'))
+    if date:
+        stmt = stmt.where(date_filter(date))
+    if after:
+        stmt = stmt.where(or_(todo_fts.c.rank > after['rank'], and_(todo_fts.c.rank == after['rank'], Todo.id > after['id'])))
+    stmt = stmt.order_by(todo_fts.c.rank, Todo.id)
+    if limit is not None:
+        stmt = stmt.limit(limit)
+    return db.execute(stmt).all()
+
+def todo_row(todo: Todo) -> dict:
+    return {field: getattr(todo, field) for field in td_scheme.TODO_RESPONSE_FIELDS}
+
+def apply_batch(db: Session, user_id: int, operations: List[td_scheme.TodoBatchOperation]) -> List[dict]:
+    # 소유권은 한 번의 IN 조회로 확인하고, 생성/수정/삭제를 각각 한 번의 bulk 문으로 실행 후 한 번만 commit
+    target_ids = {op.id for op in operations if op.op != BatchOperation.CREATE and op.id is not None}
+    owned = set(db.scalars(select(Todo.id).where(Todo.user_id == user_id, Todo.id.in_(target_ids)))) if target_ids else set()
+
+    results = []
+    creates, updates, deleted = [], {}, set()
+    now = datetime.utcnow()
+    for index, op in enumerate(operations):
+        result = {'index': index, 'op': op.op, 'id': op.id, 'status': 200, 'detail': None, 'todo': None}
+        results.append(result)
+        data = op.data.dict(exclude_unset=True) if op.data else {}
+        if op.op == BatchOperation.CREATE:
+            if not data.get('title'):
+                result.update(status=400, detail='title is required')
+                continue
+            creates.append((result, {
+                'user_id': user_id,
+                'title': data['title'],
+                'description': data.get('description'),
+                'todo_date': data.get('todo_date'),
+                'complete': data.get('complete') or 0,
+            }))
+        elif op.id not in owned or op.id in deleted:
+            result.update(status=404, detail='Todo not found or unauthorized')
+        elif op.op == BatchOperation.UPDATE:
+            # 같은 일정에 대한 여러 수정은 하나로 합침 (뒤의 값 우선)
+            values = updates.setdefault(op.id, {'id': op.id})
+            values.update(data, updated_at=now)
+            result['_update'] = True
+        else:
+            deleted.add(op.id)
+            updates.pop(op.id, None)
+
+    if creates:
+        # 다중 VALUES INSERT 한 번으로 실행. rowid 는 입력 순서대로 증가하므로 id 정렬로 요청 순서와 맞춘다
+        # (sort_by_parameter_order=True 는 SQLite 에서 행 단위 INSERT 로 풀림)
+        created = sorted(db.scalars(insert(Todo).returning(Todo), [values for _, values in creates]).all(), key=lambda todo: todo.id)
+        for (result, _), todo in zip(creates, created):
+            result['id'] = todo.id
+            result['todo'] = todo_row(todo)
+    rows = {}
+    if updates:
+        db.execute(update(Todo), list(updates.values()), execution_options={'synchronize_session': False})
+        rows = {todo.id: todo_row(todo) for todo in db.scalars(select(Todo).where(Todo.id.in_(updates.keys())).execution_options(populate_existing=True))}
+    if deleted:
+        db.execute(delete(Todo).where(Todo.user_id == user_id, Todo.id.in_(deleted)), execution_options={'synchronize_session': False})
+    db.commit()
+
+    for result in results:
+        # 같은 배치 안에서 이후에 삭제된 일정은 todo 없이 반환
+        if result.pop('_update', False):
+            result['todo'] = rows.get(result['id'])
+    return results
@@ -1,6 +1,17 @@
+import logging
+from sqlalchemy import select, bindparam
 from sqlalchemy.orm import Session
 from app.db import models
 from app.schemas import user as user_schema
+from app.core import principal_cache, token_versions
+
+logger = logging.getLogger(__name__)
+
+# 인증 경로에서 매 요청 실행하는 조회문은 모듈 로드 시 한 번 만들어 재사용 (값은 bindparam 으로 전달)
+#  문 객체 생성 / cache key 계산을 반복하지 않고, 컴파일 결과는 engine 의 compiled cache 에서 꺼내 씀
+USER_BY_EMAIL = select(models.User).where(models.User.email == bindparam('email')).limit(1)
+USER_BY_ID = select(models.User).where(models.User.id == bindparam('id')).limit(1)
+TOKEN_VERSION_BY_ID = select(models.User.token_version).where(models.User.id == bindparam('id'))
 
 def create_user(db: Session, user: user_schema.UserCreate):
     db_user = models.User(**user.dict())
@@ -10,10 +21,14 @@ def create_user(db: Session, user: user_schema.UserCreate):
     return db_user
 
 def get_user(db: Session, user_email: str):
-    return db.query(models.User).filter(models.User.email == user_email).first()
+    return db.scalars(USER_BY_EMAIL, {'email': user_email}).first()
 
 def get_user_by_id(db: Session, id: str):
-    return db.query(models.User).filter(models.User.id == id).first()
+    return db.scalars(USER_BY_ID, {'id': id}).first()
+
+def get_token_version(db: Session, id: str):
+    # stateless 인증 버전 맵 적재용 (행이 없으면 None - 삭제된 사용자)
+    return db.execute(TOKEN_VERSION_BY_ID, {'id': id}).scalar_one_or_none()
 
 def get_all_user(db:Session):
     return db.query(models.User).all()
@@ -21,12 +36,25 @@ def get_all_user(db:Session):
 def delete_user(id:int,db:Session):
     cnt = db.query(models.User).filter(models.User.id ==id).delete()
     db.commit()
+    principal_cache.invalidate_user(id)
+    token_versions.revoke(id)
     return cnt
 
 def user_update(user_update:user_schema.UserUpdate,user:models.User,db:Session):
-    print(user_update)
+    user_id = user.id
     user.name = user_update.name
     user.password = user_update.new_password
+    # 이전에 발급한 access_token 무효화 (stateless 모드)
+    version = (user.token_version or 0) + 1
+    user.token_version = version
     db.commit()
+    principal_cache.invalidate_user(user_id)
+    token_versions.bump(user_id, version)
+    logger.info('user updated', extra={'user_id': user_id, 'token_version': version})
+
+def update_password(db: Session, user: models.User, hashed_password: str):
+    user.password = hashed_password
+    db.commit()
+
 #def email_exists(db:Session, email : str):
 #    return db.query(models.User).filter(models.User.email == email).first() 
\ No newline at end of file
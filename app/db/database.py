@@ -1,16 +1,84 @@
-from sqlalchemy import create_engine
+import time
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
 from sqlalchemy import event
+from sqlalchemy.engine.default import CACHE_HIT, CACHE_MISS, CACHING_DISABLED, NO_CACHE_KEY, NO_DIALECT_SUPPORT
+from app.core import config, metrics, request_context
+from app.db import query_monitor
 
-DATABASE_URL = 'sqlite:///./test.db'
+DATABASE_URL = config.DATABASE_URL
+ASYNC_DATABASE_URL = config.ASYNC_DATABASE_URL
 
-engine = create_engine(DATABASE_URL, connect_args={'check_same_thread': False})
+SQLITE_PRAGMAS = {
+    'journal_mode': config.SQLITE_JOURNAL_MODE,
+    'synchronous': config.SQLITE_SYNCHRONOUS,
+    'cache_size': config.SQLITE_CACHE_SIZE,
+    'mmap_size': config.SQLITE_MMAP_SIZE,
+    'busy_timeout': config.SQLITE_BUSY_TIMEOUT,
+    'temp_store': config.SQLITE_TEMP_STORE,
+}
+
+POOL_OPTIONS = {
+    'pool_size': config.DB_POOL_SIZE,
+    'max_overflow': config.DB_MAX_OVERFLOW,
+    'pool_timeout': config.DB_POOL_TIMEOUT,
+}
+
+def pool_options(url: str) -> dict:
+    # 메모리 SQLite(sqlite:// , :memory:)는 QueuePool 이 아닌 SingletonThreadPool / StaticPool 을 쓰므로 pool 크기 옵션을 받지 않는다
+    url = make_url(url)
+    if url.get_backend_name() == 'sqlite' and (':memory:' in (url.database or ':memory:') or url.query.get('mode') == 'memory'):
+        return {}
+    return POOL_OPTIONS
+
+engine = create_engine(DATABASE_URL, connect_args={'check_same_thread': False}, **pool_options(DATABASE_URL))
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
-@event.listens_for(engine, 'connect')
-def enable_sqlite_foreign_keys(dbapi_connection, connection_record):
+# 같은 SQLite 파일을 바라보는 async 엔진 (config.DB_BACKEND == 'async' 일 때 사용)
+async_engine = create_async_engine(ASYNC_DATABASE_URL, **pool_options(ASYNC_DATABASE_URL))
+AsyncSessionLocal = async_sessionmaker(bind=async_engine, autoflush=False, expire_on_commit=False)
+
+def apply_sqlite_pragmas(dbapi_connection, pragmas: dict):
     cursor = dbapi_connection.cursor()
     cursor.execute('PRAGMA foreign_keys=ON')
+    for name, value in pragmas.items():
+        cursor.execute(f'PRAGMA {name}={value}')
     cursor.close()
 
+@event.listens_for(engine, 'connect')
+@event.listens_for(async_engine.sync_engine, 'connect')
+def configure_sqlite_connection(dbapi_connection, connection_record):
+    apply_sqlite_pragmas(dbapi_connection, SQLITE_PRAGMAS)
+
+# ExecutionContext.cache_hit -> db_compiled_cache_total 라벨
+COMPILE_CACHE_RESULTS = {CACHE_HIT: 'hit', CACHE_MISS: 'miss', CACHING_DISABLED: 'disabled',
+                         NO_CACHE_KEY: 'no_key', NO_DIALECT_SUPPORT: 'unsupported'}
+
+# SQL 문 실행시간 계측 (request 중이면 request_context 에 문 수/시간 합산) + 느린 SQL / N+1 감지(query_monitor)
+@event.listens_for(engine, 'before_cursor_execute')
+@event.listens_for(async_engine.sync_engine, 'before_cursor_execute')
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault('query_start', []).append(time.perf_counter())
+
+@event.listens_for(engine, 'after_cursor_execute')
+@event.listens_for(async_engine.sync_engine, 'after_cursor_execute')
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info['query_start'].pop()
+    metrics.DB_QUERY_SECONDS.observe(elapsed)
+    result = COMPILE_CACHE_RESULTS.get(getattr(context, 'cache_hit', None))
+    if result is not None:
+        metrics.DB_COMPILE_CACHE.inc(result=result)
+    request_context.record_db(elapsed)
+    if query_monitor.enabled():
+        query_monitor.check(conn, statement, parameters, executemany, elapsed)
+
+@event.listens_for(engine, 'handle_error')
+@event.listens_for(async_engine.sync_engine, 'handle_error')
+def discard_query_start(exception_context):
+    # 실패한 문은 after_cursor_execute 가 호출되지 않는다
+    conn = exception_context.connection
+    if conn is not None and conn.info.get('query_start'):
+        conn.info['query_start'].pop()
+
 Base = declarative_base()
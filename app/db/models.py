@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String,DateTime,text,ForeignKey,UniqueConstraint,Boolean
+from sqlalchemy import Column, Integer, String,DateTime,text,ForeignKey,UniqueConstraint,Boolean,DDL,event,Index
 from app.db.database import Base
 class User(Base):
     __tablename__ = 'users'
@@ -9,6 +9,10 @@ class User(Base):
     password = Column(String)
     created_at =  Column(DateTime(timezone = True),server_default = text('CURRENT_TIMESTAMP'))
     updated_at = Column(DateTime(timezone = True),onupdate=text('CURRENT_TIMESTAMP'))
+    token_version = Column(Integer,server_default=text('0'))  # access_token 'ver' 클레임, 수정/삭제 시 증가하여 이전 토큰 무효화
+
+    # 삭제된 사용자의 id 를 재사용하면 그 사용자의 토큰(sub)이 새 사용자로 인증되므로 AUTOINCREMENT 사용
+    __table_args__ = {'sqlite_autoincrement': True}
     
 class User_Token(Base):
     __tablename__='users_token'
@@ -17,8 +21,8 @@ class User_Token(Base):
     user_id = Column(Integer, ForeignKey('users.id', ondelete='CASCADE'),index=True)
     device_id = Column(String,nullable=True)
     login_type = Column(String,server_default=text('local'))
-    refresh_token = Column(String)
-    expired_at = Column(DateTime(timezone=False))
+    refresh_token_hash = Column(String(64))  # sha256(refresh_token) hex - 토큰 원문은 저장하지 않음
+    expired_at = Column(DateTime(timezone=False),index=True)  # 만료 토큰 정리용
     #use_yn = Column(Integer,server_default=text('1'))
     created_at =  Column(DateTime(timezone = True),server_default = text('CURRENT_TIMESTAMP'))
     
@@ -35,4 +39,73 @@ class Todo(Base):
     todo_date =Column(DateTime(timezone=False))
     complete = Column(Integer)
     created_at =  Column(DateTime(timezone = True),server_default = text('CURRENT_TIMESTAMP'))
-    updated_at = Column(DateTime(timezone = True),onupdate=text('CURRENT_TIMESTAMP'))
\ No newline at end of file
+    updated_at = Column(DateTime(timezone = True),onupdate=text('CURRENT_TIMESTAMP'))
+    seq = Column(Integer)  # 변경 순번 (생성/수정 시 트리거가 todo_change_seq 에서 발급, GET /todos/changes 커서)
+
+    # 날짜 검색/달력 조회용 (todo_date 는 범위 조건으로만 비교해야 인덱스를 탄다)
+    # 변경분 조회(user_id, seq > ?)는 ix_todo_user_seq 범위 검색 -> 변경 건수에 비례
+    # ETag 용 목록 버전(max(seq), count)도 같은 인덱스만 읽음 (covering index)
+    # AUTOINCREMENT : 삭제된 id 를 새 일정에 재사용하지 않음 (변경분 조회에서 삭제 기록과 새 일정이 같은 id 가 되지 않도록)
+    __table_args__ = (
+        Index('ix_todo_user_date', 'user_id', 'todo_date'),
+        Index('ix_todo_user_seq', 'user_id', 'seq'),
+        {'sqlite_autoincrement': True},)
+
+class Todo_Tombstone(Base):
+    # 삭제된 일정 기록 (todo 삭제 트리거가 추가, 사용자 삭제 시 함께 삭제)
+    __tablename__='todo_tombstone'
+    id = Column(Integer,primary_key=True,autoincrement=True)
+    todo_id = Column(Integer)
+    user_id = Column(Integer)
+    seq = Column(Integer)
+    deleted_at = Column(DateTime(timezone = True),server_default = text('CURRENT_TIMESTAMP'))
+
+    __table_args__ = (
+        Index('ix_todo_tombstone_user_seq', 'user_id', 'seq'),)
+
+# 변경 순번 : 한 행짜리 카운터 테이블을 트리거에서 증가시켜 생성/수정/삭제마다 단조 증가하는 seq 발급
+#  SQLite 는 쓰기 트랜잭션을 직렬화하므로 seq 순서는 commit 순서와 같다 (seq 로 이어 받으면 변경을 놓치지 않음)
+#  seq 를 바꾸는 UPDATE 는 todo_seq_au 의 WHEN 조건으로 다시 발급하지 않는다
+#  purged : 보관기간이 지나 정리한 삭제 기록의 최대 seq (이보다 오래된 커서는 삭제를 놓칠 수 있으므로 전체 재동기화)
+TODO_SEQ_DDL = (
+    "CREATE TABLE IF NOT EXISTS todo_change_seq (value INTEGER NOT NULL, purged INTEGER NOT NULL DEFAULT 0)",
+    "INSERT INTO todo_change_seq (value) SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM todo_change_seq)",
+    "CREATE TRIGGER IF NOT EXISTS todo_seq_ai AFTER INSERT ON todo BEGIN "
+    "UPDATE todo_change_seq SET value = value + 1; "
+    "UPDATE todo SET seq = (SELECT value FROM todo_change_seq) WHERE id = new.id; END",
+    "CREATE TRIGGER IF NOT EXISTS todo_seq_au AFTER UPDATE ON todo WHEN new.seq IS old.seq BEGIN "
+    "UPDATE todo_change_seq SET value = value + 1; "
+    "UPDATE todo SET seq = (SELECT value FROM todo_change_seq) WHERE id = new.id; END",
+    "CREATE TRIGGER IF NOT EXISTS todo_seq_ad AFTER DELETE ON todo BEGIN "
+    "UPDATE todo_change_seq SET value = value + 1; "
+    "INSERT INTO todo_tombstone (todo_id, user_id, seq) VALUES (old.id, old.user_id, (SELECT value FROM todo_change_seq)); END",
+    "CREATE TRIGGER IF NOT EXISTS users_tombstone_ad AFTER DELETE ON users BEGIN "
+    "DELETE FROM todo_tombstone WHERE user_id = old.id; END",
+)
+
+# todo 전문검색 인덱스 (FTS5 external content 테이블, 트리거로 동기화)
+# user_id 도 토큰으로 색인하여 사용자 필터를 FTS 인덱스 안에서 처리 (랭킹 가중치 0)
+TODO_FTS_DDL = (
+    "CREATE VIRTUAL TABLE IF NOT EXISTS todo_fts USING fts5("
+    "title, description, user_id, content='todo', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2', prefix='2 3')",
+    "INSERT INTO todo_fts(todo_fts, rank) VALUES ('rank', 'bm25(10.0, 1.0, 0.0)')",
+    "CREATE TRIGGER IF NOT EXISTS todo_fts_ai AFTER INSERT ON todo BEGIN "
+    "INSERT INTO todo_fts(rowid, title, description, user_id) VALUES (new.id, new.title, new.description, new.user_id); END",
+    "CREATE TRIGGER IF NOT EXISTS todo_fts_ad AFTER DELETE ON todo BEGIN "
+    "INSERT INTO todo_fts(todo_fts, rowid, title, description, user_id) VALUES ('delete', old.id, old.title, old.description, old.user_id); END",
+    "CREATE TRIGGER IF NOT EXISTS todo_fts_au AFTER UPDATE OF title, description, user_id ON todo BEGIN "
+    "INSERT INTO todo_fts(todo_fts, rowid, title, description, user_id) VALUES ('delete', old.id, old.title, old.description, old.user_id); "
+    "INSERT INTO todo_fts(rowid, title, description, user_id) VALUES (new.id, new.title, new.description, new.user_id); END",
+)
+
+def fts5_supported(ddl, target, bind, **kw):
+    return bool(bind.exec_driver_sql("SELECT sqlite_compileoption_used('ENABLE_FTS5')").scalar())
+
+for statement in TODO_SEQ_DDL:
+    event.listen(Todo.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite'))
+event.listen(Todo.__table__, 'before_drop', DDL('DROP TABLE IF EXISTS todo_change_seq').execute_if(dialect='sqlite'))
+
+for statement in TODO_FTS_DDL:
+    event.listen(Todo.__table__, 'after_create', DDL(statement).execute_if(dialect='sqlite', callable_=fts5_supported))
+event.listen(Todo.__table__, 'before_drop', DDL('DROP TABLE IF EXISTS todo_fts').execute_if(dialect='sqlite'))
@@ -0,0 +1,68 @@
+import functools
+import logging
+import re
+from app.core import config, metrics, request_context
+
+logger = logging.getLogger(__name__)
+
+# 모듈 변수로 두어 테스트/운영 중에 조정 가능
+SLOW_QUERY_THRESHOLD = config.SLOW_QUERY_THRESHOLD_MS / 1000 if config.SLOW_QUERY_LOG_ENABLED else None
+REPEAT_LIMIT = config.QUERY_REPEAT_LIMIT
+REPEAT_ACTION = config.QUERY_REPEAT_ACTION
+
+SLOW_QUERIES = metrics.Counter('db_slow_queries_total', '임계값을 넘은 SQL 문 수', ['route'])
+REPEATED_STATEMENTS = metrics.Counter('db_repeated_statements_total', '한 request 에서 반복 한도를 넘은 SQL 형태 수 (N+1 의심)', ['route'])
+
+_PARAMETER_LIMIT = 200
+
+
+class RepeatedStatementError(RuntimeError):
+    # QUERY_REPEAT_ACTION='raise' 일 때 N+1 의심 request 를 실패시킨다
+    pass
+
+def enabled() -> bool:
+    return SLOW_QUERY_THRESHOLD is not None or REPEAT_LIMIT > 0
+
+# 같은 형태 판별용 : 공백 정리, IN (?, ?, ...) 목록/숫자 리터럴을 ? 로 통일
+@functools.lru_cache(maxsize=1024)
+def statement_shape(statement: str) -> str:
+    shape = ' '.join(statement.split())
+    shape = re.sub(r'\(\s*\?(\s*,\s*\?)*\s*\)', '(?)', shape)
+    return re.sub(r'\b\d+\b', '?', shape)
+
+def explain(conn, statement: str, parameters) -> str:
+    # DBAPI cursor 를 직접 사용 - cursor 이벤트가 다시 발생하지 않는다
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute('EXPLAIN QUERY PLAN ' + statement, parameters)
+        return ' | '.join(str(row[3]) for row in cursor.fetchall())
+    except Exception as exc:
+        return f'(explain failed: {exc})'
+    finally:
+        cursor.close()
+
+def _short(parameters) -> str:
+    text = repr(parameters)
+    return text if len(text) <= _PARAMETER_LIMIT else text[:_PARAMETER_LIMIT] + '...'
+
+def check(conn, statement: str, parameters, executemany: bool, elapsed: float):
+    context = request_context.current()
+    route = context.route if context is not None else '-'
+
+    if SLOW_QUERY_THRESHOLD is not None and elapsed >= SLOW_QUERY_THRESHOLD:
+        SLOW_QUERIES.inc(route=route)
+        plan = '(executemany)' if executemany else explain(conn, statement, parameters)
+        logger.warning('slow query %.1fms route=%s statement=%s parameters=%s plan=%s',
+                       elapsed * 1000, route, ' '.join(statement.split()), _short(parameters), plan)
+
+    # executemany (가져오기 chunk 등 일괄 INSERT) 는 이미 묶어서 실행한 문이므로 반복 횟수에서 제외
+    if REPEAT_LIMIT > 0 and context is not None and not executemany:
+        shape = statement_shape(statement)
+        count = context.statement_shapes.get(shape, 0) + 1
+        context.statement_shapes[shape] = count
+        if count == REPEAT_LIMIT + 1:
+            REPEATED_STATEMENTS.inc(route=route)
+            message = f'statement executed more than {REPEAT_LIMIT} times in one request (N+1?) route={route} statement={shape}'
+            if REPEAT_ACTION == 'raise':
+                raise RepeatedStatementError(message)
+            logger.warning(message)
@@ -1,14 +1,84 @@
-from fastapi import FastAPI
+import asyncio
+from contextlib import asynccontextmanager, suppress
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
 from app.api.routes import user,todo
+from app.api.routes import async_user,async_todo
+from app.api.routes import metrics as metrics_route
+from app.api.middleware.metrics import MetricsMiddleware
+from app.api.middleware.compression import CompressionMiddleware
+from app.api.middleware.profiling import ProfilingMiddleware
+from app.api.middleware.request_context import RequestContextMiddleware
+from app.api.middleware.request_id import RequestIdMiddleware
+from app.core import config, logging_setup, rate_limiter
+from app.utils import bcrypt as bc
+from app.services import token_purge_service, tombstone_purge_service
 #import uvicorn
-app = FastAPI()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if config.LOGGING_ENABLED:
+        logging_setup.configure()
+    # 만료된 refresh token / 보관기간이 지난 일정 삭제 기록 주기적 정리
+    purge_tasks = []
+    if config.TOKEN_PURGE_ENABLED:
+        purge_tasks.append(asyncio.create_task(token_purge_service.run_purge_loop()))
+    if config.TOMBSTONE_PURGE_ENABLED:
+        purge_tasks.append(asyncio.create_task(tombstone_purge_service.run_purge_loop()))
+    yield
+    for purge_task in purge_tasks:
+        purge_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await purge_task
+    logging_setup.shutdown()
+
+def create_app(backend: str = config.DB_BACKEND) -> FastAPI:
+    app = FastAPI(lifespan=lifespan)
+
+    # DB_BACKEND 설정에 따라 sync / async 라우터 선택
+    if backend == 'async':
+        app.include_router(async_user.router, prefix='/users', tags=['Users'])
+        app.include_router(async_todo.router, prefix='/todos', tags=['Todo'])
+    else:
+        app.include_router(user.router, prefix='/users', tags=['Users'])
+        app.include_router(todo.router, prefix='/todos', tags=['Todo'])
+
+    # 나중에 추가한 미들웨어가 바깥쪽 : 메트릭은 압축 시간까지 포함하여 측정
+    if config.PROFILING_ENABLED:
+        app.add_middleware(ProfilingMiddleware)
+    if config.COMPRESSION_ENABLED:
+        app.add_middleware(CompressionMiddleware)
+    if config.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)
+        app.include_router(metrics_route.router, tags=['Metrics'])
+    # request context 는 메트릭 설정과 무관하게 항상 생성 (N+1 감지 / 메트릭 / 프로파일이 사용)
+    app.add_middleware(RequestContextMiddleware)
+    # 가장 바깥쪽 : 모든 로그 레코드에 request ID
+    app.add_middleware(RequestIdMiddleware)
+
+    @app.exception_handler(bc.PasswordHasherBusy)
+    async def password_hasher_busy(request: Request, exc: bc.PasswordHasherBusy):
+        return JSONResponse(
+            status_code=503,
+            content={'detail': 'Server is busy. Please retry later.'},
+            headers={'Retry-After': str(exc.retry_after)},
+        )
+
+    @app.exception_handler(rate_limiter.RateLimited)
+    async def rate_limited(request: Request, exc: rate_limiter.RateLimited):
+        return JSONResponse(
+            status_code=429,
+            content={'detail': 'Too many requests. Please retry later.'},
+            headers={'Retry-After': str(exc.retry_after)},
+        )
+
+    @app.get('/')
+    def Main():
+        return 'FestAPI_JWT_SAMPLE'
+
+    return app
+
+app = create_app()
 
 #if __name__ == "__main__":
 #    uvicorn.run(app, host="127.0.0.1", port=8000)
-    
-app.include_router(user.router, prefix='/users', tags=['Users'])
-app.include_router(todo.router, prefix='/todos', tags=['Todo'])
-
-@app.get('/')
-def Main():
-    return 'FestAPI_JWT_SAMPLE'
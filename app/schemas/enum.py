@@ -9,4 +9,13 @@ class RefreshValidationResult(Enum):
     VALID = "valid"
     EXPIRED = "expired"
     INVALID = "invalid"
-    NOT_FOUND = "not_found"
\ No newline at end of file
+    NOT_FOUND = "not_found"
+
+class BatchOperation(str, Enum):
+    CREATE = "create"
+    UPDATE = "update"
+    DELETE = "delete"
+
+class TransferFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
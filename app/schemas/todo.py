@@ -1,6 +1,7 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Optional, List
 from datetime import datetime
+from app.schemas.enum import BatchOperation
 
 class TodoCreate(BaseModel):
     title: str = Field(..., description="할 일 제목")
@@ -25,3 +26,60 @@ class TodoResponse(BaseModel):
 
     class Config:
         orm_mode = True
+
+class TodoSearchResponse(TodoResponse):
+    snippet: Optional[str] = Field(None, description="전문검색 일치 구간 (q 검색시)")
+
+class TodoChange(TodoResponse):
+    seq: int = Field(..., description="변경 순번")
+
+class TodoTombstone(BaseModel):
+    id: int = Field(..., description="삭제된 일정 ID")
+    seq: int = Field(..., description="변경 순번")
+    deleted_at: datetime = Field(..., description="삭제일")
+
+class TodoChangesResponse(BaseModel):
+    changes: List[TodoChange] = Field(..., description="생성/수정된 일정 (seq 순)")
+    deleted: List[TodoTombstone] = Field(..., description="삭제된 일정 (seq 순)")
+    cursor: str = Field(..., description="다음 요청의 since 값")
+    has_more: bool = Field(..., description="이어서 가져올 변경분이 남았는지 여부")
+
+class TodoBatchData(BaseModel):
+    title: Optional[str] = Field(None, description="할 일 제목 (create 필수)")
+    description: Optional[str] = Field(None, description="할 일 설명")
+    todo_date: Optional[datetime] = Field(None, description="할 일 날짜")
+    complete: Optional[int] = Field(None, description="완료여부")
+
+class TodoBatchOperation(BaseModel):
+    op: BatchOperation = Field(..., description="create / update / delete")
+    id: Optional[int] = Field(None, description="대상 일정 ID (update, delete)")
+    data: Optional[TodoBatchData] = Field(None, description="생성/수정할 값 (update 는 보낸 필드만 반영)")
+
+class TodoBatchRequest(BaseModel):
+    operations: List[TodoBatchOperation] = Field(..., description="순서대로 적용할 작업 목록")
+
+class TodoBatchResult(BaseModel):
+    index: int = Field(..., description="요청 operations 내 위치")
+    op: BatchOperation = Field(..., description="작업 종류")
+    id: Optional[int] = Field(None, description="일정 ID")
+    status: int = Field(..., description="항목별 처리 결과 (200/400/404)")
+    detail: Optional[str] = Field(None, description="실패 사유")
+    todo: Optional[TodoResponse] = Field(None, description="생성/수정된 일정")
+
+class TodoBatchResponse(BaseModel):
+    results: List[TodoBatchResult]
+
+class TodoImportError(BaseModel):
+    line: int = Field(..., description="본문 내 줄 번호 (csv 는 레코드 시작 줄)")
+    detail: str = Field(..., description="건너뛴 사유")
+
+class TodoImportResponse(BaseModel):
+    imported: int = Field(..., description="추가된 일정 수")
+    skipped: int = Field(..., description="형식 오류로 건너뛴 행 수")
+    errors: List[TodoImportError] = Field(..., description="건너뛴 행 (앞에서부터 최대 TODO_IMPORT_MAX_ERRORS 개)")
+
+# TodoResponse 필드 순서 (NDJSON 등 모델 인스턴스 없이 직렬화할 때 사용)
+TODO_RESPONSE_FIELDS = ('id', 'user_id', 'title', 'description', 'todo_date', 'complete', 'created_at', 'updated_at')
+TODO_SEARCH_FIELDS = TODO_RESPONSE_FIELDS + ('snippet',)
+TODO_CHANGE_FIELDS = TODO_RESPONSE_FIELDS + ('seq',)
+TODO_TOMBSTONE_FIELDS = ('id', 'seq', 'deleted_at')
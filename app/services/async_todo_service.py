@@ -0,0 +1,83 @@
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.schemas import todo as td_scheme
+from typing import List, Optional
+from datetime import datetime
+from app.crud import async_todo as td_crud
+from app.db.database import AsyncSessionLocal
+from app.core import config
+from app.schemas.enum import TransferFormat
+from app.services import todo_transfer
+from app.services.todo_service import todo_to_json_line, cache_lookup, cache_store, invalidate_user, merge_changes
+
+# 캐시는 todo_service 와 공유
+async def _cached(user_id, key: str, load):
+    value, generation = cache_lookup(user_id, key)
+    if value is None:
+        value = await load()
+        cache_store(user_id, key, value, generation)
+    return value
+
+async def create_todo(db: AsyncSession, user_id: int, todo_data: td_scheme.TodoCreate):
+    todo = await td_crud.create_todo(db,user_id,todo_data)
+    invalidate_user(user_id)
+    return todo
+
+async def get_todos(db: AsyncSession, user_id: int, limit: Optional[int] = None, after_id: Optional[int] = None):
+    return await _cached(user_id, f'list:{limit}:{after_id}', lambda: td_crud.get_todos(db,user_id,limit,after_id))
+
+async def stream_todos(user_id: int, title: Optional[str] = None, date: Optional[datetime] = None, batch_size: int = 500, q: Optional[str] = None):
+    async with AsyncSessionLocal() as db:
+        lines = []
+        async for todo in td_crud.iter_todos(db, user_id, title, date, batch_size, q):
+            lines.append(todo_to_json_line(todo))
+            if len(lines) >= batch_size:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
+
+async def export_todos(user_id: int, format: TransferFormat, batch_size: Optional[int] = None):
+    async with AsyncSessionLocal() as db:
+        if format == TransferFormat.CSV:
+            yield todo_transfer.csv_header()
+        async for rows in td_crud.iter_todo_batches(db, user_id, batch_size or config.TODO_EXPORT_BATCH_SIZE):
+            yield todo_transfer.encode_rows(rows, format)
+
+async def import_todos(db: AsyncSession, user_id: int, rows: List[dict]) -> int:
+    count = await td_crud.insert_todos(db,user_id,rows)
+    invalidate_user(user_id)
+    return count
+
+async def get_changes(db: AsyncSession, user_id: int, since: Optional[int], limit: int, full: bool = False) -> Optional[dict]:
+    rows = await td_crud.get_changes(db,user_id,since,limit,full)
+    return merge_changes(*rows, since, limit, full) if rows is not None else None
+
+async def get_todos_version(db: AsyncSession, user_id: int):
+    return await _cached(user_id, 'version', lambda: td_crud.get_todos_version(db,user_id))
+
+async def get_todo_by_id(db: AsyncSession, todo_id: int, user_id: int):
+    return await _cached(user_id, f'item:{todo_id}', lambda: td_crud.get_todo_row(db,todo_id,user_id))
+
+async def get_todos_in_range(db: AsyncSession, user_id: int, date_from: datetime, date_to: datetime, limit: Optional[int] = None, after: Optional[tuple] = None):
+    return await td_crud.get_todos_in_range(db,user_id,date_from,date_to,limit,after)
+
+async def update_todo(db: AsyncSession, todo_id: int, user_id: int, update_data: td_scheme.TodoUpdate):
+    todo = await td_crud.update_todo(db,todo_id,user_id,update_data)
+    invalidate_user(user_id)
+    return todo
+
+async def apply_batch(db: AsyncSession, user_id: int, operations: List[td_scheme.TodoBatchOperation]):
+    results = await td_crud.apply_batch(db,user_id,operations)
+    invalidate_user(user_id)
+    return td_scheme.TodoBatchResponse(results=results)
+
+async def delete_todo(db: AsyncSession, todo_id: int, user_id: int):
+    result = await td_crud.delete_todo(db,todo_id,user_id)
+    invalidate_user(user_id)
+    return result
+
+async def search_todos(db: AsyncSession, user_id: int, title: Optional[str],date:Optional[datetime], limit: Optional[int] = None, after_id: Optional[int] = None):
+    return await td_crud.search_todos(db,user_id,title,date,limit,after_id)
+
+async def full_text_search(db: AsyncSession, user_id: int, q: str, date: Optional[datetime] = None, limit: Optional[int] = None, after: Optional[dict] = None, title: Optional[str] = None):
+    return await td_crud.full_text_search(db,user_id,q,date,limit,after,title)
@@ -0,0 +1,86 @@
+from app.crud import async_user as user_crud
+from app.crud import async_auth as auth_crud
+from app.schemas import user as user_schema
+from app.schemas import auth as au
+from app.schemas import response
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.utils import bcrypt as bc
+from app.utils import jwt_handler as jwt
+from datetime import datetime
+from app.schemas import  enum as valid
+from app.services import todo_service
+from app.services import user_service
+
+# bcrypt 는 CPU 작업이므로 이벤트 루프를 막지 않도록 전용 executor 에서 실행
+
+async def get_user(db: AsyncSession, email: str):
+    return await user_crud.get_user(db,email)
+
+async def create_user(db: AsyncSession, user: user_schema.UserCreate):
+    user.password = await bc.hash_password_async(user.password)
+    return await user_crud.create_user(db,user)
+
+async def validate_login_and_get_user(db: AsyncSession, user: user_schema.Login) -> tuple[valid.LoginValidationResult, any]:
+    account = await get_user(db, user.email)
+    if account is None:
+        return valid.LoginValidationResult.USER_NOT_FOUND, None
+    if not await bc.verify_password_async(user.password, account.password):
+        return valid.LoginValidationResult.INVALID_PASSWORD, None
+    return valid.LoginValidationResult.OK, account
+
+async def login(db: AsyncSession, user: user_schema.Login, account):
+    if bc.needs_rehash(account.password):
+        # 해시 정책이 바뀐 경우 평문을 알고 있는 지금 재해시 (바쁘면 다음 로그인으로 미룸)
+        #  로그인에서만 수행 - 암호를 확인하는 수정/삭제 요청이 쓰기 트랜잭션과 해시 비용을 떠안지 않도록
+        try:
+            await user_crud.update_password(db, account, await bc.hash_password_async(user.password))
+        except bc.PasswordHasherBusy:
+            pass
+    access_token = jwt.create_access_token(data=user_service.access_token_claims(account, user.device_id))
+    refresh_token_dict = jwt.create_refresh_token(data={"sub": str(account.id), "device_id": str(user.device_id)})
+    refresh_token_info = au.refresh_token_info(**refresh_token_dict)
+
+    await auth_crud.store_refresh_token(db, account.id, user.device_id, refresh_token_info)
+    result = au.response_login(access_token = access_token,refresh_token =refresh_token_info.refresh_token,token_type ='bearer')
+    return result
+
+async def delete_user(id: int, email: str, password: str, db: AsyncSession):
+    cnt = await user_crud.delete_user(id,db)
+    # cascade 로 삭제된 일정의 캐시 항목 정리
+    todo_service.invalidate_user(id)
+    result = response.CudResponseModel(message="User deleted")
+    return result
+
+async def validate_refresh_token(refresh_token: str, db: AsyncSession):
+    try:
+        request_refresh_token = jwt.decode_token(refresh_token)
+    except Exception:
+        return valid.RefreshValidationResult.INVALID, None, None
+
+    user_id = request_refresh_token.get("sub")
+    device_id = request_refresh_token.get("device_id")
+
+    if not user_id or not device_id:
+        return valid.RefreshValidationResult.INVALID, None, None
+
+    stored_token = await auth_crud.get_refresh_token(user_id, device_id, db)
+    if stored_token is None:
+        return valid.RefreshValidationResult.NOT_FOUND, None, None
+
+    if not jwt.token_matches(refresh_token, stored_token.refresh_token_hash):
+        return valid.RefreshValidationResult.INVALID, None, None
+
+    if datetime.utcnow() > stored_token.expired_at:
+        return valid.RefreshValidationResult.EXPIRED, None, None
+
+    return valid.RefreshValidationResult.VALID, user_id, device_id
+
+async def refresh(user_id: int, device_id: str, db: AsyncSession):
+    account = await user_crud.get_user_by_id(db, user_id)
+    return au.response_refresh(access_token=jwt.create_access_token(data=user_service.access_token_claims(account, device_id)))
+
+async def user_update(user: user_schema.UserUpdate, account, db: AsyncSession):
+    user.new_password = await bc.hash_password_async(user.new_password)
+    await user_crud.user_update(user,account,db)
+    result = response.CudResponseModel(message="User information has been successfully updated")
+    return result
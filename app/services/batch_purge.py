@@ -0,0 +1,89 @@
+import asyncio
+import logging
+import threading
+import time
+from datetime import datetime
+from app.core import config
+from app.db.database import SessionLocal, AsyncSessionLocal
+
+# 오래된 행을 batch_size 행씩 삭제/커밋하는 정리 작업 (token_purge_service, tombstone_purge_service 에서 사용)
+#  delete(db, batch_size) / delete_async(db, batch_size) 는 한 배치를 삭제/커밋하고 삭제한 행 수를 반환
+logger = logging.getLogger(__name__)
+
+
+class BatchPurge:
+    def __init__(self, name: str, delete, delete_async):
+        self.name = name
+        self.delete = delete
+        self.delete_async = delete_async
+        self._lock = threading.Lock()
+        self._stats = {
+            'rows_purged': 0,
+            'batches': 0,
+            'last_batch_rows': 0,
+            'last_batch_seconds': 0.0,
+            'max_batch_seconds': 0.0,
+            'total_batch_seconds': 0.0,
+            'last_run_at': None,
+        }
+
+    def _record(self, rows: int, elapsed: float):
+        with self._lock:
+            self._stats['rows_purged'] += rows
+            self._stats['batches'] += 1
+            self._stats['last_batch_rows'] = rows
+            self._stats['last_batch_seconds'] = elapsed
+            self._stats['max_batch_seconds'] = max(self._stats['max_batch_seconds'], elapsed)
+            self._stats['total_batch_seconds'] += elapsed
+            self._stats['last_run_at'] = datetime.utcnow()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self._stats)
+
+    def purge_batch(self, batch_size: int) -> int:
+        start = time.perf_counter()
+        with SessionLocal() as db:
+            rows = self.delete(db, batch_size)
+        self._record(rows, time.perf_counter() - start)
+        return rows
+
+    async def purge_batch_async(self, batch_size: int) -> int:
+        start = time.perf_counter()
+        async with AsyncSessionLocal() as db:
+            rows = await self.delete_async(db, batch_size)
+        self._record(rows, time.perf_counter() - start)
+        return rows
+
+    def purge(self, batch_size: int, pause: float) -> int:
+        # 남은 행이 batch_size 보다 적을 때까지 반복 (배치 사이에 pause 초 쉬며 다른 writer 에게 잠금을 양보)
+        total = 0
+        while True:
+            rows = self.purge_batch(batch_size)
+            total += rows
+            if rows < batch_size:
+                return total
+            time.sleep(pause)
+
+    async def purge_async(self, batch_size: int, pause: float) -> int:
+        total = 0
+        while True:
+            if config.DB_BACKEND == 'async':
+                rows = await self.purge_batch_async(batch_size)
+            else:
+                rows = await asyncio.to_thread(self.purge_batch, batch_size)
+            total += rows
+            if rows < batch_size:
+                return total
+            await asyncio.sleep(pause)
+
+    async def run_loop(self, interval: float, batch_size: int, pause: float):
+        while True:
+            try:
+                await self.purge_async(batch_size, pause)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # 다음 주기에 다시 시도
+                logger.exception('%s purge failed', self.name)
+            await asyncio.sleep(interval)
@@ -3,26 +3,138 @@ from app.db.models import Todo
 from app.schemas import todo as td_scheme
 from typing import List, Optional
 from datetime import datetime
+import json
 from app.crud import todo as td_crud
+from app.db.database import SessionLocal
+from app.core import config
+from app.utils import cache as cache_backend
+from app.schemas.enum import TransferFormat
+from app.services import todo_transfer
 
+# 사용자별 read-through 캐시 (tag = user_id) : 목록 페이지 / 단건 / ETag 버전의 Row 를 저장
+# 일정 쓰기(생성/수정/삭제/일괄처리)와 사용자 삭제시 해당 사용자 항목을 모두 무효화
+def build_cache(backend: str = config.TODO_CACHE_BACKEND):
+    return cache_backend.build_cache(backend, config.TODO_CACHE_SIZE, config.TODO_CACHE_TTL, config.TODO_CACHE_USER_ENTRIES)
+
+cache = build_cache()
+
+def cache_lookup(user_id, key: str):
+    # (캐시 값 | None, generation) - generation 을 조회 전에 읽어 두어야 조회 중 무효화된 값을 저장하지 않음
+    if cache is None:
+        return None, None
+    tag = str(user_id)
+    generation = cache.generation(tag)
+    return cache.get(f'{tag}:{key}'), generation
+
+def cache_store(user_id, key: str, value, generation):
+    if cache is not None and value is not None:
+        cache.set(f'{user_id}:{key}', value, tag=str(user_id), generation=generation)
+
+def invalidate_user(user_id):
+    if cache is not None:
+        cache.invalidate_tag(str(user_id))
+
+def cache_stats() -> dict:
+    return cache.stats() if cache is not None else {}
+
+def _cached(user_id, key: str, load):
+    value, generation = cache_lookup(user_id, key)
+    if value is None:
+        value = load()
+        cache_store(user_id, key, value, generation)
+    return value
 
 def create_todo(db: Session, user_id: int, todo_data: td_scheme.TodoCreate):
-    return td_crud.create_todo(db,user_id,todo_data)
+    todo = td_crud.create_todo(db,user_id,todo_data)
+    invalidate_user(user_id)
+    return todo
+
+def get_todos(db: Session, user_id: int, limit: Optional[int] = None, after_id: Optional[int] = None):
+    return _cached(user_id, f'list:{limit}:{after_id}', lambda: td_crud.get_todos(db,user_id,limit,after_id))
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
 
-def get_todos(db: Session, user_id: int):
-    return td_crud.get_todos(db,user_id)
+def todo_to_json_line(todo) -> str:
+    row = {field: getattr(todo, field) for field in td_scheme.TODO_RESPONSE_FIELDS}
+    return json.dumps(row, default=_json_default, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+def stream_todos(user_id: int, title: Optional[str] = None, date: Optional[datetime] = None, batch_size: int = 500, q: Optional[str] = None):
+    # StreamingResponse 는 의존성 세션이 닫힌 뒤 전송되므로 전용 세션을 사용
+    # NDJSON 을 batch_size 줄씩 묶어 전송 (threadpool 왕복 최소화)
+    with SessionLocal() as db:
+        lines = []
+        for todo in td_crud.iter_todos(db, user_id, title, date, batch_size, q):
+            lines.append(todo_to_json_line(todo))
+            if len(lines) >= batch_size:
+                yield ''.join(lines)
+                lines = []
+        if lines:
+            yield ''.join(lines)
+
+def export_todos(user_id: int, format: TransferFormat, batch_size: Optional[int] = None):
+    # stream_todos 와 같이 전용 세션 사용, 서버측 커서에서 batch_size 행씩 변환하여 전송 (메모리 사용량 일정)
+    with SessionLocal() as db:
+        if format == TransferFormat.CSV:
+            yield todo_transfer.csv_header()
+        for rows in td_crud.iter_todo_batches(db, user_id, batch_size or config.TODO_EXPORT_BATCH_SIZE):
+            yield todo_transfer.encode_rows(rows, format)
+
+def import_todos(db: Session, user_id: int, rows: List[dict]) -> int:
+    # 가져오기 chunk 하나 (한 트랜잭션), commit 마다 캐시 무효화
+    count = td_crud.insert_todos(db,user_id,rows)
+    invalidate_user(user_id)
+    return count
+
+def merge_changes(changed: list, deleted: list, current: int, since: Optional[int], limit: int, full: bool) -> dict:
+    # 두 목록을 seq 순으로 합쳐 앞에서 limit 건만 반환, 다음 커서는 포함한 마지막 seq (둘 다 limit + 1 건까지 조회됨)
+    #  남은 변경이 없으면 커서를 조회 직전의 전체 변경 순번(current)까지 올림 - 그 이하의 변경은 모두 읽었으므로
+    #  변경이 없는 사용자의 커서도 삭제 기록 정리 기준보다 뒤처지지 않는다
+    #  전체 목록(since 없음)을 이어 받는 동안은 full 커서 (오래된 일정의 seq 라도 410 으로 끊지 않음)
+    seqs = sorted([row.seq for row in changed] + [row.seq for row in deleted])[:limit]
+    has_more = len(changed) + len(deleted) > limit
+    last = seqs[-1] if seqs else since or 0
+    return {
+        'changed': [row for row in changed if row.seq <= last],
+        'deleted': [row for row in deleted if row.seq <= last],
+        'seq': last if has_more else max(last, current),
+        'has_more': has_more,
+        'full': has_more and (since is None or full),
+    }
+
+def get_changes(db: Session, user_id: int, since: Optional[int], limit: int, full: bool = False) -> Optional[dict]:
+    # since 이후의 삭제 기록이 정리되었으면 None (전체 재동기화 필요)
+    rows = td_crud.get_changes(db,user_id,since,limit,full)
+    return merge_changes(*rows, since, limit, full) if rows is not None else None
+
+def get_todos_version(db: Session, user_id: int):
+    return _cached(user_id, 'version', lambda: td_crud.get_todos_version(db,user_id))
 
 def get_todo_by_id(db: Session, todo_id: int, user_id: int):
-    return td_crud.get_todo_by_id(db,todo_id,user_id)
+    return _cached(user_id, f'item:{todo_id}', lambda: td_crud.get_todo_row(db,todo_id,user_id))
+
+def get_todos_in_range(db: Session, user_id: int, date_from: datetime, date_to: datetime, limit: Optional[int] = None, after: Optional[tuple] = None):
+    return td_crud.get_todos_in_range(db,user_id,date_from,date_to,limit,after)
 
 def update_todo(db: Session, todo_id: int, user_id: int, update_data: td_scheme.TodoUpdate):
     todo = td_crud.update_todo(db,todo_id,user_id,update_data)
+    invalidate_user(user_id)
     return todo
 
+def apply_batch(db: Session, user_id: int, operations: List[td_scheme.TodoBatchOperation]):
+    results = td_crud.apply_batch(db,user_id,operations)
+    invalidate_user(user_id)
+    return td_scheme.TodoBatchResponse(results=results)
+
 def delete_todo(db: Session, todo_id: int, user_id: int):
     result = td_crud.delete_todo(db,todo_id,user_id)
+    invalidate_user(user_id)
     return result
 
-def search_todos(db: Session, user_id: int, title: Optional[str],date:Optional[datetime]):
-    return td_crud.search_todos(db,user_id,title,date)
-        
+def search_todos(db: Session, user_id: int, title: Optional[str],date:Optional[datetime], limit: Optional[int] = None, after_id: Optional[int] = None):
+    return td_crud.search_todos(db,user_id,title,date,limit,after_id)
+
+def full_text_search(db: Session, user_id: int, q: str, date: Optional[datetime] = None, limit: Optional[int] = None, after: Optional[dict] = None, title: Optional[str] = None):
+    return td_crud.full_text_search(db,user_id,q,date,limit,after,title)
@@ -0,0 +1,165 @@
+import codecs
+import csv
+import io
+from datetime import datetime, timezone
+import orjson
+from app.core import config
+from app.schemas import todo as td_scheme
+from app.schemas.enum import TransferFormat
+
+# 일정 내보내기/가져오기 형식 변환 (ndjson | csv)
+#  내보내기는 TodoResponse 필드 순서, 가져오기는 to_row 의 필드만 사용 (id, user_id 는 새로 부여)
+MEDIA_TYPES = {TransferFormat.NDJSON: 'application/x-ndjson', TransferFormat.CSV: 'text/csv; charset=utf-8'}
+
+
+class InvalidImport(ValueError):
+    # 본문 전체를 처리할 수 없는 경우 (csv 헤더 오류 등) -> 400
+    pass
+
+
+def _csv_value(value):
+    if value is None:
+        return ''
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+def csv_header() -> bytes:
+    return (','.join(td_scheme.TODO_RESPONSE_FIELDS) + '\n').encode('utf-8')
+
+def encode_rows(rows, format: TransferFormat) -> bytes:
+    if format == TransferFormat.CSV:
+        buffer = io.StringIO()
+        csv.writer(buffer, lineterminator='\n').writerows([_csv_value(value) for value in row] for row in rows)
+        return buffer.getvalue().encode('utf-8')
+    fields = td_scheme.TODO_RESPONSE_FIELDS
+    return b''.join(orjson.dumps(dict(zip(fields, row)), option=orjson.OPT_APPEND_NEWLINE) for row in rows)
+
+
+def _datetime(value):
+    if value is None or value == '':
+        return None
+    if not isinstance(value, str):
+        raise ValueError('datetime must be an ISO 8601 string')
+    parsed = datetime.fromisoformat(value)
+    # 저장된 일시는 UTC naive 이므로 offset 이 있으면 변환
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+def _text(value):
+    if value is None or value == '':
+        return None
+    if not isinstance(value, str):
+        raise ValueError('text fields must be strings')
+    return value
+
+def to_row(data: dict) -> dict:
+    title = data.get('title')
+    if not isinstance(title, str) or not title.strip():
+        raise ValueError('title is required')
+    complete = data.get('complete')
+    return {
+        'title': title,
+        'description': _text(data.get('description')),
+        'todo_date': _datetime(data.get('todo_date')),
+        'complete': 0 if complete is None or complete == '' else int(complete),
+        'created_at': _datetime(data.get('created_at')),
+        'updated_at': _datetime(data.get('updated_at')),
+    }
+
+
+class ImportParser:
+    # 업로드 본문을 조각(chunk) 단위로 받아 완성된 줄/레코드만 파싱 (본문 전체를 메모리에 올리지 않음)
+    # 형식이 잘못된 행은 건너뛰고 줄 번호와 사유를 기록
+    def __init__(self, format: TransferFormat):
+        self.format = format
+        self._decoder = codecs.getincrementaldecoder('utf-8-sig')(errors='replace')
+        self._pending = ''
+        self._record = []      # csv : 따옴표 안 줄바꿈으로 이어지는 레코드의 줄들
+        self._quotes = 0
+        self._header = None
+        self.line = 0
+        self.skipped = 0
+        self.errors = []
+
+    def feed(self, chunk: bytes) -> list:
+        lines = (self._pending + self._decoder.decode(chunk)).split('\n')
+        self._pending = lines.pop()
+        return self._parse_lines(lines)
+
+    def close(self) -> list:
+        text = self._pending + self._decoder.decode(b'', final=True)
+        self._pending = ''
+        rows = self._parse_lines([text] if text else [])
+        if self._record:
+            self._skip(self.line - len(self._record) + 1, 'unterminated quoted field')
+            self._record = []
+        return rows
+
+    def _parse_lines(self, lines) -> list:
+        rows = []
+        for line in lines:
+            self.line += 1
+            line = line.rstrip('\r')
+            if self.format == TransferFormat.CSV:
+                # 따옴표 수가 홀수면 필드 안의 줄바꿈 -> 다음 줄과 이어서 파싱
+                self._record.append(line)
+                self._quotes += line.count('"')
+                if self._quotes % 2:
+                    continue
+                start = self.line - len(self._record) + 1
+                record, self._record, self._quotes = '\n'.join(self._record), [], 0
+                if not record.strip():
+                    continue
+                data = self._csv_record(record)
+            else:
+                start = self.line
+                if not line.strip():
+                    continue
+                try:
+                    data = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    self._skip(start, 'invalid JSON')
+                    continue
+                if not isinstance(data, dict):
+                    self._skip(start, 'expected a JSON object')
+                    continue
+            if data is None:
+                continue
+            try:
+                rows.append(to_row(data))
+            except (TypeError, ValueError) as e:
+                self._skip(start, str(e))
+        return rows
+
+    def _csv_record(self, record: str):
+        values = next(csv.reader([record]))
+        if self._header is None:
+            self._header = [name.strip() for name in values]
+            if 'title' not in self._header:
+                raise InvalidImport('CSV header must include a title column')
+            return None
+        return dict(zip(self._header, values))
+
+    def _skip(self, line: int, detail: str):
+        self.skipped += 1
+        if len(self.errors) < config.TODO_IMPORT_MAX_ERRORS:
+            self.errors.append(td_scheme.TodoImportError(line=line, detail=detail))
+
+
+async def import_stream(chunks, format: TransferFormat, insert, chunk_rows: int | None = None) -> td_scheme.TodoImportResponse:
+    # chunks : 본문 bytes 조각 (request.stream()), insert : chunk_rows 행씩 저장하는 async 함수 (한 트랜잭션)
+    chunk_rows = chunk_rows or config.TODO_IMPORT_CHUNK_ROWS
+    parser = ImportParser(format)
+    pending = []
+    imported = 0
+    async for chunk in chunks:
+        pending.extend(parser.feed(chunk))
+        while len(pending) >= chunk_rows:
+            imported += await insert(pending[:chunk_rows])
+            del pending[:chunk_rows]
+    pending.extend(parser.close())
+    if pending:
+        imported += await insert(pending)
+    return td_scheme.TodoImportResponse(imported=imported, skipped=parser.skipped, errors=parser.errors)
@@ -0,0 +1,30 @@
+from datetime import datetime
+from app.core import config
+from app.crud import auth as auth_crud
+from app.crud import async_auth as async_auth_crud
+from app.services.batch_purge import BatchPurge
+
+# 만료된 refresh token(users_token) 정리
+_purge = BatchPurge(
+    'expired token',
+    lambda db, batch_size: auth_crud.purge_expired_tokens(db, datetime.utcnow(), batch_size),
+    lambda db, batch_size: async_auth_crud.purge_expired_tokens(db, datetime.utcnow(), batch_size),
+)
+
+def stats() -> dict:
+    return _purge.stats()
+
+def purge_batch(batch_size: int = config.TOKEN_PURGE_BATCH_SIZE) -> int:
+    return _purge.purge_batch(batch_size)
+
+async def purge_batch_async(batch_size: int = config.TOKEN_PURGE_BATCH_SIZE) -> int:
+    return await _purge.purge_batch_async(batch_size)
+
+def purge_expired_tokens(batch_size: int = config.TOKEN_PURGE_BATCH_SIZE, pause: float = config.TOKEN_PURGE_BATCH_PAUSE) -> int:
+    return _purge.purge(batch_size, pause)
+
+async def purge_expired_tokens_async(batch_size: int = config.TOKEN_PURGE_BATCH_SIZE, pause: float = config.TOKEN_PURGE_BATCH_PAUSE) -> int:
+    return await _purge.purge_async(batch_size, pause)
+
+async def run_purge_loop(interval: float = config.TOKEN_PURGE_INTERVAL):
+    await _purge.run_loop(interval, config.TOKEN_PURGE_BATCH_SIZE, config.TOKEN_PURGE_BATCH_PAUSE)
@@ -0,0 +1,36 @@
+from datetime import datetime, timedelta
+from app.core import config
+from app.crud import todo as td_crud
+from app.crud import async_todo as async_td_crud
+from app.services.batch_purge import BatchPurge
+
+# 보관기간(TOMBSTONE_RETENTION_DAYS)이 지난 삭제 기록(todo_tombstone) 정리
+#  정리한 최대 seq 는 todo_change_seq.purged 에 남아, 그보다 오래된 GET /todos/changes 커서는 410 (전체 재동기화)
+
+def cutoff(now: datetime | None = None) -> datetime:
+    # deleted_at 은 SQLite CURRENT_TIMESTAMP (UTC)
+    return (now or datetime.utcnow()) - timedelta(days=config.TOMBSTONE_RETENTION_DAYS)
+
+_purge = BatchPurge(
+    'todo tombstone',
+    lambda db, batch_size: td_crud.purge_tombstones(db, cutoff(), batch_size),
+    lambda db, batch_size: async_td_crud.purge_tombstones(db, cutoff(), batch_size),
+)
+
+def stats() -> dict:
+    return _purge.stats()
+
+def purge_batch(batch_size: int = config.TOMBSTONE_PURGE_BATCH_SIZE) -> int:
+    return _purge.purge_batch(batch_size)
+
+async def purge_batch_async(batch_size: int = config.TOMBSTONE_PURGE_BATCH_SIZE) -> int:
+    return await _purge.purge_batch_async(batch_size)
+
+def purge_tombstones(batch_size: int = config.TOMBSTONE_PURGE_BATCH_SIZE, pause: float = config.TOMBSTONE_PURGE_BATCH_PAUSE) -> int:
+    return _purge.purge(batch_size, pause)
+
+async def purge_tombstones_async(batch_size: int = config.TOMBSTONE_PURGE_BATCH_SIZE, pause: float = config.TOMBSTONE_PURGE_BATCH_PAUSE) -> int:
+    return await _purge.purge_async(batch_size, pause)
+
+async def run_purge_loop(interval: float = config.TOMBSTONE_PURGE_INTERVAL):
+    await _purge.run_loop(interval, config.TOMBSTONE_PURGE_BATCH_SIZE, config.TOMBSTONE_PURGE_BATCH_PAUSE)
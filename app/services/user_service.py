@@ -9,6 +9,7 @@ from app.utils import bcrypt as bc
 from app.utils import jwt_handler as jwt
 from datetime import datetime
 from app.schemas import  enum as valid
+from app.services import todo_service
 
 def get_user(db,email:str):
     return user_crud.get_user(db,email)
@@ -27,8 +28,19 @@ def validate_login_and_get_user(db: Session, user: user_schema.Login) -> tuple[v
         return valid.LoginValidationResult.INVALID_PASSWORD, None
     return valid.LoginValidationResult.OK, account
 
+def access_token_claims(account, device_id) -> dict:
+    # email/ver 클레임 : stateless 모드에서 users 행 조회 없이 인증 (app/api/deps.py)
+    return {"sub": str(account.id), "device_id": str(device_id), "email": account.email, "ver": account.token_version or 0}
+
 def login(db: Session, user: user_schema.Login, account):
-    access_token = jwt.create_access_token(data={"sub": str(account.id), "device_id": str(user.device_id)})
+    if bc.needs_rehash(account.password):
+        # 해시 정책이 바뀐 경우 평문을 알고 있는 지금 재해시 (바쁘면 다음 로그인으로 미룸)
+        #  로그인에서만 수행 - 암호를 확인하는 수정/삭제 요청이 쓰기 트랜잭션과 해시 비용을 떠안지 않도록
+        try:
+            user_crud.update_password(db, account, bc.hash_password(user.password))
+        except bc.PasswordHasherBusy:
+            pass
+    access_token = jwt.create_access_token(data=access_token_claims(account, user.device_id))
     refresh_token_dict = jwt.create_refresh_token(data={"sub": str(account.id), "device_id": str(user.device_id)})
     refresh_token_info = au.refresh_token_info(**refresh_token_dict)
 
@@ -46,6 +58,8 @@ def login(db: Session, user: user_schema.Login, account):
         
 def delete_user(id:int,email:str,password:str,db:Session):
         cnt = user_crud.delete_user(id,db)
+        # cascade 로 삭제된 일정의 캐시 항목 정리
+        todo_service.invalidate_user(id)
         result = response.CudResponseModel(message="User deleted")
         return result 
 
@@ -67,7 +81,7 @@ def validate_refresh_token(refresh_token: str, db: Session):
     if stored_token is None:
         return valid.RefreshValidationResult.NOT_FOUND, None, None
 
-    if stored_token.refresh_token != refresh_token:
+    if not jwt.token_matches(refresh_token, stored_token.refresh_token_hash):
         return valid.RefreshValidationResult.INVALID, None, None
 
     if datetime.utcnow() > stored_token.expired_at:
@@ -76,8 +90,9 @@ def validate_refresh_token(refresh_token: str, db: Session):
     return valid.RefreshValidationResult.VALID, user_id, device_id
 
 
-def refresh(user_id:int,device_id:str):
-    result = au.response_refresh(access_token=jwt.create_access_token(data={"sub" : str(user_id),"device_id" : str(device_id)}) )
+def refresh(user_id:int,device_id:str,db:Session):
+    account = user_crud.get_user_by_id(db, user_id)
+    result = au.response_refresh(access_token=jwt.create_access_token(data=access_token_claims(account, device_id)) )
     return result
     #return {"access_token": jwt.create_access_token(data={"sub" : str(user_id),"device_id" : device_id})}
 
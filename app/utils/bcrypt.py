@@ -1,7 +1,106 @@
-import bcrypt
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from app.core import config, metrics, request_context
+from app.utils import hasher
 
+
+class PasswordHasherBusy(Exception):
+    # 해시 작업 대기열이 가득 찬 경우 -> 503
+    def __init__(self, retry_after: int):
+        super().__init__('password hasher is busy')
+        self.retry_after = retry_after
+
+# bcrypt / hashlib.scrypt 는 GIL 을 놓고 계산하므로 스레드 풀로 충분
+#  sync 라우터는 결과를 기다리는 동안 anyio threadpool 스레드(기본 40개)를 하나씩 잡고 있으므로
+#  동시에 받는 해시 작업(WORKERS + QUEUE_LIMIT)을 threadpool 크기보다 충분히 작게 유지해야 다른 sync 요청이 굶지 않는다
+#  (기본 4 + 4 = 8, 넘치면 대기하지 않고 503)
+_executor = ThreadPoolExecutor(max_workers=config.PASSWORD_HASH_WORKERS, thread_name_prefix='password-hash')
+_limit = config.PASSWORD_HASH_WORKERS + config.PASSWORD_HASH_QUEUE_LIMIT
+_lock = threading.Lock()
+_in_flight = 0
+_rejected = 0
+
+def _release():
+    global _in_flight
+    with _lock:
+        _in_flight -= 1
+
+def _run(fn, *args):
+    # 결과가 전달되기 전에 자리를 반환
+    try:
+        return fn(*args)
+    finally:
+        _release()
+
+def _release_cancelled(future):
+    # 실행 전에 취소된 작업 (async 요청 취소 시 wrap_future 가 전파) 은 _run 이 호출되지 않음
+    if future.cancelled():
+        _release()
+
+def _submit(fn, *args):
+    global _in_flight, _rejected
+    with _lock:
+        if _in_flight >= _limit:
+            _rejected += 1
+            raise PasswordHasherBusy(config.PASSWORD_HASH_RETRY_AFTER)
+        _in_flight += 1
+    try:
+        future = _executor.submit(_run, fn, *args)
+    except BaseException:
+        _release()
+        raise
+    future.add_done_callback(_release_cancelled)
+    return future
+
+def check_capacity():
+    # 대기열이 가득 찼으면 DB 조회 전에 거부 (암호 검증 route 입구에서 호출, 자리를 잡지는 않음)
+    global _rejected
+    with _lock:
+        if _in_flight >= _limit:
+            _rejected += 1
+            raise PasswordHasherBusy(config.PASSWORD_HASH_RETRY_AFTER)
+
+def _hash_password(password: str) -> str:
+    start = time.perf_counter()
+    try:
+        return hasher.current_hasher.hash(password)
+    finally:
+        metrics.PASSWORD_HASH_SECONDS.observe(time.perf_counter() - start, operation='hash')
+
+def _verify_password(plain_password: str, hashed_password: str) -> bool:
+    start = time.perf_counter()
+    try:
+        return hasher.identify(hashed_password).verify(plain_password, hashed_password)
+    finally:
+        metrics.PASSWORD_HASH_SECONDS.observe(time.perf_counter() - start, operation='verify')
+
+# 저장된 해시가 현재 정책(scheme/비용)과 다른지 여부 - 해시 계산 없이 문자열만 확인
+def needs_rehash(hashed_password: str) -> bool:
+    return hasher.needs_rehash(hashed_password)
+
+# request 의 password_hash 구간은 대기열 대기 + 계산 시간
 def hash_password(password: str) -> str:
-    return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt()).decode('utf-8')
+    with request_context.phase('password_hash'):
+        return _submit(_hash_password, password).result()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
\ No newline at end of file
+    with request_context.phase('password_hash'):
+        return _submit(_verify_password, plain_password, hashed_password).result()
+
+async def hash_password_async(password: str) -> str:
+    with request_context.phase('password_hash'):
+        return await asyncio.wrap_future(_submit(_hash_password, password))
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    with request_context.phase('password_hash'):
+        return await asyncio.wrap_future(_submit(_verify_password, plain_password, hashed_password))
+
+def stats() -> dict:
+    return {
+        'workers': config.PASSWORD_HASH_WORKERS,
+        'queue_limit': config.PASSWORD_HASH_QUEUE_LIMIT,
+        'in_flight': _in_flight,
+        'rejected': _rejected,
+    }
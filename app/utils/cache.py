@@ -0,0 +1,180 @@
+import pickle
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class CacheBackend(ABC):
+    # 캐시 백엔드 인터페이스 (tag : 함께 무효화할 항목 묶음, generation : tag 무효화 횟수)
+
+    @abstractmethod
+    def get(self, key, default=None):
+        ...
+
+    @abstractmethod
+    def set(self, key, value, ttl: float | None = None, tag=None, generation: int | None = None):
+        ...
+
+    @abstractmethod
+    def delete(self, key):
+        ...
+
+    @abstractmethod
+    def generation(self, tag) -> int:
+        ...
+
+    @abstractmethod
+    def invalidate_tag(self, tag) -> int:
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    @abstractmethod
+    def stats(self) -> dict:
+        ...
+
+
+class TTLCache(CacheBackend):
+    # 크기 제한(LRU) + 항목별 만료시간을 가지는 스레드 안전 캐시 (프로세스 내 기본 백엔드)
+    # tag 로 묶인 항목은 invalidate_tag 로 한번에 무효화, maxsize_per_tag 로 tag 별 항목 수도 제한(LRU)
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0, maxsize_per_tag: int | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.maxsize_per_tag = maxsize_per_tag
+        self._data = OrderedDict()  # key -> (value, expires_at, tag)
+        self._tags = {}             # tag -> {key: None} (사용 순서)
+        self._generations = {}      # tag -> 무효화 횟수
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, expires_at, tag = entry
+            if expires_at <= time.monotonic():
+                self._remove(key)
+                self.expirations += 1
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            if tag is not None:
+                keys = self._tags[tag]
+                del keys[key]
+                keys[key] = None
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl: float | None = None, tag=None, generation: int | None = None):
+        ttl = self.ttl if ttl is None else min(ttl, self.ttl)
+        if self.maxsize <= 0 or ttl <= 0:
+            return
+        with self._lock:
+            # 조회 도중 무효화가 일어났다면 오래된 값을 저장하지 않는다
+            if generation is not None and self._generations.get(tag, 0) != generation:
+                return
+            if key in self._data:
+                self._remove(key)
+            self._data[key] = (value, time.monotonic() + ttl, tag)
+            if tag is not None:
+                keys = self._tags.setdefault(tag, {})
+                keys[key] = None
+                if self.maxsize_per_tag is not None and len(keys) > self.maxsize_per_tag:
+                    self._remove(next(iter(keys)))
+                    self.evictions += 1
+            while len(self._data) > self.maxsize:
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def generation(self, tag) -> int:
+        with self._lock:
+            return self._generations.get(tag, 0)
+
+    def invalidate_tag(self, tag) -> int:
+        with self._lock:
+            self._generations[tag] = self._generations.get(tag, 0) + 1
+            keys = self._tags.pop(tag, {})
+            for key in keys:
+                self._data.pop(key, None)
+            self.invalidations += len(keys)
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._tags.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'size': len(self._data),
+                'maxsize': self.maxsize,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': self.hits / lookups if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations,
+            }
+
+    def _remove(self, key):
+        value, expires_at, tag = self._data.pop(key)
+        if tag is not None:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.pop(key, None)
+                if not keys:
+                    del self._tags[tag]
+
+
+class SerializingCache(CacheBackend):
+    # 공유 캐시(Redis 등) 로컬 대역 : 값을 pickle 바이트로 저장하여 프로세스 밖 저장소처럼
+    # 저장/조회 때마다 복사본이 오가게 한다 (호출측이 캐시된 객체를 공유한다고 가정하지 못하도록)
+    def __init__(self, store: CacheBackend):
+        self.store = store
+
+    def get(self, key, default=None):
+        data = self.store.get(key)
+        return default if data is None else pickle.loads(data)
+
+    def set(self, key, value, ttl: float | None = None, tag=None, generation: int | None = None):
+        self.store.set(key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), ttl, tag, generation)
+
+    def delete(self, key):
+        self.store.delete(key)
+
+    def generation(self, tag) -> int:
+        return self.store.generation(tag)
+
+    def invalidate_tag(self, tag) -> int:
+        return self.store.invalidate_tag(tag)
+
+    def clear(self):
+        self.store.clear()
+
+    def stats(self) -> dict:
+        return self.store.stats()
+
+
+def build_cache(backend: str, maxsize: int, ttl: float, maxsize_per_tag: int | None = None) -> CacheBackend | None:
+    # 'memory'(프로세스 내 LRU) | 'shared'(공유 캐시 로컬 대역 - 값 직렬화) | 'none'
+    if backend == 'none':
+        return None
+    store = TTLCache(maxsize=maxsize, ttl=ttl, maxsize_per_tag=maxsize_per_tag)
+    return SerializingCache(store) if backend == 'shared' else store
@@ -0,0 +1,114 @@
+import base64
+import hashlib
+import hmac
+import os
+from abc import ABC, abstractmethod
+import bcrypt
+from app.core import config
+
+
+class PasswordHasher(ABC):
+    scheme = ''
+
+    @abstractmethod
+    def hash(self, password: str) -> str:
+        ...
+
+    @abstractmethod
+    def verify(self, password: str, hashed: str) -> bool:
+        ...
+
+    @abstractmethod
+    def identify(self, hashed: str) -> bool:
+        ...
+
+    @abstractmethod
+    def needs_rehash(self, hashed: str) -> bool:
+        ...
+
+
+class BcryptHasher(PasswordHasher):
+    # $2b$<rounds>$<salt+hash>
+    scheme = 'bcrypt'
+
+    def __init__(self, rounds: int = 12):
+        self.rounds = rounds
+
+    def hash(self, password: str) -> str:
+        return bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt(self.rounds)).decode('utf-8')
+
+    def verify(self, password: str, hashed: str) -> bool:
+        return bcrypt.checkpw(password.encode('utf-8'), hashed.encode('utf-8'))
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith(('$2a$', '$2b$', '$2y$'))
+
+    def needs_rehash(self, hashed: str) -> bool:
+        return int(hashed.split('$')[2]) != self.rounds
+
+
+class ScryptHasher(PasswordHasher):
+    # $scrypt$ln=<log2 N>,r=<r>,p=<p>$<salt>$<hash>
+    scheme = 'scrypt'
+    salt_size = 16
+    key_size = 32
+
+    def __init__(self, ln: int = 14, r: int = 8, p: int = 1):
+        self.ln = ln
+        self.r = r
+        self.p = p
+
+    def hash(self, password: str) -> str:
+        salt = os.urandom(self.salt_size)
+        key = self._derive(password, salt, self.ln, self.r, self.p)
+        return f'$scrypt$ln={self.ln},r={self.r},p={self.p}${_b64encode(salt)}${_b64encode(key)}'
+
+    def verify(self, password: str, hashed: str) -> bool:
+        (ln, r, p), salt, key = self._parse(hashed)
+        return hmac.compare_digest(self._derive(password, salt, ln, r, p), key)
+
+    def identify(self, hashed: str) -> bool:
+        return hashed.startswith('$scrypt$')
+
+    def needs_rehash(self, hashed: str) -> bool:
+        params, salt, key = self._parse(hashed)
+        return params != (self.ln, self.r, self.p)
+
+    def _derive(self, password: str, salt: bytes, ln: int, r: int, p: int) -> bytes:
+        n = 1 << ln
+        return hashlib.scrypt(password.encode('utf-8'), salt=salt, n=n, r=r, p=p,
+                              maxmem=129 * n * r * p + 1024 * 1024, dklen=self.key_size)
+
+    def _parse(self, hashed: str):
+        _, _, params, salt, key = hashed.split('$')
+        values = dict(item.split('=') for item in params.split(','))
+        return (int(values['ln']), int(values['r']), int(values['p'])), _b64decode(salt), _b64decode(key)
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode('ascii').rstrip('=')
+
+def _b64decode(data: str) -> bytes:
+    return base64.b64decode(data + '=' * (-len(data) % 4))
+
+
+def build_hasher(scheme: str = config.PASSWORD_HASH_SCHEME) -> PasswordHasher:
+    if scheme == 'bcrypt':
+        return BcryptHasher(rounds=config.BCRYPT_ROUNDS)
+    if scheme == 'scrypt':
+        return ScryptHasher(ln=config.SCRYPT_LN, r=config.SCRYPT_R, p=config.SCRYPT_P)
+    raise ValueError(f'Unknown password hash scheme: {scheme}')
+
+# 현재 정책 hasher + 기존 해시 검증용 hasher 목록
+current_hasher = build_hasher()
+hashers = [current_hasher] + [h for h in (BcryptHasher(config.BCRYPT_ROUNDS), ScryptHasher(config.SCRYPT_LN, config.SCRYPT_R, config.SCRYPT_P)) if h.scheme != current_hasher.scheme]
+
+def identify(hashed: str) -> PasswordHasher:
+    for hasher in hashers:
+        if hasher.identify(hashed):
+            return hasher
+    raise ValueError('Unknown password hash format')
+
+def needs_rehash(hashed: str) -> bool:
+    hasher = identify(hashed)
+    return hasher is not current_hasher or current_hasher.needs_rehash(hashed)
@@ -1,6 +1,11 @@
 from jose import JWTError,jwt
 from datetime import datetime,timedelta
+import hashlib
+import hmac
+import logging
+from app.core import request_context
 
+logger = logging.getLogger(__name__)
 
 SECRET_KEY = 'my-secret-key'
 ALGORITHM = 'HS256'
@@ -14,7 +19,8 @@ def create_access_token(data: dict, expires_delta: timedelta | None = None) -> s
     to_encode.update({'exp': expire})
     #print(f"ddddbbbbbcvdfvdv: {data.get('device_id')}")
     to_encode.update({'device_id' : data['device_id']})
-    return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
+    with request_context.phase('jwt'):
+        return jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
 
 # Refresh Token 생성
 def create_refresh_token(data: dict, expires_delta: timedelta | None = None) -> dict:
@@ -22,13 +28,21 @@ def create_refresh_token(data: dict, expires_delta: timedelta | None = None) ->
     expire = datetime.utcnow() + (expires_delta or timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES))
     #to_encode.update({'exp': expire})
     to_encode.update({'device_id' : data['device_id']})
-    return {"refresh_token" : jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM),"expired_at" : expire }
+    with request_context.phase('jwt'):
+        return {"refresh_token" : jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM),"expired_at" : expire }
 
 # 토큰 디코딩
 def decode_token(token: str) -> dict:
     # 'bearer ' 문자열 제거 (대소문자 구분 없음)
     if token.lower().startswith("bearer "):
         token = token[7:]
-        print('디코딩')
-    return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        logger.debug('bearer prefix stripped before decoding')
+    with request_context.phase('jwt'):
+        return jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
 
+# refresh_token 저장/비교용 고정 길이 해시
+def hash_token(token: str) -> str:
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+def token_matches(token: str, token_hash: str) -> bool:
+    return hmac.compare_digest(hash_token(token), token_hash or '')
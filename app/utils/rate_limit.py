@@ -0,0 +1,68 @@
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class RateLimitStore(ABC):
+    # 요청 한도 저장소 인터페이스 (key 별 token bucket)
+
+    @abstractmethod
+    def hit(self, key, capacity: float, refill_per_second: float, cost: float = 1.0) -> float:
+        # 허용되면 0, 거부되면 다시 시도할 수 있을 때까지 남은 초
+        ...
+
+    @abstractmethod
+    def clear(self):
+        ...
+
+    @abstractmethod
+    def stats(self) -> dict:
+        ...
+
+
+class MemoryRateLimitStore(RateLimitStore):
+    # 프로세스 내 token bucket 저장소, key 수는 maxsize 로 제한(LRU)
+    # evict 된 key 는 가득 찬 bucket 으로 다시 시작하므로 maxsize 는 한 창(window) 동안의 활성 key 수보다 크게 잡는다
+    def __init__(self, maxsize: int = 100000):
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()  # key -> (남은 token, 갱신 시각)
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.rejected = 0
+        self.evictions = 0
+
+    def hit(self, key, capacity: float, refill_per_second: float, cost: float = 1.0) -> float:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._buckets.pop(key, None)
+            if entry is None:
+                tokens = capacity
+            else:
+                tokens = min(capacity, entry[0] + (now - entry[1]) * refill_per_second)
+            if tokens >= cost:
+                tokens -= cost
+                retry_after = 0.0
+                self.allowed += 1
+            else:
+                retry_after = (cost - tokens) / refill_per_second
+                self.rejected += 1
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+                self.evictions += 1
+            return retry_after
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                'size': len(self._buckets),
+                'maxsize': self.maxsize,
+                'allowed': self.allowed,
+                'rejected': self.rejected,
+                'evictions': self.evictions,
+            }
@@ -0,0 +1,79 @@
+# FastAPI_JWT_Sample/benchmarks/bench_crud_statements.py
+# 인증/일정 핫패스 조회의 호출당 시간 (us) : 이전 방식(매 호출 db.query(...).filter(...) 생성) vs 미리 만든 select() 재사용
+#   python -m benchmarks.bench_crud_statements --iterations 20000
+#   같은 세션/DB 에서 번갈아 측정하므로 차이는 문 생성 + cache key 계산 등 Python 쪽 비용이다
+
+import argparse
+import os
+import tempfile
+import time
+
+def per_call_us(fn, iterations: int) -> float:
+    fn()  # warm-up (컴파일 캐시 적재)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+def run(args):
+    from datetime import datetime
+    from sqlalchemy import insert
+    from app.db.database import Base, engine, SessionLocal
+    from app.db.models import Todo, User, User_Token
+    from app.crud import user as user_crud, auth as auth_crud, todo as td_crud
+    from app.core import metrics
+
+    Base.metadata.create_all(bind=engine)
+    now = datetime(2025, 5, 13, 9, 0, 0)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{'id': 1, 'email': 'bench@example.com', 'name': 'bench', 'password': 'x'}])
+        conn.execute(insert(User_Token), [{'user_id': 1, 'device_id': 'bench', 'login_type': 'local',
+                                           'refresh_token_hash': 'h', 'expired_at': now}])
+        conn.execute(insert(Todo), [{'user_id': 1, 'title': f'todo {n}', 'todo_date': now, 'complete': 0, 'created_at': now}
+                                    for n in range(args.todos)])
+
+    # 이전 구현 (legacy Query 체인)
+    legacy = {
+        'get_user': lambda db: db.query(User).filter(User.email == 'bench@example.com').first(),
+        'get_user_by_id': lambda db: db.query(User).filter(User.id == 1).first(),
+        'get_refresh_token': lambda db: db.query(User_Token).filter(User_Token.user_id == 1, User_Token.device_id == 'bench').first(),
+        'get_todo_by_id': lambda db: db.query(Todo).filter(Todo.id == 1, Todo.user_id == 1).first(),
+        'get_todos': lambda db: db.execute(td_crud.todos_statement(1, limit=args.page_size, columns=td_crud.TODO_COLUMNS)).all(),
+    }
+    cached = {
+        'get_user': lambda db: user_crud.get_user(db, 'bench@example.com'),
+        'get_user_by_id': lambda db: user_crud.get_user_by_id(db, 1),
+        'get_refresh_token': lambda db: auth_crud.get_refresh_token(1, 'bench', db),
+        'get_todo_by_id': lambda db: td_crud.get_todo_by_id(db, 1, 1),
+        'get_todos': lambda db: td_crud.get_todos(db, 1, args.page_size),
+    }
+
+    print(f'iterations={args.iterations} todos={args.todos} page_size={args.page_size}')
+    print(f'{"query":<20} {"legacy us":>10} {"cached us":>10} {"saved us":>10}')
+    with SessionLocal() as db:
+        for name in legacy:
+            assert legacy[name](db) == cached[name](db)
+            before = per_call_us(lambda: legacy[name](db), args.iterations)
+            after = per_call_us(lambda: cached[name](db), args.iterations)
+            print(f'{name:<20} {before:>10.1f} {after:>10.1f} {before - after:>10.1f}')
+
+    hits = metrics.DB_COMPILE_CACHE.value(result='hit')
+    misses = metrics.DB_COMPILE_CACHE.value(result='miss')
+    print(f'compiled cache hit rate : {hits / max(hits + misses, 1):.4f} (hit={hits:g} miss={misses:g})')
+    engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--iterations', type=int, default=20000)
+    parser.add_argument('--todos', type=int, default=100)
+    parser.add_argument('--page-size', type=int, default=20)
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        # app 모듈 import 전에 설정 (benchmarks.run 과 같음)
+        os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(tmp, "bench.db")}'
+        os.environ.pop('ASYNC_DATABASE_URL', None)
+        os.environ['TOKEN_PURGE_ENABLED'] = 'false'
+        run(args)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,70 @@
+# FastAPI_JWT_Sample/benchmarks/bench_list_serialization.py
+# 일정 목록 응답 : ORM 객체 + TodoResponse 검증(이전) vs 컬럼 Row 튜플 + ORJSONResponse(현재) 행당 비용
+#   python -m benchmarks.bench_list_serialization --rows 20000 --page-sizes 50 1000 10000
+
+import argparse
+import asyncio
+import os
+import statistics
+import tempfile
+import time
+from typing import List
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.orm import Session
+from app.api import responses
+from app.crud import todo as td_crud
+from app.db.database import Base
+from app.db import models
+from app.schemas import todo as td_scheme
+
+def seed(engine, rows: int):
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [{'id': 1, 'email': 'user1@example.com', 'name': 'user1', 'password': 'x'}])
+        conn.execute(insert(models.Todo), [{'user_id': 1, 'title': f'todo {n} 회의', 'description': 'list serialization benchmark',
+                                            'todo_date': None, 'complete': n % 2} for n in range(rows)])
+
+def orm_path(db: Session, field, loop, limit: int) -> bytes:
+    todos = db.scalars(select(models.Todo).where(models.Todo.user_id == 1).order_by(models.Todo.id).limit(limit)).all()
+    return JSONResponse(loop.run_until_complete(serialize_response(field=field, response_content=todos))).body
+
+def rows_path(db: Session, limit: int) -> bytes:
+    return responses.todo_rows(td_crud.get_todos(db, 1, limit), Response()).body
+
+def timed(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=20000)
+    parser.add_argument('--page-sizes', type=int, nargs='+', default=[50, 1000, 10000])
+    parser.add_argument('--repeat', type=int, default=20)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f'sqlite:///{os.path.join(tmp, "bench.db")}')
+        Base.metadata.create_all(bind=engine)
+        seed(engine, args.rows)
+        field = create_model_field(name='Response_todos', type_=List[td_scheme.TodoResponse], mode='serialization')
+        loop = asyncio.new_event_loop()
+        print(f'{"page":>7} {"orm+model us/row":>17} {"rows+orjson us/row":>19} {"speedup":>8}')
+        with Session(engine) as db:
+            for limit in args.page_sizes:
+                assert orm_path(db, field, loop, limit) == rows_path(db, limit)
+                before = timed(lambda: orm_path(db, field, loop, limit), args.repeat)
+                after = timed(lambda: rows_path(db, limit), args.repeat)
+                count = min(limit, args.rows)
+                print(f'{limit:>7} {before / count * 1e6:>17.2f} {after / count * 1e6:>19.2f} {before / after:>7.1f}x')
+        loop.close()
+        engine.dispose()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+# FastAPI_JWT_Sample/benchmarks/bench_search.py
+# LIKE 검색 vs FTS5 전문검색 비교 (임시 SQLite 파일에 N건 생성)
+#   python -m benchmarks.bench_search --rows 1000000
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import time
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+from app.db.database import Base
+from app.db import models
+from app.crud import todo as td_crud
+
+WORDS = ['meeting', 'report', 'review', 'deploy', 'invoice', 'dentist', 'groceries', 'birthday', 'workout', 'budget',
+         'design', 'release', 'backup', 'flight', 'hotel', 'lecture', 'homework', 'laundry', 'payment', 'interview',
+         '회의', '보고서', '운동', '장보기', '병원', '여행', '예약', '정리', '청소', '공부']
+
+def seed(engine, rows: int, users: int, batch: int = 50000):
+    rnd = random.Random(42)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [{'id': i, 'email': f'user{i}@example.com', 'name': f'user{i}', 'password': 'x'} for i in range(1, users + 1)])
+        for start in range(0, rows, batch):
+            conn.execute(insert(models.Todo), [
+                {
+                    'user_id': 1 if n % 2 == 0 else rnd.randint(2, users),  # 절반은 power user(1)
+                    'title': ' '.join(rnd.choices(WORDS, k=2)) + f' proj{rnd.randint(0, 99999)}',  # proj* : 선택도가 높은 검색어
+                    'description': ' '.join(rnd.choices(WORDS, k=12)),
+                    'complete': 0,
+                }
+                for n in range(start, min(rows, start + batch))
+            ])
+
+def timed(fn, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), len(result)
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--limit', type=int, default=50)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), 'bench_search.db')
+    engine = create_engine(f'sqlite:///{path}')
+    Base.metadata.create_all(engine)
+    start = time.perf_counter()
+    seed(engine, args.rows, args.users)
+    print(f'seeded {args.rows} rows in {time.perf_counter() - start:.1f}s ({path})')
+
+    # user 1 : 전체의 절반을 가진 power user, user 2 : 일반 사용자
+    print(f'{"user":<6}{"query":<16}{"path":<14}{"median ms":>12}{"rows":>8}')
+    with Session(engine) as db:
+        for user_id in (1, 2):
+            for q in ['proj12345', 'proj1234', 'invoice', '장보기 dentist']:
+                for label, fn in [
+                    ('like', lambda: db.scalars(td_crud.todos_statement(user_id, q=q)).all()),
+                    (f'like limit', lambda: db.scalars(td_crud.todos_statement(user_id, q=q, limit=args.limit)).all()),
+                    (f'fts limit', lambda: td_crud.full_text_search(db, user_id, q, limit=args.limit)),
+                ]:
+                    median, count = timed(fn, args.repeat)
+                    print(f'{user_id:<6}{q:<16}{label:<14}{median:>12.2f}{count:>8}')
+    os.remove(path)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,88 @@
+# FastAPI_JWT_Sample/benchmarks/bench_sqlite_profile.py
+# 기본 SQLite 설정 vs 운영 프로파일(config.SQLITE_*) 동시 읽기/쓰기 처리량 비교
+#   python -m benchmarks.bench_sqlite_profile --readers 8 --writers 4 --seconds 5
+
+import argparse
+import os
+import random
+import tempfile
+import threading
+import time
+from sqlalchemy import create_engine, event, insert, select
+from sqlalchemy.exc import OperationalError
+from app.db.database import Base, SQLITE_PRAGMAS, POOL_OPTIONS, apply_sqlite_pragmas
+from app.db import models
+
+PROFILES = {
+    'default': {},
+    'production': SQLITE_PRAGMAS,
+}
+
+def build_engine(path: str, pragmas: dict):
+    engine = create_engine(f'sqlite:///{path}', connect_args={'check_same_thread': False}, **POOL_OPTIONS)
+    event.listen(engine, 'connect', lambda dbapi_connection, record: apply_sqlite_pragmas(dbapi_connection, pragmas))
+    return engine
+
+def seed(engine, users: int, todos: int):
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [{'id': i, 'email': f'user{i}@example.com', 'name': 'bench', 'password': 'x'} for i in range(1, users + 1)])
+        conn.execute(insert(models.Todo), [{'user_id': n % users + 1, 'title': f'todo {n}', 'description': 'seed', 'complete': 0} for n in range(todos)])
+
+def run(engine, readers: int, writers: int, seconds: float, users: int):
+    counts = {'reads': 0, 'writes': 0, 'locked': 0}
+    lock = threading.Lock()
+    stop = time.perf_counter() + seconds
+
+    def reader():
+        rnd = random.Random()
+        done = 0
+        while time.perf_counter() < stop:
+            with engine.connect() as conn:
+                conn.execute(select(models.Todo).where(models.Todo.user_id == rnd.randint(1, users)).limit(50)).all()
+            done += 1
+        with lock:
+            counts['reads'] += done
+
+    def writer():
+        rnd = random.Random()
+        done = locked = 0
+        while time.perf_counter() < stop:
+            try:
+                with engine.begin() as conn:
+                    conn.execute(insert(models.Todo).values(user_id=rnd.randint(1, users), title='bench', description='write', complete=0))
+                done += 1
+            except OperationalError:
+                locked += 1
+        with lock:
+            counts['writes'] += done
+            counts['locked'] += locked
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)] + [threading.Thread(target=writer) for _ in range(writers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return counts
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--readers', type=int, default=8)
+    parser.add_argument('--writers', type=int, default=4)
+    parser.add_argument('--seconds', type=float, default=5.0)
+    parser.add_argument('--users', type=int, default=100)
+    parser.add_argument('--todos', type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f'{args.readers} readers / {args.writers} writers, {args.seconds}s per profile')
+    print(f'{"profile":<12}{"reads/s":>10}{"writes/s":>10}{"locked":>8}')
+    for name, pragmas in PROFILES.items():
+        path = os.path.join(tempfile.mkdtemp(), f'bench_{name}.db')
+        engine = build_engine(path, pragmas)
+        Base.metadata.create_all(engine)
+        seed(engine, args.users, args.todos)
+        counts = run(engine, args.readers, args.writers, args.seconds, args.users)
+        engine.dispose()
+        print(f'{name:<12}{counts["reads"] / args.seconds:>10.0f}{counts["writes"] / args.seconds:>10.0f}{counts["locked"]:>8}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+# FastAPI_JWT_Sample/benchmarks/bench_todo_transfer.py
+# POST /todos/import, GET /todos/export (ndjson / csv) 처리량과 최대 RSS 증가량
+#   python -m benchmarks.bench_todo_transfer --rows 1000000 --backend sync
+#   본문은 생성기로 CHUNK 바이트씩 보내고 응답 본문은 크기만 세므로, RSS 증가는 서버측 메모리 사용량이다
+#   (SQLite mmap / page cache 가 RSS 에 섞이지 않도록 --sqlite-memory 를 주지 않으면 mmap 을 끄고 cache 를 2MB 로 줄인다)
+
+import argparse
+import asyncio
+import os
+import resource
+import tempfile
+import time
+
+CHUNK = 64 * 1024
+
+def body_chunks(rows: int, format: str):
+    buffer = []
+    size = 0
+    if format == 'csv':
+        buffer.append('title,description,todo_date,complete\n')
+    for n in range(rows):
+        if format == 'csv':
+            line = f'todo {n} meeting,"transfer benchmark, row {n}",2025-05-{n % 28 + 1:02d}T09:00:00,{n % 2}\n'
+        else:
+            line = f'{{"title":"todo {n} meeting","description":"transfer benchmark, row {n}","todo_date":"2025-05-{n % 28 + 1:02d}T09:00:00","complete":{n % 2}}}\n'
+        buffer.append(line)
+        size += len(line)
+        if size >= CHUNK:
+            yield ''.join(buffer).encode()
+            buffer, size = [], 0
+    if buffer:
+        yield ''.join(buffer).encode()
+
+async def call(app, method: str, path: str, query: str, token: str, chunks=()):
+    # 최소 ASGI 클라이언트 : 요청 본문을 조각으로 보내고 응답 본문은 바이트 수만 센다
+    scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': method, 'scheme': 'http',
+             'path': path, 'raw_path': path.encode(), 'query_string': query.encode(), 'root_path': '',
+             'headers': [(b'authorization', f'Bearer {token}'.encode()), (b'host', b'bench')],
+             'client': ('127.0.0.1', 50000), 'server': ('bench', 80)}
+    chunks = iter(chunks)
+    done = asyncio.Event()
+    async def receive():
+        chunk = next(chunks, None)
+        if chunk is not None:
+            return {'type': 'http.request', 'body': chunk, 'more_body': True}
+        if not done.is_set():
+            done.set()
+            return {'type': 'http.request', 'body': b'', 'more_body': False}
+        await asyncio.Event().wait()
+    result = {'status': None, 'bytes': 0, 'body': b''}
+    async def send(message):
+        if message['type'] == 'http.response.start':
+            result['status'] = message['status']
+        elif message['type'] == 'http.response.body':
+            body = message.get('body', b'')
+            result['bytes'] += len(body)
+            if len(result['body']) < 4096:
+                result['body'] += body[:4096]
+    await app(scope, receive, send)
+    return result
+
+def max_rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+async def run(args):
+    from sqlalchemy import insert
+    from app.db.database import Base, engine, async_engine
+    from app.db import models
+    from app.main import create_app
+    from app.utils import jwt_handler
+
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [{'id': 1, 'email': 'transfer@example.com', 'name': 'bench', 'password': 'x'}])
+    token = jwt_handler.create_access_token(data={'sub': '1', 'device_id': 'bench', 'email': 'transfer@example.com', 'ver': 0})
+    app = create_app(args.backend)
+
+    print(f'backend={args.backend} rows={args.rows}')
+    print(f'{"operation":<14} {"seconds":>8} {"rows/s":>10} {"MB":>8} {"max RSS +MB":>12}')
+    for format in args.formats:
+        before = max_rss_mb()
+        start = time.perf_counter()
+        result = await call(app, 'POST', '/todos/import', f'format={format}', token, body_chunks(args.rows, format))
+        elapsed = time.perf_counter() - start
+        assert result['status'] == 200, result['body']
+        assert f'"imported":{args.rows}'.encode() in result['body'], result['body']
+        print(f'{"import " + format:<14} {elapsed:>8.2f} {args.rows / elapsed:>10.0f} {"-":>8} {max_rss_mb() - before:>12.1f}')
+
+        before = max_rss_mb()
+        start = time.perf_counter()
+        result = await call(app, 'GET', '/todos/export', f'format={format}', token)
+        elapsed = time.perf_counter() - start
+        assert result['status'] == 200
+        # 앞서 가져온 형식의 행까지 모두 내보낸다
+        exported = args.rows * (args.formats.index(format) + 1)
+        print(f'{"export " + format:<14} {elapsed:>8.2f} {exported / elapsed:>10.0f} {result["bytes"] / 1e6:>8.1f} {max_rss_mb() - before:>12.1f}')
+
+    await async_engine.dispose()
+    engine.dispose()
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--backend', choices=['sync', 'async'], default='sync')
+    parser.add_argument('--formats', nargs='+', choices=['ndjson', 'csv'], default=['ndjson', 'csv'])
+    parser.add_argument('--sqlite-memory', action='store_true', help='SQLite mmap / cache_size 를 app 설정 그대로 사용')
+    args = parser.parse_args()
+    with tempfile.TemporaryDirectory() as tmp:
+        # app 모듈 import 전에 설정 (benchmarks.run 과 같음)
+        os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(tmp, "bench.db")}'
+        os.environ.pop('ASYNC_DATABASE_URL', None)
+        os.environ['TOKEN_PURGE_ENABLED'] = 'false'
+        if not args.sqlite_memory:
+            os.environ['SQLITE_MMAP_SIZE'] = '0'
+            os.environ['SQLITE_CACHE_SIZE'] = '-2048'
+        asyncio.run(run(args))
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+# FastAPI_JWT_Sample/benchmarks/load.py
+# in-process ASGI 부하 시나리오 (httpx.AsyncClient + ASGITransport, 동시 요청 수 = concurrency)
+import asyncio
+import time
+import httpx
+from benchmarks.stats import summarize
+from benchmarks.seed import PASSWORD
+
+async def run_scenario(request, total: int, concurrency: int) -> dict:
+    latencies, errors = [], 0
+    counter = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for i in counter:
+            start = time.perf_counter()
+            try:
+                response = await request(i)
+                failed = response.status_code >= 400
+            except Exception:
+                failed = True
+            latencies.append((time.perf_counter() - start) * 1000)
+            errors += failed
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return summarize(latencies, time.perf_counter() - start, errors)
+
+async def login(client, email: str, device_id: str):
+    return await client.post('/users/login', data={'email': email, 'password': PASSWORD, 'device_id': device_id})
+
+async def run(app, emails: list, requests: int, login_requests: int, concurrency: int, query: str, login_concurrency: int | None = None) -> dict:
+    # login_concurrency : 암호 해시 동시 처리 한도(PASSWORD_HASH_WORKERS + QUEUE_LIMIT)를 넘는 요청은 503 이므로 그 이하로 요청
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url='http://bench') as client:
+        # 사용자별 토큰 준비 (측정 제외)
+        tokens = []
+        for email in emails:
+            response = await login(client, email, 'bench')
+            response.raise_for_status()
+            tokens.append(response.json())
+        headers = [{'Authorization': f"Bearer {t['access_token']}"} for t in tokens]
+
+        def auth(i):
+            return headers[i % len(headers)]
+
+        # 변경 없는 목록 재조회(If-None-Match -> 304)용 ETag
+        etags = []
+        for h in headers:
+            response = await client.get('/todos/', params={'limit': 50}, headers=h)
+            etags.append(response.headers.get('etag', ''))
+
+        created = []
+
+        async def create(i):
+            response = await client.post('/todos/', json={'title': f'bench {i}', 'description': query}, headers=auth(i))
+            if response.status_code < 400:
+                created.append((i, response.json()['id']))
+            return response
+
+        def nth_created(i):
+            owner, todo_id = created[i % len(created)]
+            return todo_id, auth(owner)
+
+        async def read(i):
+            todo_id, h = nth_created(i)
+            return await client.get(f'/todos/{todo_id}', headers=h)
+
+        async def update(i):
+            todo_id, h = nth_created(i)
+            return await client.put(f'/todos/{todo_id}', json={'title': f'bench {i} updated', 'description': query, 'todo_date': None, 'complete': 1}, headers=h)
+
+        async def delete(i):
+            # 생성한 일정을 한 번씩만 삭제
+            owner, todo_id = created[i]
+            return await client.delete(f'/todos/{todo_id}', headers=auth(owner))
+
+        scenarios = {
+            'login': (lambda i: login(client, emails[i % len(emails)], 'bench-login'), login_requests),
+            'refresh': (lambda i: client.post('/users/refresh', json={'refresh_token': tokens[i % len(tokens)]['refresh_token']}), requests),
+            'todos_list': (lambda i: client.get('/todos/', params={'limit': 50}, headers=auth(i)), requests),
+            'todos_list_304': (lambda i: client.get('/todos/', params={'limit': 50}, headers={**auth(i), 'If-None-Match': etags[i % len(etags)]}), requests),
+            'todos_search': (lambda i: client.get('/todos/search/', params={'q': query, 'limit': 20}, headers=auth(i)), requests),
+            'todo_create': (create, requests),
+            'todo_read': (read, requests),
+            'todo_update': (update, requests),
+            'todo_delete': (delete, None),
+        }
+        results = {}
+        for name, (request, total) in scenarios.items():
+            workers = (login_concurrency or concurrency) if name == 'login' else concurrency
+            results[name] = await run_scenario(request, len(created) if total is None else total, workers)
+        return results
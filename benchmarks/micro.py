@@ -0,0 +1,62 @@
+# FastAPI_JWT_Sample/benchmarks/micro.py
+# 인증/응답 직렬화 핫패스 마이크로 벤치마크 (호출당 평균 us)
+import asyncio
+import time
+from datetime import datetime
+from typing import List
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from app.api import responses
+from app.db import models
+from app.schemas import todo as td_scheme
+from app.utils import jwt_handler as jwt
+from app.utils import bcrypt as bc
+
+def per_call(fn, iterations: int, rows: int = 0) -> dict:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - start
+    result = {'iterations': iterations, 'per_call_us': round(elapsed / iterations * 1e6, 3)}
+    if rows:
+        result['per_row_us'] = round(elapsed / iterations / rows * 1e6, 3)
+    return result
+
+def sample_todos(count: int) -> list:
+    now = datetime(2025, 5, 13, 9, 0, 0)
+    return [models.Todo(id=n, user_id=1, title=f'todo {n}', description='micro benchmark 일정', todo_date=now,
+                        complete=n % 2, created_at=now, updated_at=None) for n in range(1, count + 1)]
+
+def sample_rows(todos: list) -> list:
+    return [tuple(getattr(todo, field) for field in td_scheme.TODO_RESPONSE_FIELDS) for todo in todos]
+
+def run(iterations: int, verify_iterations: int, page_size: int) -> dict:
+    token = jwt.create_access_token({'id': '1', 'email': 'bench1@example.com', 'device_id': 'bench'})
+    hashed = bc.hash_password('bench-password')
+
+    # ORM 객체 -> response_model 검증 + JSONResponse.render (단건 조회/수정 경로, 목록의 이전 경로)
+    field = create_model_field(name='Response_todos', type_=List[td_scheme.TodoResponse], mode='serialization')
+    todos = sample_todos(page_size)
+    rows = sample_rows(todos)
+    loop = asyncio.new_event_loop()
+
+    def serialize():
+        content = loop.run_until_complete(serialize_response(field=field, response_content=todos))
+        return JSONResponse(content).body
+
+    # 목록 fast path : Row 튜플 -> ORJSONResponse
+    def serialize_rows():
+        return responses.todo_rows(rows, Response()).body
+
+    try:
+        return {
+            'decode_token': per_call(lambda: jwt.decode_token(token), iterations),
+            'verify_password': per_call(lambda: bc.verify_password('bench-password', hashed), verify_iterations),
+            f'todo_response_x{page_size}': per_call(serialize, max(1, iterations // 10), page_size),
+            f'todo_rows_x{page_size}': per_call(serialize_rows, max(1, iterations // 10), page_size),
+        }
+    finally:
+        loop.close()
@@ -0,0 +1,115 @@
+# FastAPI_JWT_Sample/benchmarks/run.py
+# 인증/일정 핫패스 부하 테스트 + 마이크로 벤치마크, 결과(JSON)를 기준선과 비교
+#   python -m benchmarks.run --users 20 --todos 200 --concurrency 16 --requests 300
+#   python -m benchmarks.run --save-baseline           (benchmarks/baseline.json 갱신)
+#   python -m benchmarks.run --tolerance 0.2           (기준선 대비 20% 이상 나빠지면 exit 1)
+#  1 CPU 환경은 실행마다 편차가 커서 부하 시나리오를 --repeat 번 실행한 중앙값을 사용
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import sys
+import tempfile
+
+BASELINE = os.path.join(os.path.dirname(__file__), 'baseline.json')
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--backend', choices=['sync', 'async'], default='sync')
+    parser.add_argument('--users', type=int, default=20)
+    parser.add_argument('--todos', type=int, default=200, help='사용자당 일정 수')
+    parser.add_argument('--concurrency', type=int, default=16)
+    parser.add_argument('--requests', type=int, default=300, help='시나리오별 요청 수')
+    parser.add_argument('--login-requests', type=int, default=40, help='login 시나리오 요청 수 (bcrypt 비용)')
+    parser.add_argument('--repeat', type=int, default=3, help='부하 시나리오 반복 횟수 (지표별 중앙값으로 기준선과 비교)')
+    parser.add_argument('--query', default='meeting', help='검색 시나리오 검색어')
+    parser.add_argument('--iterations', type=int, default=5000, help='마이크로 벤치마크 반복 수')
+    parser.add_argument('--verify-iterations', type=int, default=5)
+    parser.add_argument('--page-size', type=int, default=50, help='TodoResponse 직렬화 건수')
+    parser.add_argument('--bcrypt-rounds', type=int, help='기본값은 app 설정(BCRYPT_ROUNDS)')
+    parser.add_argument('--output', help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=BASELINE)
+    parser.add_argument('--save-baseline', action='store_true')
+    parser.add_argument('--tolerance', type=float, default=0.2)
+    parser.add_argument('--skip-load', action='store_true')
+    parser.add_argument('--skip-micro', action='store_true')
+    return parser.parse_args(argv)
+
+def configure_environment(args, path: str):
+    # app 모듈 import 전에 설정해야 엔진/해시 정책에 반영된다
+    os.environ['DATABASE_URL'] = f'sqlite:///{path}'
+    os.environ.pop('ASYNC_DATABASE_URL', None)
+    os.environ['DB_BACKEND'] = args.backend
+    os.environ['TOKEN_PURGE_ENABLED'] = 'false'
+    # 모든 요청이 같은 클라이언트 IP / 적은 수의 email 로 들어오므로 요청 한도는 측정을 막지 않을 만큼 높임 (한도 검사 비용은 포함)
+    os.environ.setdefault('RATE_LIMIT_IP_PER_MINUTE', '1000000')
+    os.environ.setdefault('RATE_LIMIT_EMAIL_PER_MINUTE', '1000000')
+    if args.bcrypt_rounds:
+        os.environ['BCRYPT_ROUNDS'] = str(args.bcrypt_rounds)
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        configure_environment(args, os.path.join(tmp, 'bench.db'))
+        from app.core import config
+        from app.db.database import engine, async_engine
+        from app.main import create_app
+        from benchmarks import load, micro, seed
+        from benchmarks.stats import compare, median_summary
+
+        # login 은 암호 해시 admission 한도까지만 동시에 요청 (초과분은 설계상 503)
+        login_concurrency = min(args.concurrency, config.PASSWORD_HASH_WORKERS + config.PASSWORD_HASH_QUEUE_LIMIT)
+        results = {
+            'meta': {'backend': args.backend, 'users': args.users, 'todos_per_user': args.todos, 'concurrency': args.concurrency,
+                     'login_concurrency': login_concurrency, 'requests': args.requests, 'repeat': args.repeat,
+                     'password_hash_scheme': config.PASSWORD_HASH_SCHEME,
+                     'bcrypt_rounds': config.BCRYPT_ROUNDS, 'python': platform.python_version(), 'cpus': os.cpu_count()},
+            'scenarios': {},
+            'micro': {},
+        }
+        if not args.skip_load:
+            emails = seed.seed(args.users, args.todos)
+
+            async def run_load():
+                try:
+                    app = create_app(args.backend)
+                    return [await load.run(app, emails, args.requests, args.login_requests, args.concurrency, args.query, login_concurrency)
+                            for _ in range(args.repeat)]
+                finally:
+                    # aiosqlite 연결 스레드가 남아 있으면 프로세스가 종료되지 않는다
+                    await async_engine.dispose()
+
+            runs = asyncio.run(run_load())
+            results['scenarios'] = {name: median_summary([run[name] for run in runs]) for name in runs[0]}
+        if not args.skip_micro:
+            results['micro'] = micro.run(args.iterations, args.verify_iterations, args.page_size)
+        engine.dispose()
+
+    print(json.dumps(results, indent=2, ensure_ascii=False))
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+    if args.save_baseline:
+        with open(args.baseline, 'w') as f:
+            json.dump(results, f, indent=2, ensure_ascii=False)
+        return 0
+    if not os.path.exists(args.baseline):
+        print(f'baseline 없음: {args.baseline} (--save-baseline 으로 생성)', file=sys.stderr)
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get('meta', {}).get('backend') != args.backend:
+        print('baseline 과 backend 가 다릅니다 - 비교 결과는 참고용', file=sys.stderr)
+    regressions = compare(results, baseline, args.tolerance)
+    for line in regressions:
+        print(f'REGRESSION {line}', file=sys.stderr)
+    errors = {name: r['errors'] for name, r in results['scenarios'].items() if r['errors']}
+    if errors:
+        print(f'요청 실패 {errors}', file=sys.stderr)
+    return 1 if regressions or errors else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
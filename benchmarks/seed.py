@@ -0,0 +1,27 @@
+# FastAPI_JWT_Sample/benchmarks/seed.py
+# 부하 테스트용 사용자/일정 생성 (bcrypt 해시는 한 번만 계산해 모든 사용자에게 재사용)
+#   DATABASE_URL 을 임시 파일로 지정한 뒤 import 해야 한다 (benchmarks.run 참고)
+import random
+from sqlalchemy import insert
+from app.db.database import engine, Base
+from app.db import models
+from app.utils import bcrypt as bc
+
+PASSWORD = 'bench-password'
+WORDS = ['meeting', 'report', 'review', 'deploy', 'invoice', 'dentist', 'groceries', 'birthday', 'workout', 'budget']
+
+def seed(users: int, todos_per_user: int) -> list:
+    Base.metadata.create_all(bind=engine)
+    hashed = bc.hash_password(PASSWORD)
+    rnd = random.Random(42)
+    emails = [f'bench{i}@example.com' for i in range(1, users + 1)]
+    with engine.begin() as conn:
+        conn.execute(insert(models.User), [{'id': i, 'email': email, 'name': 'bench', 'password': hashed} for i, email in enumerate(emails, 1)])
+        rows = [
+            {'user_id': user_id, 'title': ' '.join(rnd.choices(WORDS, k=3)), 'description': ' '.join(rnd.choices(WORDS, k=8)),
+             'todo_date': None, 'complete': 0}
+            for user_id in range(1, users + 1) for _ in range(todos_per_user)
+        ]
+        for start in range(0, len(rows), 10000):
+            conn.execute(insert(models.Todo), rows[start:start + 10000])
+    return emails
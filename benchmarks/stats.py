@@ -0,0 +1,44 @@
+# FastAPI_JWT_Sample/benchmarks/stats.py
+# 지연시간 통계 / 기준선(baseline) 비교
+import statistics
+
+def percentile(samples: list, pct: float) -> float:
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+def summarize(latencies_ms: list, wall_seconds: float, errors: int) -> dict:
+    return {
+        'requests': len(latencies_ms),
+        'errors': errors,
+        'p50_ms': round(percentile(latencies_ms, 50), 3),
+        'p95_ms': round(percentile(latencies_ms, 95), 3),
+        'p99_ms': round(percentile(latencies_ms, 99), 3),
+        'rps': round(len(latencies_ms) / wall_seconds, 1) if wall_seconds else 0.0,
+    }
+
+def median_summary(runs: list) -> dict:
+    # 같은 시나리오를 여러 번 실행한 요약의 지표별 중앙값 (requests / errors 는 합계)
+    return {metric: sum(run[metric] for run in runs) if metric in ('requests', 'errors')
+            else round(statistics.median(run[metric] for run in runs), 3)
+            for metric in runs[0]}
+
+# 지표별 방향 : 높을수록 나쁨(+1) / 낮을수록 나쁨(-1)
+DIRECTIONS = {'p50_ms': 1, 'p95_ms': 1, 'p99_ms': 1, 'rps': -1, 'per_call_us': 1}
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list:
+    regressions = []
+    for section in ('scenarios', 'micro'):
+        for name, metrics in baseline.get(section, {}).items():
+            current = results.get(section, {}).get(name)
+            if current is None:
+                continue
+            for metric, direction in DIRECTIONS.items():
+                if metric not in metrics or metric not in current or not metrics[metric]:
+                    continue
+                change = (current[metric] - metrics[metric]) / metrics[metric]
+                if change * direction > tolerance:
+                    regressions.append(f'{section}.{name}.{metric}: {metrics[metric]} -> {current[metric]} ({change:+.0%})')
+    return regressions
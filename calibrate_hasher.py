@@ -0,0 +1,51 @@
+# FastAPI_JWT_Sample/calibrate_hasher.py
+# 현재 머신에서 목표 검증시간(ms)을 넘지 않는 최대 해시 비용을 찾는다
+#   python calibrate_hasher.py --scheme bcrypt --target-ms 250
+
+import argparse
+import time
+from app.utils.hasher import BcryptHasher, ScryptHasher
+
+def measure_verify(hasher, repeat: int) -> float:
+    hashed = hasher.hash('calibration-password')
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        hasher.verify('calibration-password', hashed)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def calibrate(scheme: str, target_ms: float, repeat: int, r: int, p: int):
+    if scheme == 'bcrypt':
+        costs, build, env = range(4, 32), lambda c: BcryptHasher(rounds=c), 'BCRYPT_ROUNDS'
+    else:
+        costs, build, env = range(10, 25), lambda c: ScryptHasher(ln=c, r=r, p=p), 'SCRYPT_LN'
+
+    chosen = None
+    for cost in costs:
+        elapsed = measure_verify(build(cost), repeat)
+        print(f'{env}={cost}: {elapsed:.1f} ms')
+        if elapsed > target_ms:
+            break
+        chosen = cost
+    if chosen is None:
+        chosen = costs[0]
+        print(f'Minimum cost already exceeds {target_ms} ms.')
+    print()
+    print(f'PASSWORD_HASH_SCHEME={scheme}')
+    print(f'{env}={chosen}')
+    if scheme == 'scrypt':
+        print(f'SCRYPT_R={r}')
+        print(f'SCRYPT_P={p}')
+    return chosen
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Pick a password hash cost for a target verify latency.')
+    parser.add_argument('--scheme', choices=['bcrypt', 'scrypt'], default='bcrypt')
+    parser.add_argument('--target-ms', type=float, default=250.0)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--scrypt-r', type=int, default=8)
+    parser.add_argument('--scrypt-p', type=int, default=1)
+    args = parser.parse_args()
+    calibrate(args.scheme, args.target_ms, args.repeat, args.scrypt_r, args.scrypt_p)
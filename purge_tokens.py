@@ -0,0 +1,18 @@
+# FastAPI_JWT_Sample/purge_tokens.py
+# 만료된 refresh token 일회성 정리
+#   python purge_tokens.py --batch-size 500
+
+import argparse
+from app.core import config
+from app.services import token_purge_service
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Delete expired rows from users_token in small batches.')
+    parser.add_argument('--batch-size', type=int, default=config.TOKEN_PURGE_BATCH_SIZE)
+    parser.add_argument('--pause', type=float, default=config.TOKEN_PURGE_BATCH_PAUSE)
+    args = parser.parse_args()
+
+    print('Purging expired tokens...')
+    total = token_purge_service.purge_expired_tokens(args.batch_size, args.pause)
+    stats = token_purge_service.stats()
+    print(f"Done. {total} rows in {stats['batches']} batches (max batch {stats['max_batch_seconds'] * 1000:.1f} ms)")
@@ -0,0 +1,75 @@
+# conftest.py - 테스트에서는 N+1 의심 request 를 실패로 처리 (app import 전에 설정)
+#  테스트 DB 는 세션마다 임시 파일로 새로 만든다 (저장소의 test.db 를 건드리지 않음)
+import os
+import shutil
+import tempfile
+
+os.environ.setdefault('QUERY_REPEAT_LIMIT', '10')
+os.environ.setdefault('QUERY_REPEAT_ACTION', 'raise')
+
+_db_dir = tempfile.mkdtemp(prefix='fastapi-jwt-test-')
+os.environ['DATABASE_URL'] = f'sqlite:///{os.path.join(_db_dir, "test.db")}'
+os.environ.pop('ASYNC_DATABASE_URL', None)
+
+import pytest
+
+
+@pytest.fixture(scope='session', autouse=True)
+def database():
+    from app.db.database import Base, engine
+    from app.db import models
+    Base.metadata.create_all(bind=engine)
+    yield
+    engine.dispose()
+    shutil.rmtree(_db_dir, ignore_errors=True)
+
+
+@pytest.fixture
+def client_config():
+    # create_app 전에 설정을 바꿔야 하는 모듈은 이 fixture 를 재정의 (test_stateless_auth.py, test_profiling.py)
+    return None
+
+
+@pytest.fixture(params=['sync', 'async'])
+def client(request, client_config):
+    # sync / async 라우터 각각 : 모듈별 사용자로 가입 + 로그인 (Authorization 헤더 설정), 끝나면 사용자 삭제
+    from fastapi.testclient import TestClient
+    from app.main import create_app
+    client = TestClient(create_app(request.param))
+    name = request.module.__name__.rsplit('.', 1)[-1].removeprefix('test_')
+    user = {"email": f"{name}_{request.param}@example.com", "name": "pytest", "password": "1234"}
+    assert client.post("/users/signup", json=user).status_code == 200
+    token = client.post("/users/login", data={"email": user["email"], "password": user["password"], "device_id": name}).json()["access_token"]
+    client.headers["Authorization"] = f"Bearer {token}"
+    client.user = user
+    client.user_id = client.get("/users/me").json()["id"]
+    yield client
+    # 테스트 중 토큰이 무효화되었으면 다시 로그인하여 삭제 (이미 삭제되었으면 로그인 404)
+    if client.request("DELETE", "/users/me", json={"password": user["password"]}).status_code == 401:
+        login = client.post("/users/login", data={"email": user["email"], "password": user["password"], "device_id": "cleanup"})
+        if login.status_code == 200:
+            client.request("DELETE", "/users/me", json={"password": user["password"]},
+                           headers={"Authorization": f"Bearer {login.json()['access_token']}"})
+
+
+@pytest.fixture
+def statements():
+    # sync / async engine 에서 실행된 SQL 을 (statement, parameters, executemany) 로 수집
+    from sqlalchemy import event
+    from app.db.database import engine, async_engine
+    executed = []
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        executed.append((statement, parameters, executemany))
+    for target in (engine, async_engine.sync_engine):
+        event.listen(target, 'before_cursor_execute', capture)
+    yield executed
+    for target in (engine, async_engine.sync_engine):
+        event.remove(target, 'before_cursor_execute', capture)
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limit():
+    # TestClient 요청은 모두 같은 IP('testclient') 이므로 요청 한도는 테스트마다 초기화
+    from app.core import rate_limiter
+    rate_limiter.store.clear()
+    yield
@@ -0,0 +1,80 @@
+# test_async.py - DB_BACKEND=async 라우터 검증
+from fastapi.testclient import TestClient
+from app.main import create_app
+import pytest
+
+client = TestClient(create_app('async'))
+
+
+user_data = {
+        "email": "async_tester@example.com",
+        "name": "pytest",
+        "password": "1234"
+    }
+
+@pytest.fixture
+def get_token():
+    response = client.post(
+        "/users/login",
+        data={"email": user_data["email"],
+              "password": user_data["password"],
+              "device_id": "async_device"}
+    )
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_sign_up():
+    response = client.post("/users/signup", json=user_data)
+    assert response.status_code == 200
+
+def test_login_fail_wrong_password():
+    response = client.post("/users/login", data={
+        "email": user_data["email"],
+        "password": "wrongpassword",
+        "device_id": "async_device"
+    })
+    assert response.status_code == 400
+
+def test_refresh(get_token):
+    response = client.post("/users/refresh", json={
+        "refresh_token": get_token["refresh_token"]
+    })
+    assert response.status_code == 200
+
+def test_todo_crud(get_token):
+    headers = {"Authorization": f"Bearer {get_token['access_token']}"}
+    response = client.post("/todos", json={"title": "async", "description": "string", "todo_date": "2025-05-13"}, headers=headers)
+    assert response.status_code == 200
+    todo_id = response.json()["id"]
+
+    response = client.put(f"/todos/{todo_id}", json={"title": "async updated", "description": None, "todo_date": "2025-05-13", "complete": 1}, headers=headers)
+    assert response.status_code == 200
+    assert response.json()["title"] == "async updated"
+
+    response = client.get("/todos/search/?date=2025-05-13", headers=headers)
+    assert len(response.json()) == 1
+    response = client.get("/todos/?stream=true", headers=headers)
+    assert response.text.count("\n") == 1
+
+    response = client.delete(f"/todos/{todo_id}", headers=headers)
+    assert response.status_code == 200
+    response = client.get(f"/todos/{todo_id}", headers=headers)
+    assert response.status_code == 404
+
+def test_update_user(get_token):
+    response = client.put(
+        "/users/me",
+        json={"name": "changedName", "old_password": user_data["password"], "new_password": user_data["password"]},
+        headers={"Authorization": f"Bearer {get_token['access_token']}"}
+    )
+    assert response.status_code == 200
+
+def test_delete_user(get_token):
+    response = client.request(
+        method="DELETE",
+        url="/users/me",
+        json={"password": user_data["password"]},
+        headers={"Authorization": f"Bearer {get_token['access_token']}"}
+    )
+    assert response.status_code == 200
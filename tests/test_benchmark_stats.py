@@ -0,0 +1,27 @@
+# test_benchmark_stats.py
+from benchmarks.stats import percentile, summarize, compare, median_summary
+
+
+def test_percentile():
+    samples = list(range(1, 101))
+    assert percentile(samples, 50) == 50
+    assert percentile(samples, 99) == 99
+    assert percentile([], 95) == 0.0
+
+def test_summarize_rps():
+    result = summarize([10.0] * 20, 2.0, 1)
+    assert result['rps'] == 10.0
+    assert result['errors'] == 1
+
+def test_compare_flags_regressions_only():
+    baseline = {'scenarios': {'todos_list': {'p95_ms': 100.0, 'rps': 200.0}}, 'micro': {'decode_token': {'per_call_us': 50.0}}}
+    results = {'scenarios': {'todos_list': {'p95_ms': 130.0, 'rps': 190.0}}, 'micro': {'decode_token': {'per_call_us': 20.0}}}
+    regressions = compare(results, baseline, 0.2)
+    assert len(regressions) == 1
+    assert regressions[0].startswith('scenarios.todos_list.p95_ms')
+
+def test_median_summary():
+    runs = [{'requests': 10, 'errors': 0, 'p50_ms': 30.0, 'rps': 100.0},
+            {'requests': 10, 'errors': 1, 'p50_ms': 10.0, 'rps': 300.0},
+            {'requests': 10, 'errors': 0, 'p50_ms': 20.0, 'rps': 200.0}]
+    assert median_summary(runs) == {'requests': 30, 'errors': 1, 'p50_ms': 20.0, 'rps': 200.0}
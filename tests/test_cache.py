@@ -0,0 +1,75 @@
+# test_cache.py
+import time
+from app.core import principal_cache
+from app.schemas import auth
+from app.utils.cache import TTLCache, SerializingCache, build_cache
+
+
+def test_lru_eviction():
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.stats()['evictions'] == 1
+
+def test_entry_never_outlives_ttl():
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set('a', 1, ttl=0.01)
+    time.sleep(0.02)
+    assert cache.get('a') is None
+    cache.set('b', 1, ttl=-1)
+    assert cache.get('b') is None
+
+def test_invalidate_tag_blocks_stale_set():
+    cache = TTLCache(maxsize=10, ttl=60)
+    generation = cache.generation('1')
+    cache.set('token', 'user', tag='1', generation=generation)
+    assert cache.invalidate_tag('1') == 1
+    assert cache.get('token') is None
+    # 무효화 이전에 읽은 값은 다시 저장되지 않음
+    cache.set('token', 'user', tag='1', generation=generation)
+    assert cache.get('token') is None
+    stats = cache.stats()
+    assert stats['hits'] == 0 and stats['misses'] == 2
+
+def test_per_tag_lru_limit():
+    cache = TTLCache(maxsize=10, ttl=60, maxsize_per_tag=2)
+    cache.set('u1:a', 1, tag='u1')
+    cache.set('u1:b', 2, tag='u1')
+    cache.set('u2:a', 3, tag='u2')
+    cache.get('u1:a')
+    cache.set('u1:c', 4, tag='u1')
+    assert cache.get('u1:b') is None
+    assert cache.get('u1:a') == 1
+    assert cache.get('u2:a') == 3
+
+def test_serializing_cache_returns_copies():
+    cache = SerializingCache(TTLCache(maxsize=10, ttl=60))
+    value = [1, 2]
+    cache.set('a', value, tag='t')
+    value.append(3)
+    assert cache.get('a') == [1, 2]
+    assert cache.get('a') is not cache.get('a')
+    cache.invalidate_tag('t')
+    assert cache.get('a') is None
+
+def test_principal_cache_backends(monkeypatch):
+    principal = auth.Access_token_Model(id='7', email='principal@example.com', device_id='web')
+    monkeypatch.setattr(principal_cache, 'cache', build_cache('shared', 10, 60))
+    assert isinstance(principal_cache.cache, SerializingCache)
+    principal_cache.put('token', principal, None, principal_cache.generation(7))
+    assert principal_cache.get('token') == principal
+    # 사용자 무효화는 공유 저장소의 generation 을 올리므로 무효화 전에 읽은 generation 으로는 저장되지 않음
+    generation = principal_cache.generation(7)
+    principal_cache.invalidate_user(7)
+    assert principal_cache.get('token') is None
+    principal_cache.put('token', principal, None, generation)
+    assert principal_cache.get('token') is None
+
+    monkeypatch.setattr(principal_cache, 'cache', build_cache('none', 10, 60))
+    principal_cache.put('token', principal, None, principal_cache.generation(7))
+    assert principal_cache.get('token') is None
+    assert principal_cache.invalidate_user(7) == 0
@@ -0,0 +1,145 @@
+# test_compression.py - 응답 압축 미들웨어 (gzip / deflate 협상, threshold, 스트리밍, ETag / Vary, 메트릭)
+import asyncio
+import gzip
+import zlib
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from app.api.middleware import compression
+from app.api.middleware.compression import CompressionMiddleware, select_encoding
+
+BODY = 'compressible todo body ' * 200
+
+def build_app(minimum_size=1024):
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, minimum_size=minimum_size, level=6)
+
+    @app.api_route('/large', methods=['GET', 'HEAD'])
+    def large():
+        return PlainTextResponse(BODY, headers={'ETag': '"abc"'})
+
+    @app.get('/small')
+    def small():
+        return PlainTextResponse('small')
+
+    @app.get('/binary')
+    def binary():
+        return Response(b'\x00' * 4096, media_type='application/octet-stream')
+
+    @app.get('/no-transform')
+    def no_transform():
+        return PlainTextResponse(BODY, headers={'Cache-Control': 'no-transform'})
+
+    @app.get('/stream')
+    def stream():
+        def chunks():
+            for n in range(50):
+                yield f'{{"n":{n},"title":"streamed row"}}\n'.encode()
+        return StreamingResponse(chunks(), media_type='application/x-ndjson')
+
+    return app
+
+class RawClient:
+    # httpx 의 자동 압축 해제 없이 ASGI 메시지를 그대로 받는다
+    def __init__(self, app):
+        self.app = app
+
+    def get(self, path, accept_encoding=None, method='GET'):
+        headers = [(b'host', b'test')]
+        if accept_encoding is not None:
+            headers.append((b'accept-encoding', accept_encoding.encode()))
+        scope = {'type': 'http', 'asgi': {'version': '3.0'}, 'http_version': '1.1', 'method': method, 'scheme': 'http',
+                 'path': path, 'raw_path': path.encode(), 'query_string': b'', 'root_path': '', 'headers': headers,
+                 'client': ('127.0.0.1', 50000), 'server': ('test', 80)}
+        messages = []
+        requested = []
+        async def receive():
+            # 본문은 한 번만, 이후는 연결 유지 (StreamingResponse 가 disconnect 를 기다림)
+            if not requested:
+                requested.append(True)
+                return {'type': 'http.request', 'body': b'', 'more_body': False}
+            await asyncio.Event().wait()
+        async def send(message):
+            messages.append(message)
+        asyncio.run(self.app(scope, receive, send))
+        start = messages[0]
+        headers = {name.decode(): value.decode() for name, value in start['headers']}
+        chunks = [message.get('body', b'') for message in messages[1:]]
+        return start['status'], headers, chunks
+
+@pytest.fixture
+def raw():
+    return RawClient(build_app())
+
+
+@pytest.mark.parametrize('header, expected', [
+    ('gzip, deflate', 'gzip'),
+    ('deflate', 'deflate'),
+    ('gzip;q=0.5, deflate', 'deflate'),
+    ('deflate;q=0.5, gzip;q=0.5', 'gzip'),
+    ('*', 'gzip'),
+    ('gzip;q=0, *', 'deflate'),
+    ('br, identity', None),
+    ('gzip;q=0, deflate;q=0', None),
+])
+def test_select_encoding(header, expected):
+    assert select_encoding(header) == expected
+
+def test_gzip_large_body(raw):
+    status, headers, chunks = raw.get('/large', 'gzip, deflate')
+    assert status == 200
+    assert headers['content-encoding'] == 'gzip'
+    assert headers['vary'] == 'Accept-Encoding'
+    assert int(headers['content-length']) == len(b''.join(chunks))
+    assert gzip.decompress(b''.join(chunks)).decode() == BODY
+    # 표현이 달라지므로 weak ETag
+    assert headers['etag'] == 'W/"abc"'
+
+def test_deflate_large_body(raw):
+    status, headers, chunks = raw.get('/large', 'deflate')
+    assert headers['content-encoding'] == 'deflate'
+    assert zlib.decompress(b''.join(chunks)).decode() == BODY
+
+def test_not_compressed(raw):
+    # threshold 미만 / 압축 불가 content-type / no-transform / Accept-Encoding 없음 / HEAD
+    status, headers, chunks = raw.get('/small', 'gzip')
+    assert 'content-encoding' not in headers and headers['vary'] == 'Accept-Encoding'
+    assert b''.join(chunks) == b'small'
+    for path in ('/binary', '/no-transform'):
+        status, headers, chunks = raw.get(path, 'gzip')
+        assert 'content-encoding' not in headers and 'vary' not in headers
+    status, headers, chunks = raw.get('/large')
+    assert 'content-encoding' not in headers
+    assert headers['etag'] == '"abc"'
+    status, headers, chunks = raw.get('/large', 'gzip', method='HEAD')
+    assert 'content-encoding' not in headers and int(headers['content-length']) == len(BODY)
+
+def test_streaming_chunks(raw):
+    status, headers, chunks = raw.get('/stream', 'gzip')
+    assert headers['content-encoding'] == 'gzip'
+    assert 'content-length' not in headers
+    # 모든 chunk 를 모아 두지 않고 chunk 마다 flush 하여 전송
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+    first = decompressor.decompress(chunks[0])
+    assert first == b'{"n":0,"title":"streamed row"}\n'
+    body = first + b''.join(decompressor.decompress(chunk) for chunk in chunks[1:]) + decompressor.flush()
+    assert body.count(b'\n') == 50
+
+def test_compression_metrics(raw):
+    responses = compression.COMPRESSED_RESPONSES.value(encoding='gzip')
+    saved = compression.COMPRESSION_SAVED_BYTES.value(encoding='gzip')
+    input_bytes = compression.COMPRESSION_INPUT_BYTES.value(encoding='gzip')
+    status, headers, chunks = raw.get('/large', 'gzip')
+    assert compression.COMPRESSED_RESPONSES.value(encoding='gzip') == responses + 1
+    assert compression.COMPRESSION_INPUT_BYTES.value(encoding='gzip') == input_bytes + len(BODY)
+    assert compression.COMPRESSION_SAVED_BYTES.value(encoding='gzip') == saved + len(BODY) - len(b''.join(chunks))
+    assert compression.COMPRESSION_CPU_SECONDS.value(encoding='gzip') > 0
+
+def test_app_metrics_endpoint_compressed():
+    from app.main import create_app
+    client = TestClient(create_app())
+    response = client.get('/metrics', headers={'Accept-Encoding': 'gzip'})
+    assert response.status_code == 200
+    assert response.headers['content-encoding'] == 'gzip'
+    assert 'http_compression_saved_bytes_total' in response.text
@@ -0,0 +1,69 @@
+# test_etag.py - ETag / If-None-Match 조건부 조회 (sync / async 라우터)
+from app.services import todo_service, async_todo_service
+
+
+def test_list_not_modified(client, monkeypatch):
+    client.post("/todos/", json={"title": "etag 1"})
+    response = client.get("/todos/")
+    etag = response.headers["etag"]
+    assert response.status_code == 200
+
+    # 304 는 목록을 조회하지 않는다
+    def fail(*args, **kwargs):
+        raise AssertionError('list query executed')
+    monkeypatch.setattr(todo_service, 'get_todos', fail)
+    monkeypatch.setattr(async_todo_service, 'get_todos', fail)
+    response = client.get("/todos/", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b''
+    assert response.headers["etag"] == etag
+    assert client.get("/todos/", headers={"If-None-Match": f'"other", W/{etag}'}).status_code == 304
+
+def test_list_etag_changes_on_write(client):
+    todo_id = client.post("/todos/", json={"title": "etag 1"}).json()["id"]
+    etags = [client.get("/todos/").headers["etag"]]
+
+    client.post("/todos/", json={"title": "etag 2"})
+    etags.append(client.get("/todos/").headers["etag"])
+    client.put(f"/todos/{todo_id}", json={"title": "etag 1 updated", "description": None, "todo_date": None, "complete": 1})
+    etags.append(client.get("/todos/").headers["etag"])
+    client.delete(f"/todos/{todo_id}")
+    etags.append(client.get("/todos/").headers["etag"])
+    assert len(set(etags)) == len(etags)
+
+    # 페이지(limit/cursor)마다 본문이 다르므로 ETag 도 다르다
+    assert client.get("/todos/?limit=1").headers["etag"] != etags[-1]
+    response = client.get("/todos/", headers={"If-None-Match": etags[0]})
+    assert response.status_code == 200
+
+def test_list_etag_changes_when_last_todo_is_replaced(client):
+    # 마지막 일정을 삭제 후 생성하면 건수는 같고, todo 는 AUTOINCREMENT 이므로 삭제된 id 는 다시 발급되지 않는다
+    client.post("/todos/", json={"title": "reuse 1"})
+    last_id = client.post("/todos/", json={"title": "reuse 2"}).json()["id"]
+    etag = client.get("/todos/").headers["etag"]
+    client.delete(f"/todos/{last_id}")
+    assert client.post("/todos/", json={"title": "reuse 2"}).json()["id"] > last_id
+    response = client.get("/todos/", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+def test_list_etag_changes_after_future_updated_at_import(client):
+    # 가져온 행의 updated_at 이 미래여도 이후 수정은 ETag 를 바꾼다
+    body = b'{"title": "imported", "updated_at": "2999-01-01T00:00:00"}\n'
+    assert client.post("/todos/import?format=ndjson", content=body).json()["imported"] == 1
+    todo_id = client.get("/todos/").json()[0]["id"]
+    etag = client.get("/todos/").headers["etag"]
+    client.put(f"/todos/{todo_id}", json={"title": "imported", "description": None, "todo_date": None, "complete": 1})
+    assert client.get("/todos/", headers={"If-None-Match": etag}).status_code == 200
+
+def test_item_not_modified(client):
+    todo_id = client.post("/todos/", json={"title": "etag item"}).json()["id"]
+    response = client.get(f"/todos/{todo_id}")
+    etag = response.headers["etag"]
+    assert client.get(f"/todos/{todo_id}", headers={"If-None-Match": etag}).status_code == 304
+
+    client.put(f"/todos/{todo_id}", json={"title": "etag item", "description": None, "todo_date": None, "complete": 1})
+    response = client.get(f"/todos/{todo_id}", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["complete"] == 1
+    assert response.headers["etag"] != etag
@@ -0,0 +1,66 @@
+# test_hasher.py
+from fastapi.testclient import TestClient
+from app.main import app
+from app.utils import hasher
+from app.utils.hasher import BcryptHasher, ScryptHasher
+from app.db.database import SessionLocal
+from app.crud import user as user_crud
+
+client = TestClient(app)
+
+
+def test_scrypt_roundtrip():
+    scrypt = ScryptHasher(ln=10, r=8, p=1)
+    hashed = scrypt.hash('1234')
+    assert hashed.startswith('$scrypt$ln=10,r=8,p=1$')
+    assert scrypt.verify('1234', hashed)
+    assert not scrypt.verify('4321', hashed)
+    assert not scrypt.needs_rehash(hashed)
+    assert ScryptHasher(ln=11).needs_rehash(hashed)
+
+def test_bcrypt_needs_rehash_on_cost_change():
+    hashed = BcryptHasher(rounds=4).hash('1234')
+    assert BcryptHasher(rounds=4).verify('1234', hashed)
+    assert not BcryptHasher(rounds=4).needs_rehash(hashed)
+    assert BcryptHasher(rounds=5).needs_rehash(hashed)
+
+def test_rehash_on_login(monkeypatch):
+    user_data = {"email": "rehash@example.com", "name": "pytest", "password": "1234"}
+    assert client.post("/users/signup", json=user_data).status_code == 200
+
+    # 정책을 scrypt 로 변경 -> 로그인 시 기존 bcrypt 해시가 scrypt 로 교체
+    scrypt = ScryptHasher(ln=10, r=8, p=1)
+    monkeypatch.setattr(hasher, "current_hasher", scrypt)
+    monkeypatch.setattr(hasher, "hashers", [scrypt, BcryptHasher()])
+    login = {"email": user_data["email"], "password": user_data["password"], "device_id": "rehash"}
+    response = client.post("/users/login", data=login)
+    assert response.status_code == 200
+
+    with SessionLocal() as db:
+        assert user_crud.get_user(db, user_data["email"]).password.startswith('$scrypt$')
+    assert client.post("/users/login", data=login).status_code == 200
+
+    response = client.request(
+        method="DELETE",
+        url="/users/me",
+        json={"password": user_data["password"]},
+        headers={"Authorization": f"Bearer {response.json()['access_token']}"}
+    )
+    assert response.status_code == 200
+
+def test_no_rehash_on_password_check_outside_login(monkeypatch):
+    user_data = {"email": "no_rehash@example.com", "name": "pytest", "password": "1234"}
+    assert client.post("/users/signup", json=user_data).status_code == 200
+    login = {"email": user_data["email"], "password": user_data["password"], "device_id": "no_rehash"}
+    token = client.post("/users/login", data=login).json()["access_token"]
+
+    # 정책이 바뀌어도 DELETE /users/me 의 암호 확인은 재해시하지 않는다 (재해시는 로그인에서만)
+    scrypt = ScryptHasher(ln=10, r=8, p=1)
+    monkeypatch.setattr(hasher, "current_hasher", scrypt)
+    monkeypatch.setattr(hasher, "hashers", [scrypt, BcryptHasher()])
+    rehashed = []
+    monkeypatch.setattr(user_crud, "update_password", lambda *args: rehashed.append(args))
+    response = client.request(method="DELETE", url="/users/me", json={"password": user_data["password"]},
+                              headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert rehashed == []
@@ -0,0 +1,99 @@
+# test_logging.py - QueueHandler/QueueListener JSON 로그 (request ID, 비밀값 가림, 모듈별 레벨, DEBUG 샘플링)
+import io
+import json
+import logging
+import queue
+import pytest
+from fastapi.testclient import TestClient
+from app.main import create_app
+from app.core import config, logging_setup
+
+user_data = {
+        "email": "logging_tester@example.com",
+        "name": "pytest",
+        "password": "log-secret-pw"
+    }
+
+@pytest.fixture
+def log_stream(monkeypatch):
+    monkeypatch.setattr(config, 'LOG_LEVELS', 'app.crud.user=INFO,app.utils.jwt_handler=WARNING')
+    stream = io.StringIO()
+    logging_setup.configure(stream)
+    yield stream
+    logging_setup.shutdown()
+    # 다른 테스트에 영향이 없도록 레벨 되돌림
+    for name in ('app.crud.user', 'app.utils.jwt_handler'):
+        logging.getLogger(name).setLevel(logging.NOTSET)
+    logging.getLogger().setLevel(logging.WARNING)
+
+def records(stream) -> list:
+    return [json.loads(line) for line in stream.getvalue().splitlines()]
+
+
+def test_redact():
+    text = "name='pytest' new_password='secret1' password=secret2 Authorization: Bearer abc.def"
+    assert logging_setup.redact(text) == "name='pytest' new_password='***' password=*** Authorization: ***"
+    assert logging_setup.redact({'refresh_token': 'x', 'nested': {'Password': 'y', 'id': 1}, 'items': ['access_token=z'], 'token_version': 2}) == \
+        {'refresh_token': '***', 'nested': {'Password': '***', 'id': 1}, 'items': ['access_token=***'], 'token_version': 2}
+
+def test_parse_levels():
+    assert logging_setup.parse_levels('app.db=debug, sqlalchemy.engine=INFO,,bad') == {'app.db': 'DEBUG', 'sqlalchemy.engine': 'INFO'}
+
+def test_json_record_with_request_id(log_stream):
+    client = TestClient(create_app())
+    client.post("/users/signup", json=user_data)
+    token = client.post("/users/login", data={"email": user_data["email"], "password": user_data["password"], "device_id": "logging"}).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}", "X-Request-ID": "req-123"}
+    try:
+        response = client.put("/users/me", json={"name": "renamed", "old_password": user_data["password"], "new_password": user_data["password"]}, headers=headers)
+        assert response.status_code == 200
+        assert response.headers["x-request-id"] == "req-123"
+    finally:
+        client.request("DELETE", "/users/me", json={"password": user_data["password"]}, headers=headers)
+    logging_setup.shutdown()  # 큐 비우기
+
+    updated = [record for record in records(log_stream) if record['message'] == 'user updated']
+    assert len(updated) == 1
+    assert updated[0]['request_id'] == 'req-123'
+    assert updated[0]['logger'] == 'app.crud.user'
+    assert updated[0]['level'] == 'INFO'
+    assert updated[0]['token_version'] >= 1
+    # jwt_handler 는 WARNING 으로 설정되어 debug 레코드 없음, 암호는 어디에도 남지 않음
+    assert not any(record['logger'] == 'app.utils.jwt_handler' for record in records(log_stream))
+    assert user_data["password"] not in log_stream.getvalue()
+
+def test_generated_request_id():
+    client = TestClient(create_app())
+    first = client.get("/").headers["x-request-id"]
+    assert len(first) == 32 and first != client.get("/").headers["x-request-id"]
+    # 형식이 맞지 않는 값은 새로 발급
+    assert client.get("/", headers={"X-Request-ID": "bad id\t"}).headers["x-request-id"] != "bad id\t"
+
+def test_secret_fields_and_exception_redacted(log_stream):
+    logger = logging.getLogger('app.tests.logging')
+    try:
+        raise ValueError("password='hunter2'")
+    except ValueError:
+        logger.error('failed for %s', {'refresh_token': 'abc'}, exc_info=True, extra={'access_token': 'abc', 'user_id': 7})
+    logging_setup.shutdown()
+    record = records(log_stream)[-1]
+    assert record['message'] == "failed for {'refresh_token': '***'}"
+    assert record['access_token'] == '***' and record['user_id'] == 7
+    assert "password='***'" in record['exc'] and 'hunter2' not in record['exc']
+    assert record['request_id'] is None
+
+def test_debug_sampling():
+    sampler = logging_setup.DebugSampler(0.0)
+    debug = logging.LogRecord('app', logging.DEBUG, '', 0, 'debug', (), None)
+    info = logging.LogRecord('app', logging.INFO, '', 0, 'info', (), None)
+    assert not sampler.filter(debug)
+    assert sampler.filter(info)
+    assert logging_setup.DebugSampler(1.0).filter(debug)
+
+def test_full_queue_drops_without_blocking():
+    handler = logging_setup.RequestQueueHandler(queue.Queue(1))
+    dropped = logging_setup.DROPPED_RECORDS.value()
+    for _ in range(3):
+        handler.handle(logging.LogRecord('app', logging.INFO, '', 0, 'message', (), None))
+    assert handler.queue.qsize() == 1
+    assert logging_setup.DROPPED_RECORDS.value() == dropped + 2
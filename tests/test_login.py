@@ -30,6 +30,35 @@ def test_login_success():
     assert "access_token" in data
     assert "refresh_token" in data
     assert data["token_type"] == "bearer"
+
+def test_login_upserts_hashed_refresh_token():
+    from app.db.database import SessionLocal
+    from app.db.models import User_Token
+    from app.utils import jwt_handler
+    for _ in range(2):
+        response = client.post("/users/login", data={
+            "email": user_data["email"],
+            "password": user_data["password"],
+            "device_id": "string2"
+        })
+        assert response.status_code == 200
+    with SessionLocal() as db:
+        rows = db.query(User_Token).filter(User_Token.device_id == "string2").all()
+    # 같은 기기의 재로그인은 한 행을 갱신하고, 토큰 원문 대신 해시만 저장
+    assert len(rows) == 1
+    assert rows[0].refresh_token_hash == jwt_handler.hash_token(response.json()["refresh_token"])
+
+def test_login_password_hasher_busy(monkeypatch):
+    # 해시 대기열이 가득 차면 bcrypt 를 실행하지 않고 503 + Retry-After
+    from app.utils import bcrypt as bc
+    monkeypatch.setattr(bc, "_in_flight", bc._limit)
+    response = client.post("/users/login", data={
+        "email": user_data["email"],
+        "password": user_data["password"],
+        "device_id": "string2"
+    })
+    assert response.status_code == 503
+    assert "Retry-After" in response.headers
     
 @pytest.fixture
 def get_token():
@@ -102,4 +131,10 @@ def test_delete_user(get_token):
         json={"password": user_data["password"]},
         headers={"Authorization": f"Bearer {get_token['access_token']}"}
     )
-    assert response.status_code==200
\ No newline at end of file
+    assert response.status_code==200
+    # 삭제된 사용자의 토큰은 캐시에 남아있지 않아야 함
+    response = client.get(
+        "/users/me",
+        headers={"Authorization": f"Bearer {get_token['access_token']}"}
+    )
+    assert response.status_code == 401
\ No newline at end of file
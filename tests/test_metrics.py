@@ -0,0 +1,68 @@
+# test_metrics.py
+from fastapi.testclient import TestClient
+from app.main import create_app
+from app.core import metrics
+
+client = TestClient(create_app())
+
+user_data = {
+        "email": "metrics_tester@example.com",
+        "name": "pytest",
+        "password": "1234"
+    }
+
+
+def test_histogram_render():
+    registry = metrics.Registry()
+    histogram = metrics.Histogram('demo_seconds', 'demo', ['route'], buckets=(0.1, 1.0), registry=registry)
+    histogram.observe(0.05, route='/a')
+    histogram.observe(0.5, route='/a')
+    histogram.observe(5, route='/a')
+    text = registry.render()
+    assert '# TYPE demo_seconds histogram' in text
+    assert 'demo_seconds_bucket{route="/a",le="0.1"} 1' in text
+    assert 'demo_seconds_bucket{route="/a",le="1.0"} 2' in text
+    assert 'demo_seconds_bucket{route="/a",le="+Inf"} 3' in text
+    assert 'demo_seconds_count{route="/a"} 3' in text
+
+def test_counter_label_escape():
+    registry = metrics.Registry()
+    counter = metrics.Counter('demo_total', 'demo', ['path'], registry=registry)
+    counter.inc(path='a"b')
+    assert 'demo_total{path="a\\"b"} 1.0' in registry.render()
+
+def test_request_metrics_by_route_template():
+    client.post("/users/signup", json=user_data)
+    token = client.post("/users/login", data={"email": user_data["email"], "password": user_data["password"], "device_id": "metrics"}).json()
+    headers = {"Authorization": f"Bearer {token['access_token']}"}
+    before = metrics.HTTP_REQUESTS.value(method='GET', route='/todos/{id}', status='404')
+    statements = metrics.REQUEST_DB_STATEMENTS.count(route='/todos/{id}')
+    try:
+        assert client.get("/todos/987654321", headers=headers).status_code == 404
+    finally:
+        client.request("DELETE", "/users/me", json={"password": user_data["password"]}, headers=headers)
+
+    assert metrics.HTTP_REQUESTS.value(method='GET', route='/todos/{id}', status='404') == before + 1
+    assert metrics.REQUEST_DB_STATEMENTS.count(route='/todos/{id}') == statements + 1
+    assert metrics.REQUEST_PHASE_SECONDS.count(route='/users/login', phase='password_hash') >= 1
+    assert metrics.HTTP_IN_PROGRESS.value(method='GET') == 0
+
+def test_metrics_endpoint():
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers['content-type'].startswith('text/plain; version=0.0.4')
+    assert 'http_request_duration_seconds_bucket' in response.text
+    assert 'db_query_duration_seconds_count' in response.text
+    assert 'principal_cache_hits_total' in response.text
+    assert 'password_hasher_in_flight' in response.text
+
+def test_compiled_cache_hits():
+    # 미리 만든 조회문(crud.user.USER_BY_EMAIL 등)은 두 번째 실행부터 컴파일 캐시 적중
+    from app.db.database import SessionLocal
+    from app.crud import user as user_crud
+    with SessionLocal() as db:
+        user_crud.get_user(db, 'compiled_cache@example.com')
+        hits = metrics.DB_COMPILE_CACHE.value(result='hit')
+        user_crud.get_user(db, 'compiled_cache_other@example.com')
+    assert metrics.DB_COMPILE_CACHE.value(result='hit') == hits + 1
+    assert 'db_compiled_cache_total{result="hit"}' in client.get("/metrics").text
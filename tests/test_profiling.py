@@ -0,0 +1,86 @@
+# test_profiling.py - 요청 단위 프로파일 (관리자 헤더 / 샘플링, 파일 ring, route / SQL 문 수 / bcrypt, jose 시간 기록)
+import os
+import pytest
+from app.main import create_app
+from app.core import config, profiler
+from app.api.middleware.profiling import ProfilingMiddleware
+
+TOKEN = 'profile-secret'
+
+def read_profile(path):
+    with open(path, encoding='utf-8') as file:
+        header, _, body = file.read().partition('\n\n')
+    annotations = dict(line[2:].split(': ', 1) for line in header.splitlines())
+    return annotations, body
+
+@pytest.fixture
+def ring(tmp_path, monkeypatch):
+    ring = profiler.ProfileRing(str(tmp_path), 3)
+    monkeypatch.setattr(profiler, 'ring', ring)
+    monkeypatch.setattr(config, 'PROFILING_ENABLED', True)
+    monkeypatch.setattr(config, 'PROFILING_TOKEN', TOKEN)
+    monkeypatch.setattr(config, 'PROFILING_SAMPLE_RATE', 0.0)
+    return ring
+
+@pytest.fixture
+def client_config(ring):
+    # conftest 의 client fixture 가 create_app 하기 전에 프로파일 설정
+    return ring
+
+
+def test_disabled_not_installed():
+    app = create_app()
+    assert ProfilingMiddleware not in [middleware.cls for middleware in app.user_middleware]
+
+@pytest.mark.parametrize('mode', ['cprofile', 'sampler'])
+def test_header_triggered_profile(client, ring, monkeypatch, mode):
+    monkeypatch.setattr(config, 'PROFILING_MODE', mode)
+    monkeypatch.setattr(config, 'PROFILING_SAMPLER_INTERVAL', 0.001)
+    response = client.post("/users/login", data={"email": client.user["email"], "password": client.user["password"], "device_id": "profile"},
+                           headers={config.PROFILING_HEADER: TOKEN})
+    assert response.status_code == 200
+    path = os.path.join(ring.directory, response.headers['x-profile-id'])
+    annotations, body = read_profile(path)
+    assert annotations['trigger'] == 'header'
+    assert annotations['mode'] == mode
+    assert annotations['route'] == '/users/login'
+    assert annotations['status'] == '200'
+    assert int(annotations['db_statements']) > 0
+    assert float(annotations['password_hash_ms']) > 0
+    assert float(annotations['jwt_ms']) > 0
+    if mode == 'cprofile':
+        assert 'cumulative' in body
+    else:
+        assert body.startswith('# samples: ')
+
+def test_not_triggered(client, ring):
+    headers = {config.PROFILING_HEADER: 'wrong-secret'}
+    response = client.post("/users/login", data={"email": client.user["email"], "password": client.user["password"], "device_id": "profile"}, headers=headers)
+    assert response.status_code == 200
+    assert 'x-profile-id' not in response.headers
+    assert os.listdir(ring.directory) == []
+
+def test_sampled_profile(client, ring, monkeypatch):
+    monkeypatch.setattr(config, 'PROFILING_SAMPLE_RATE', 1.0)
+    client.app.middleware_stack = None
+    response = client.get("/")
+    assert response.status_code == 200
+    # 샘플링된 요청에는 결과 파일 이름을 노출하지 않음
+    assert 'x-profile-id' not in response.headers
+    annotations, _ = read_profile(ring.path(0))
+    assert annotations['trigger'] == 'sample'
+    assert annotations['route'] == '/'
+
+def test_ring_overwrites_oldest(tmp_path):
+    ring = profiler.ProfileRing(str(tmp_path), 2)
+    paths = [ring.reserve() for _ in range(3)]
+    assert paths == [ring.path(0), ring.path(1), ring.path(0)]
+    for n, path in enumerate(paths):
+        ring.write(path, {'n': n}, '')
+        os.utime(path, (n, n))
+    assert sorted(os.listdir(tmp_path)) == ['profile-000.txt', 'profile-001.txt']
+    # 재시작 후에는 가장 최근 파일 다음 slot 부터
+    assert profiler.ProfileRing(str(tmp_path), 2).reserve() == ring.path(1)
+    # 파일 수는 1 이상 (0 이면 slot 계산이 0 으로 나누게 됨)
+    with pytest.raises(ValueError):
+        profiler.ProfileRing(str(tmp_path), 0)
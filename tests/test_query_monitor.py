@@ -0,0 +1,88 @@
+# test_query_monitor.py - 느린 SQL 로그 / N+1 감지
+import asyncio
+import logging
+from datetime import datetime
+import pytest
+from app.core import request_context
+from app.db import query_monitor
+from app.db.database import SessionLocal, AsyncSessionLocal, async_engine
+from app.crud import todo as td_crud
+from app.crud import async_todo as async_td_crud
+
+
+def test_statement_shape_collapses_in_lists():
+    a = query_monitor.statement_shape('SELECT * FROM todo WHERE id IN (?, ?, ?) LIMIT 10')
+    b = query_monitor.statement_shape('SELECT *\n FROM todo WHERE id IN (?) LIMIT 20')
+    assert a == b
+
+def test_slow_query_logged_with_plan(monkeypatch, caplog):
+    monkeypatch.setattr(query_monitor, 'SLOW_QUERY_THRESHOLD', 0.0)
+    with caplog.at_level(logging.WARNING, logger='app.db.query_monitor'):
+        with SessionLocal() as db:
+            td_crud.search_todos(db, 1, None, datetime(2025, 5, 13))
+    messages = [r.getMessage() for r in caplog.records if 'slow query' in r.getMessage()]
+    assert messages
+    assert 'ix_todo_user_date' in messages[-1]
+    assert 'route=-' in messages[-1]
+
+def test_slow_query_explain_async(monkeypatch, caplog):
+    monkeypatch.setattr(query_monitor, 'SLOW_QUERY_THRESHOLD', 0.0)
+
+    async def run():
+        async with AsyncSessionLocal() as db:
+            await async_td_crud.search_todos(db, 1, None, datetime(2025, 5, 13))
+        # 이 이벤트 루프에서 만든 aiosqlite 연결 정리
+        await async_engine.dispose()
+
+    with caplog.at_level(logging.WARNING, logger='app.db.query_monitor'):
+        asyncio.run(run())
+    assert any('ix_todo_user_date' in r.getMessage() for r in caplog.records)
+
+def test_repeated_statements_raise(monkeypatch):
+    monkeypatch.setattr(query_monitor, 'REPEAT_LIMIT', 3)
+    monkeypatch.setattr(query_monitor, 'REPEAT_ACTION', 'raise')
+    context, token = request_context.begin()
+    try:
+        with SessionLocal() as db:
+            for todo_id in range(3):
+                td_crud.get_todo_by_id(db, todo_id, 1)
+            with pytest.raises(Exception) as exc_info:
+                td_crud.get_todo_by_id(db, 99, 1)
+    finally:
+        request_context.end(token)
+    assert 'N+1' in str(exc_info.value)
+
+def test_repeated_statements_warn(monkeypatch, caplog):
+    monkeypatch.setattr(query_monitor, 'REPEAT_LIMIT', 2)
+    monkeypatch.setattr(query_monitor, 'REPEAT_ACTION', 'warn')
+    context, token = request_context.begin()
+    try:
+        with caplog.at_level(logging.WARNING, logger='app.db.query_monitor'):
+            with SessionLocal() as db:
+                for todo_id in range(5):
+                    td_crud.get_todo_by_id(db, todo_id, 1)
+    finally:
+        request_context.end(token)
+    assert len([r for r in caplog.records if 'N+1' in r.getMessage()]) == 1
+
+def test_repeated_statements_detected_without_metrics(monkeypatch):
+    # request context 는 MetricsMiddleware 가 아닌 RequestContextMiddleware 가 만들므로 METRICS_ENABLED=false 에서도 감지
+    from fastapi.testclient import TestClient
+    from app.core import config
+    from app.main import create_app
+    monkeypatch.setattr(config, 'METRICS_ENABLED', False)
+    monkeypatch.setattr(query_monitor, 'REPEAT_LIMIT', 2)
+    monkeypatch.setattr(query_monitor, 'REPEAT_ACTION', 'warn')
+    app = create_app('sync')
+
+    @app.get('/n-plus-one')
+    def n_plus_one():
+        with SessionLocal() as db:
+            for todo_id in range(3):
+                td_crud.get_todo_by_id(db, todo_id, 1)
+        return request_context.current().route
+
+    before = query_monitor.REPEATED_STATEMENTS.value(route='/n-plus-one')
+    response = TestClient(app).get('/n-plus-one')
+    assert response.json() == '/n-plus-one'
+    assert query_monitor.REPEATED_STATEMENTS.value(route='/n-plus-one') == before + 1
@@ -0,0 +1,49 @@
+# test_query_plan.py - 날짜 조건이 ix_todo_user_date 인덱스를 사용하는지 확인
+from datetime import datetime
+from app.db.database import engine, SessionLocal
+from app.crud import todo as td_crud
+
+
+def query_plans(statements, fn):
+    statements.clear()
+    with SessionLocal() as db:
+        fn(db)
+    executed = list(statements)
+    with engine.connect() as conn:
+        return [' | '.join(row[3] for row in conn.exec_driver_sql('EXPLAIN QUERY PLAN ' + statement, parameters))
+                for statement, parameters, _ in executed]
+
+def test_search_by_date_uses_composite_index(statements):
+    plans = query_plans(statements, lambda db: td_crud.search_todos(db, 1, None, datetime(2025, 5, 13)))
+    assert len(plans) == 1
+    assert 'ix_todo_user_date (user_id=? AND todo_date>? AND todo_date<?)' in plans[0]
+
+def test_range_uses_composite_index_without_sort(statements):
+    plans = query_plans(statements, lambda db: td_crud.get_todos_in_range(db, 1, datetime(2025, 5, 1), datetime(2025, 6, 1), limit=10))
+    assert 'ix_todo_user_date' in plans[0]
+    assert 'TEMP B-TREE' not in plans[0]
+
+def test_range_cursor_uses_composite_index(statements):
+    plans = query_plans(statements, lambda db: td_crud.get_todos_in_range(db, 1, datetime(2025, 5, 1), datetime(2025, 6, 1), 10, (datetime(2025, 5, 13), 3)))
+    assert 'ix_todo_user_date' in plans[0]
+    assert 'TEMP B-TREE' not in plans[0]
+
+def test_todos_version_uses_covering_index(statements):
+    plans = query_plans(statements, lambda db: td_crud.get_todos_version(db, 1))
+    assert 'COVERING INDEX ix_todo_user_seq' in plans[0]
+    assert 'COVERING INDEX ix_todo_tombstone_user_seq' in plans[0]
+
+def test_changes_use_seq_indexes_without_sort(statements):
+    plans = query_plans(statements, lambda db: td_crud.get_changes(db, 1, 100, 50))
+    # plans[0] 은 todo_change_seq 한 행 조회
+    assert 'ix_todo_user_seq (user_id=? AND seq>?)' in plans[1]
+    assert 'ix_todo_tombstone_user_seq (user_id=? AND seq>?)' in plans[2]
+    assert all('TEMP B-TREE' not in plan for plan in plans)
+
+def test_todos_page_statement_uses_user_index(statements):
+    # 첫 페이지(after_id=0) / 다음 페이지 / limit 없음 모두 같은 문을 재사용하며 정렬 없이 user_id 인덱스 범위 검색
+    plans = query_plans(statements, lambda db: (td_crud.get_todos(db, 1, 10), td_crud.get_todos(db, 1, 10, 3), td_crud.get_todos(db, 1)))
+    assert len(plans) == 3
+    for plan in plans:
+        assert 'ix_todo_user_id (user_id=? AND rowid>?)' in plan
+        assert 'TEMP B-TREE' not in plan
@@ -0,0 +1,102 @@
+# test_rate_limit.py - 암호 검증 route 요청 한도 (IP / email token bucket, 해시 대기열)
+import threading
+import pytest
+from fastapi.testclient import TestClient
+from app.main import create_app
+from app.core import config
+from app.utils import rate_limit
+from app.utils import bcrypt as bc
+
+client = TestClient(create_app('sync'))
+async_client = TestClient(create_app('async'))
+
+
+def login(client, email, headers=None):
+    return client.post("/users/login", data={"email": email, "password": "1234", "device_id": "rate_limit"}, headers=headers)
+
+
+def test_token_bucket(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(rate_limit.time, 'monotonic', lambda: now[0])
+    store = rate_limit.MemoryRateLimitStore(maxsize=2)
+    assert store.hit('a', 2, 1.0) == 0
+    assert store.hit('a', 2, 1.0) == 0
+    assert store.hit('a', 2, 1.0) == pytest.approx(1.0)
+    now[0] += 0.5
+    assert store.hit('a', 2, 1.0) == pytest.approx(0.5)
+    now[0] += 0.5
+    assert store.hit('a', 2, 1.0) == 0
+    # key 수 제한 : 오래 쓰지 않은 key 부터 evict
+    store.hit('b', 2, 1.0)
+    store.hit('c', 2, 1.0)
+    assert store.stats()['size'] == 2
+    assert store.stats()['evictions'] == 1
+    assert store.stats()['rejected'] == 2
+
+def test_login_email_limit(monkeypatch, statements):
+    monkeypatch.setattr(config, 'RATE_LIMIT_EMAIL_PER_MINUTE', 2)
+    for _ in range(2):
+        assert login(client, "limited@example.com").status_code == 404
+    statements.clear()
+    response = login(client, " Limited@Example.com")
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    # 한도 초과 요청은 DB 조회 없이 거부
+    assert statements == []
+    assert login(client, "other@example.com").status_code == 404
+
+def test_login_ip_limit(monkeypatch):
+    monkeypatch.setattr(config, 'RATE_LIMIT_IP_PER_MINUTE', 1)
+    assert login(client, "ip_1@example.com").status_code == 404
+    assert login(client, "ip_2@example.com").status_code == 429
+    # X-Forwarded-For 는 RATE_LIMIT_TRUST_FORWARDED 일 때만 사용
+    assert login(client, "ip_3@example.com", headers={"X-Forwarded-For": "10.0.0.1"}).status_code == 429
+    monkeypatch.setattr(config, 'RATE_LIMIT_TRUST_FORWARDED', True)
+    assert login(client, "ip_4@example.com", headers={"X-Forwarded-For": "10.0.0.1, 10.0.0.2"}).status_code == 404
+
+def test_forwarded_leading_entry_spoofing(monkeypatch):
+    # 클라이언트가 맨 앞 주소를 매번 바꿔도 프록시가 덧붙인 주소(오른쪽)로 계산하므로 한도를 피할 수 없다
+    monkeypatch.setattr(config, 'RATE_LIMIT_IP_PER_MINUTE', 1)
+    monkeypatch.setattr(config, 'RATE_LIMIT_TRUST_FORWARDED', True)
+    assert login(client, "spoof_1@example.com", headers={"X-Forwarded-For": "1.1.1.1, 203.0.113.7"}).status_code == 404
+    assert login(client, "spoof_2@example.com", headers={"X-Forwarded-For": "2.2.2.2, 203.0.113.7"}).status_code == 429
+    # 프록시 2단 : 오른쪽에서 두 번째가 클라이언트
+    monkeypatch.setattr(config, 'RATE_LIMIT_TRUSTED_HOPS', 2)
+    assert login(client, "spoof_3@example.com", headers={"X-Forwarded-For": "3.3.3.3, 203.0.113.7, 10.0.0.9"}).status_code == 429
+    assert login(client, "spoof_4@example.com", headers={"X-Forwarded-For": "3.3.3.3, 203.0.113.8, 10.0.0.9"}).status_code == 404
+
+def test_password_hasher_full_before_db(monkeypatch, statements):
+    monkeypatch.setattr(bc, "_in_flight", bc._limit)
+    response = login(client, "busy@example.com")
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(config.PASSWORD_HASH_RETRY_AFTER)
+    assert statements == []
+
+def test_password_hasher_in_flight_limit(monkeypatch):
+    # 동시 해시 작업은 threadpool 보다 충분히 작은 한도까지만 받고, 끝나면 자체 카운터에서 반환
+    assert bc._limit <= 40 // 4
+    monkeypatch.setattr(bc, "_limit", 1)
+    release = threading.Event()
+    future = bc._submit(release.wait)
+    assert bc.stats()["in_flight"] == 1
+    with pytest.raises(bc.PasswordHasherBusy):
+        bc._submit(release.wait)
+    with pytest.raises(bc.PasswordHasherBusy):
+        bc.check_capacity()
+    release.set()
+    future.result()
+    assert bc.stats()["in_flight"] == 0
+    bc.check_capacity()
+
+def test_user_update_limit_async(monkeypatch):
+    user = {"email": "rate_limit_async@example.com", "name": "pytest", "password": "1234"}
+    assert async_client.post("/users/signup", json=user).status_code == 200
+    token = login(async_client, user["email"]).json()["access_token"]
+    headers = {"Authorization": f"Bearer {token}"}
+    monkeypatch.setattr(config, 'RATE_LIMIT_EMAIL_PER_MINUTE', 1)
+    update = {"name": "renamed", "old_password": "wrong", "new_password": "1234"}
+    assert async_client.put("/users/me", json=update, headers=headers).status_code == 400
+    assert async_client.put("/users/me", json=update, headers=headers).status_code == 429
+    monkeypatch.setattr(config, 'RATE_LIMIT_ENABLED', False)
+    response = async_client.request("DELETE", "/users/me", json={"password": user["password"]}, headers=headers)
+    assert response.status_code == 200
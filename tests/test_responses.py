@@ -0,0 +1,34 @@
+# test_responses.py - Row 튜플 fast path 가 response_model 직렬화와 같은 JSON 을 만드는지 확인
+import asyncio
+from datetime import datetime
+from typing import List
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+from app.api import responses
+from app.schemas import todo as td_scheme
+
+ROWS = [
+    (1, 1, '회의 준비 "quoted"', None, datetime(2025, 5, 13, 9, 30, 0, 123000), 0, datetime(2025, 5, 1), None),
+    (2, 1, 'back\\slash', 'line\nbreak', None, 1, datetime(2025, 5, 1, 0, 0, 1), datetime(2025, 5, 2, 3, 4, 5, 6)),
+]
+
+def model_json(model, content) -> bytes:
+    field = create_model_field(name='Response', type_=List[model], mode='serialization')
+    return JSONResponse(asyncio.run(serialize_response(field=field, response_content=content))).body
+
+
+def test_todo_rows_match_response_model():
+    expected = model_json(td_scheme.TodoResponse, [dict(zip(td_scheme.TODO_RESPONSE_FIELDS, row)) for row in ROWS])
+    assert responses.todo_rows(ROWS, Response()).body == expected
+
+def test_todo_search_rows_match_response_model():
+    rows = [row + ('<b>회의</b>', -1.5) for row in ROWS]
+    expected = model_json(td_scheme.TodoSearchResponse, [dict(zip(td_scheme.TODO_SEARCH_FIELDS, row)) for row in rows])
+    assert responses.todo_search_rows(rows, Response()).body == expected
+
+def test_headers_are_copied():
+    response = Response()
+    response.headers['X-Next-Cursor'] = 'abc'
+    assert responses.todo_rows([], response).headers['x-next-cursor'] == 'abc'
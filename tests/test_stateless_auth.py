@@ -0,0 +1,73 @@
+# test_stateless_auth.py - AUTH_TOKEN_MODE=stateless (토큰 email/ver 클레임 + 사용자별 버전 맵)
+import pytest
+from app.core import config, token_versions
+from app.utils import jwt_handler
+
+
+@pytest.fixture
+def client_config(monkeypatch):
+    # conftest 의 client fixture 가 create_app 하기 전에 적용
+    monkeypatch.setattr(config, 'AUTH_TOKEN_MODE', 'stateless')
+
+def login(client, device_id="stateless", password=None):
+    response = client.post("/users/login", data={"email": client.user["email"], "password": password or client.user["password"], "device_id": device_id})
+    assert response.status_code == 200
+    return response.json()
+
+def auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_token_claims(client):
+    claims = jwt_handler.decode_token(login(client)["access_token"])
+    assert claims["email"] == client.user["email"]
+    assert claims["ver"] == 0
+
+def users_statements(statements):
+    return [statement for statement, _, _ in statements if 'FROM users' in statement]
+
+def test_authenticate_without_users_row(client, statements):
+    tokens = login(client)
+    token_versions.cache.clear()
+    statements.clear()
+    assert client.get("/todos", headers=auth(tokens["access_token"])).status_code == 200
+    # 버전 맵이 비어 있으면 token_version 한 컬럼만 조회
+    users = users_statements(statements)
+    assert len(users) == 1 and 'users.token_version' in users[0] and 'users.email' not in users[0]
+
+    refreshed = client.post("/users/refresh", json={"refresh_token": tokens["refresh_token"]}).json()
+    statements.clear()
+    assert client.get("/todos", headers=auth(refreshed["access_token"])).status_code == 200
+    assert users_statements(statements) == []
+
+def test_user_update_revokes_tokens(client):
+    old = login(client)["access_token"]
+    assert client.get("/todos", headers=auth(old)).status_code == 200
+    response = client.put("/users/me", json={"name": "renamed", "old_password": client.user["password"], "new_password": "5678"}, headers=auth(old))
+    assert response.status_code == 200
+    client.user["password"] = "5678"
+
+    response = client.get("/todos", headers=auth(old))
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked."
+    new = login(client)["access_token"]
+    assert jwt_handler.decode_token(new)["ver"] == 1
+    assert client.get("/todos", headers=auth(new)).status_code == 200
+
+def test_delete_user_revokes_tokens(client):
+    token = login(client)["access_token"]
+    response = client.request("DELETE", "/users/me", json={"password": client.user["password"]}, headers=auth(token))
+    assert response.status_code == 200
+    response = client.get("/todos", headers=auth(token))
+    assert response.status_code == 401
+    # 버전 맵이 비어 있어도 (다른 worker / TTL 만료) 행이 없으면 거부
+    token_versions.cache.clear()
+    assert client.get("/todos", headers=auth(token)).status_code == 401
+
+def test_token_without_claims_falls_back_to_lookup(client):
+    tokens = login(client)
+    claims = jwt_handler.decode_token(tokens["access_token"])
+    legacy = jwt_handler.create_access_token(data={"sub": claims["sub"], "device_id": claims["device_id"]})
+    response = client.get("/users/me", headers=auth(legacy))
+    assert response.status_code == 200
+    assert response.json()["email"] == client.user["email"]
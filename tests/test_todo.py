@@ -2,6 +2,7 @@
 from fastapi.testclient import TestClient
 from app.main import app
 import pytest
+import json
 
 client = TestClient(app)
 
@@ -12,6 +13,9 @@ user_data = {
         "password": "1234"
     }
 
+# test_create_todo 에서 만든 일정 id (first, second, third 순) : 삭제된 id 는 재사용되지 않으므로 고정값 대신 사용
+todo_ids = []
+
 @pytest.fixture
 def get_token():
     # 로그인 요청 (username, password에 맞는 값을 사용)
@@ -58,6 +62,7 @@ def test_create_todo(get_token):
     headers={"Authorization": f"Bearer {get_token['access_token']}"}
     )
     assert response.status_code==200
+    todo_ids.append(response.json()["id"])
     response = client.post("/todos", 
     json={
             "title": "second",
@@ -67,6 +72,7 @@ def test_create_todo(get_token):
     headers={"Authorization": f"Bearer {get_token['access_token']}"}
     )
     assert response.status_code==200
+    todo_ids.append(response.json()["id"])
     
     response = client.post("/todos", 
     json={
@@ -77,16 +83,41 @@ def test_create_todo(get_token):
     headers={"Authorization": f"Bearer {get_token['access_token']}"}
     )
     assert response.status_code==200
+    todo_ids.append(response.json()["id"])
+
+def test_get_todos_paginated(get_token):
+    headers = {"Authorization": f"Bearer {get_token['access_token']}"}
+    response = client.get("/todos/?limit=2", headers=headers)
+    assert response.status_code==200
+    first_page = response.json()
+    assert len(first_page)==2
+    next_cursor = response.headers["X-Next-Cursor"]
+
+    response = client.get(f"/todos/?limit=2&cursor={next_cursor}", headers=headers)
+    assert [todo["title"] for todo in response.json()]==["third"]
+    assert "X-Next-Cursor" not in response.headers
+
+    response = client.get("/todos/?cursor=not-a-cursor", headers=headers)
+    assert response.status_code==400
+
+def test_get_todos_stream(get_token):
+    response = client.get("/todos/?stream=true",
+    headers={"Authorization": f"Bearer {get_token['access_token']}"}
+    )
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert [todo["title"] for todo in lines]==["first","second","third"]
+    assert lines==client.get("/todos/", headers={"Authorization": f"Bearer {get_token['access_token']}"}).json()
 
 def test_get_todos(get_token):
-    response = client.get("/todos/2", 
+    response = client.get(f"/todos/{todo_ids[1]}", 
     headers={"Authorization": f"Bearer {get_token['access_token']}"}
     )
-    print(f'get todo/2: {len(response.json())}')
+    print(f'get todo/{todo_ids[1]}: {len(response.json())}')
     assert response.status_code==200
     
 def test_update_todo(get_token):
-    response = client.put("/todos/2", 
+    response = client.put(f"/todos/{todo_ids[1]}", 
     json={
             "title": "update test title",
             "description": "update description",
@@ -104,14 +135,64 @@ def test_get_todos_search(get_token):
     json_data = response.json()
     assert len(json_data)==2
     
+def test_get_todos_in_range(get_token):
+    headers = {"Authorization": f"Bearer {get_token['access_token']}"}
+    response = client.get("/todos/range?from=2025-05-13&to=2025-05-16&limit=2", headers=headers)
+    assert response.status_code==200
+    assert [todo["title"] for todo in response.json()]==["third","first"]
+    next_cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/todos/range?from=2025-05-13&to=2025-05-16&limit=2&cursor={next_cursor}", headers=headers)
+    assert [todo["title"] for todo in response.json()]==["update test title"]
+
+    response = client.get("/todos/range?from=2025-05-13&to=2025-05-13", headers=headers)
+    assert response.status_code==400
+
+def test_get_todos_full_text_search(get_token):
+    headers = {"Authorization": f"Bearer {get_token['access_token']}"}
+    response = client.get("/todos/search/?q=thi", headers=headers)
+    assert response.status_code==200
+    json_data = response.json()
+    assert [todo["title"] for todo in json_data]==["third"]
+    assert json_data[0]["snippet"]=="<b>third</b>"
+
+    response = client.get("/todos/search/?q=update des&limit=1", headers=headers)
+    assert [todo["id"] for todo in response.json()]==[todo_ids[1]]
+    assert "X-Next-Cursor" not in response.headers
+
 def test_delete_todos(get_token):
     response = client.request(
         method="DELETE",
-        url="/todos/3",
+        url=f"/todos/{todo_ids[2]}",
         headers={"Authorization": f"Bearer {get_token['access_token']}"}
     )
     assert response.status_code==200
 
+def test_batch_todos(get_token):
+    headers = {"Authorization": f"Bearer {get_token['access_token']}"}
+    response = client.post("/todos/batch", json={"operations": [
+        {"op": "create", "data": {"title": "batch one", "todo_date": "2025-06-01"}},
+        {"op": "create", "data": {"title": "batch two"}},
+        {"op": "create", "data": {"description": "no title"}},
+        {"op": "update", "id": todo_ids[0], "data": {"complete": 1}},
+        {"op": "delete", "id": 9999},
+    ]}, headers=headers)
+    assert response.status_code==200
+    results = response.json()["results"]
+    assert [result["status"] for result in results]==[200, 200, 400, 200, 404]
+    assert results[0]["todo"]["title"]=="batch one"
+    assert results[3]["todo"]["complete"]==1 and results[3]["todo"]["title"]=="first"
+    created_ids = [results[0]["id"], results[1]["id"]]
+
+    response = client.post("/todos/batch", json={"operations": [
+        {"op": "update", "id": created_ids[0], "data": {"title": "batch renamed"}},
+        {"op": "delete", "id": created_ids[1]},
+        {"op": "delete", "id": created_ids[1]},
+    ]}, headers=headers)
+    results = response.json()["results"]
+    assert [result["status"] for result in results]==[200, 200, 404]
+    assert results[0]["todo"]["title"]=="batch renamed"
+    assert client.get(f"/todos/{created_ids[1]}", headers=headers).status_code==404
+
 def test_delete_user(get_token):
     response = client.request(
         method="DELETE",
@@ -0,0 +1,54 @@
+# test_todo_cache.py - 사용자별 일정 조회 캐시 / 쓰기 무효화
+import pytest
+from app.db.database import SessionLocal
+from app.crud import user as user_crud
+from app.schemas import todo as td_scheme
+from app.schemas import user as user_schema
+from app.services import todo_service
+
+
+@pytest.fixture(params=['memory', 'shared'])
+def user_id(request, monkeypatch):
+    monkeypatch.setattr(todo_service, 'cache', todo_service.build_cache(request.param))
+    with SessionLocal() as db:
+        user = user_crud.create_user(db, user_schema.UserCreate(email=f'cache_{request.param}@example.com', name='pytest', password='x'))
+        user_id = user.id
+    yield user_id
+    with SessionLocal() as db:
+        user_crud.delete_user(user_id, db)
+
+
+
+def test_read_through_and_invalidation(user_id, statements):
+    with SessionLocal() as db:
+        todo = todo_service.create_todo(db, user_id, td_scheme.TodoCreate(title='cache 1'))
+        first = todo_service.get_todos(db, user_id)
+        item = todo_service.get_todo_by_id(db, todo.id, user_id)
+        version = todo_service.get_todos_version(db, user_id)
+        statements.clear()
+        assert todo_service.get_todos(db, user_id) == first
+        assert todo_service.get_todo_by_id(db, todo.id, user_id) == item
+        assert todo_service.get_todos_version(db, user_id) == version
+        assert statements == []
+
+        todo_service.update_todo(db, todo.id, user_id, td_scheme.TodoUpdate(title='cache 1 updated', description=None, todo_date=None, complete=1))
+        assert todo_service.get_todo_by_id(db, todo.id, user_id).title == 'cache 1 updated'
+        assert todo_service.get_todos(db, user_id)[0].complete == 1
+
+        todo_service.create_todo(db, user_id, td_scheme.TodoCreate(title='cache 2'))
+        assert len(todo_service.get_todos(db, user_id)) == 2
+        todo_service.delete_todo(db, todo.id, user_id)
+        assert todo_service.get_todo_by_id(db, todo.id, user_id) is None
+        assert [row.title for row in todo_service.get_todos(db, user_id)] == ['cache 2']
+
+    stats = todo_service.cache_stats()
+    assert stats['hits'] >= 3
+    assert stats['invalidations'] > 0
+
+def test_stale_read_is_not_stored(user_id):
+    # 조회 도중 쓰기로 무효화되면 조회 결과를 저장하지 않는다
+    value, generation = todo_service.cache_lookup(user_id, 'list:None:None')
+    assert value is None
+    todo_service.invalidate_user(user_id)
+    todo_service.cache_store(user_id, 'list:None:None', ['stale'], generation)
+    assert todo_service.cache_lookup(user_id, 'list:None:None')[0] is None
@@ -0,0 +1,82 @@
+# test_todo_changes.py - GET /todos/changes (변경 순번 seq 커서 + 삭제 기록)
+from app.db.database import SessionLocal
+from app.db.models import Todo_Tombstone
+from app.core import config
+from app.services import tombstone_purge_service
+
+
+def changes(client, since=None, limit=None):
+    params = {k: v for k, v in {"since": since, "limit": limit}.items() if v is not None}
+    response = client.get("/todos/changes", params=params)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_changes_since_cursor(client):
+    ids = [client.post("/todos/", json={"title": f"change {n}"}).json()["id"] for n in range(3)]
+    first = changes(client)
+    assert [todo["id"] for todo in first["changes"]] == ids
+    assert first["deleted"] == [] and first["has_more"] is False
+    seqs = [todo["seq"] for todo in first["changes"]]
+    assert seqs == sorted(seqs)
+
+    # 변경이 없으면 빈 응답과 같은 커서
+    assert changes(client, first["cursor"]) == {"changes": [], "deleted": [], "cursor": first["cursor"], "has_more": False}
+
+    client.put(f"/todos/{ids[0]}", json={"title": "changed", "description": None, "todo_date": None, "complete": 1})
+    client.delete(f"/todos/{ids[1]}")
+    client.post("/todos/batch", json={"operations": [{"op": "update", "id": ids[2], "data": {"complete": 1}}]})
+
+    # 수정 -> 삭제 -> 일괄 수정 순서를 limit 단위로 이어 받기
+    page = changes(client, first["cursor"], limit=1)
+    assert [todo["title"] for todo in page["changes"]] == ["changed"] and page["deleted"] == [] and page["has_more"]
+    page = changes(client, page["cursor"], limit=1)
+    assert page["changes"] == [] and [tombstone["id"] for tombstone in page["deleted"]] == [ids[1]] and page["has_more"]
+    page = changes(client, page["cursor"], limit=1)
+    assert [todo["id"] for todo in page["changes"]] == [ids[2]] and page["has_more"] is False
+    assert changes(client, page["cursor"])["changes"] == []
+
+    # 전체 목록(since 없음)에는 삭제 기록을 넣지 않음
+    assert [todo["id"] for todo in changes(client)["changes"]] == [ids[0], ids[2]]
+
+def test_import_assigns_seq(client):
+    cursor = changes(client)["cursor"]
+    client.post("/todos/import", content=b'{"title":"imported 1"}\n{"title":"imported 2"}\n')
+    page = changes(client, cursor)
+    assert [todo["title"] for todo in page["changes"]] == ["imported 1", "imported 2"]
+    assert page["changes"][0]["seq"] < page["changes"][1]["seq"]
+
+def test_invalid_cursor(client):
+    assert client.get("/todos/changes", params={"since": "not-a-cursor"}).status_code == 400
+
+def test_user_delete_removes_tombstones(client):
+    todo_id = client.post("/todos/", json={"title": "deleted"}).json()["id"]
+    client.delete(f"/todos/{todo_id}")
+    with SessionLocal() as db:
+        assert db.query(Todo_Tombstone).filter(Todo_Tombstone.user_id == client.user_id).count() == 1
+    client.post("/todos/", json={"title": "cascade"})
+    client.request("DELETE", "/users/me", json={"password": "1234"})
+    with SessionLocal() as db:
+        assert db.query(Todo_Tombstone).filter(Todo_Tombstone.user_id == client.user_id).count() == 0
+
+def test_stale_cursor_requires_full_resync(client, monkeypatch):
+    ids = [client.post("/todos/", json={"title": f"kept {n}"}).json()["id"] for n in range(3)]
+    deleted_id = client.post("/todos/", json={"title": "deleted"}).json()["id"]
+    cursor = changes(client)["cursor"]
+    client.delete(f"/todos/{deleted_id}")
+
+    # 보관기간이 지난 것으로 보고 삭제 기록 정리 -> 정리된 삭제 이전의 커서는 410
+    monkeypatch.setattr(config, 'TOMBSTONE_RETENTION_DAYS', -1)
+    assert tombstone_purge_service.purge_tombstones(batch_size=1, pause=0) >= 1
+    response = client.get("/todos/changes", params={"since": cursor})
+    assert response.status_code == 410
+
+    # 전체 재동기화 : 정리 기준보다 오래된 seq 의 일정도 페이지 단위로 끝까지 이어 받음
+    page = changes(client, limit=1)
+    received = [todo["id"] for todo in page["changes"]]
+    while page["has_more"]:
+        page = changes(client, page["cursor"], limit=1)
+        received += [todo["id"] for todo in page["changes"]]
+    assert received == ids
+    # 마지막 커서는 정리 기준 이후이므로 이어서 변경분 조회 가능
+    assert changes(client, page["cursor"])["changes"] == []
@@ -0,0 +1,67 @@
+# test_todo_transfer.py - 일정 내보내기(ndjson/csv 스트리밍) / 가져오기(chunk 단위 bulk insert)
+import csv
+import io
+import json
+from app.core import config
+from app.schemas.enum import TransferFormat
+from app.services import todo_transfer
+
+
+
+def test_parser_chunk_boundaries():
+    body = '{"title":"한글 제목","complete":1}\n{"title":"second","todo_date":"2025-05-01T09:00:00+09:00"}\n'.encode()
+    parser = todo_transfer.ImportParser(TransferFormat.NDJSON)
+    rows = []
+    # 한 바이트씩 (줄/멀티바이트 문자 중간에서 잘린 조각)
+    for i in range(len(body)):
+        rows += parser.feed(body[i:i + 1])
+    rows += parser.close()
+    assert [row['title'] for row in rows] == ['한글 제목', 'second']
+    assert rows[0]['complete'] == 1
+    assert rows[1]['todo_date'].isoformat() == '2025-05-01T00:00:00'
+
+    body = b'title,description\r\n"a, ""quoted""","line 1\r\nline 2"\r\nlast,\r\n"unterminated'
+    parser = todo_transfer.ImportParser(TransferFormat.CSV)
+    rows = parser.feed(body[:30]) + parser.feed(body[30:]) + parser.close()
+    assert [(row['title'], row['description']) for row in rows] == [('a, "quoted"', 'line 1\nline 2'), ('last', None)]
+    assert parser.skipped == 1
+    assert parser.errors[0].line == 5
+
+def test_import_chunks_and_export(client, statements, monkeypatch):
+    monkeypatch.setattr(config, 'TODO_IMPORT_CHUNK_ROWS', 4)
+    assert client.get("/todos").json() == []
+    lines = [json.dumps({"title": f"import {n}", "description": "bulk", "complete": n % 2}) for n in range(10)]
+    lines.insert(3, '{"title": ')
+    response = client.post("/todos/import", content=('\n'.join(lines) + '\n').encode())
+    assert response.status_code == 200
+    assert response.json() == {"imported": 10, "skipped": 1, "errors": [{"line": 4, "detail": "invalid JSON"}]}
+    # 4 + 4 + 2 행을 각각 executemany 한 번으로 저장
+    assert [len(parameters) for statement, parameters, executemany in statements
+            if executemany and statement.startswith('INSERT INTO todo ')] == [4, 4, 2]
+
+    # 가져온 뒤 목록 캐시가 무효화되어야 함
+    todos = client.get("/todos").json()
+    assert [todo["title"] for todo in todos] == [f"import {n}" for n in range(10)]
+
+    response = client.get("/todos/export")
+    assert response.headers["content-type"] == "application/x-ndjson"
+    assert response.headers["content-disposition"] == 'attachment; filename="todos.ndjson"'
+    assert [json.loads(line) for line in response.text.splitlines()] == todos
+
+    response = client.get("/todos/export", params={"format": "csv"})
+    assert response.headers["content-type"].startswith("text/csv")
+    exported = list(csv.DictReader(io.StringIO(response.text)))
+    assert [row["title"] for row in exported] == [todo["title"] for todo in todos]
+    assert exported[0]["updated_at"] == ""
+
+    # 내보낸 csv 를 그대로 다시 가져오기 (id, user_id 는 새로 부여, 생성일시는 유지)
+    response = client.post("/todos/import", params={"format": "csv"}, content=response.content)
+    assert response.json()["imported"] == 10
+    todos_after = client.get("/todos").json()
+    assert len(todos_after) == 20
+    assert [todo["created_at"] for todo in todos_after[10:]] == [todo["created_at"] for todo in todos]
+
+def test_import_invalid_csv_header(client):
+    response = client.post("/todos/import", params={"format": "csv"}, content=b"name,description\nx,y\n")
+    assert response.status_code == 400
+    assert client.get("/todos").json() == []
@@ -0,0 +1,29 @@
+# test_token_purge.py
+from datetime import datetime, timedelta
+from app.db.database import SessionLocal
+from app.db.models import User, User_Token
+from app.services import token_purge_service
+
+
+def test_purge_expired_tokens_in_batches():
+    with SessionLocal() as db:
+        user = User(email="purge@example.com", name="pytest", password="x")
+        db.add(user)
+        db.flush()
+        now = datetime.utcnow()
+        db.add_all([User_Token(user_id=user.id, device_id=f"expired{i}", expired_at=now - timedelta(days=1)) for i in range(5)])
+        db.add(User_Token(user_id=user.id, device_id="valid", expired_at=now + timedelta(days=1)))
+        db.commit()
+        user_id = user.id
+
+    before = token_purge_service.stats()
+    assert token_purge_service.purge_expired_tokens(batch_size=2, pause=0) == 5
+    after = token_purge_service.stats()
+    assert after['rows_purged'] - before['rows_purged'] == 5
+    assert after['batches'] - before['batches'] == 3
+    assert after['last_batch_rows'] == 1
+
+    with SessionLocal() as db:
+        assert [token.device_id for token in db.query(User_Token).filter(User_Token.user_id == user_id)] == ["valid"]
+        db.query(User).filter(User.id == user_id).delete()
+        db.commit()
@@ -0,0 +1,98 @@
+# test_upgrade_db.py - 최초 버전 스키마(init_db.py 로 만든 DB)를 upgrade_db.py 로 현재 스키마까지 변경
+import sqlite3
+from sqlalchemy import create_engine
+from app.db.database import Base
+from app.utils.jwt_handler import hash_token
+import upgrade_db
+
+BASELINE_DDL = """
+CREATE TABLE users (
+	id INTEGER NOT NULL, email VARCHAR, name VARCHAR, password VARCHAR,
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME, PRIMARY KEY (id));
+CREATE UNIQUE INDEX ix_users_email ON users (email);
+CREATE TABLE users_token (
+	id INTEGER NOT NULL, user_id INTEGER, device_id VARCHAR, login_type VARCHAR DEFAULT local, refresh_token VARCHAR,
+	expired_at DATETIME, created_at DATETIME DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (id),
+	CONSTRAINT uq_user_device UNIQUE (user_id, device_id, login_type),
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE);
+CREATE INDEX ix_users_token_user_id ON users_token (user_id);
+CREATE TABLE todo (
+	id INTEGER NOT NULL, user_id INTEGER, title VARCHAR, description VARCHAR, todo_date DATETIME, complete INTEGER,
+	created_at DATETIME DEFAULT CURRENT_TIMESTAMP, updated_at DATETIME, PRIMARY KEY (id),
+	FOREIGN KEY(user_id) REFERENCES users (id) ON DELETE CASCADE);
+CREATE INDEX ix_todo_user_id ON todo (user_id);
+INSERT INTO users (id, email, name, password) VALUES (1, 'old@example.com', 'old', 'x'), (3, 'older@example.com', 'older', 'x');
+INSERT INTO users_token (user_id, device_id, refresh_token, expired_at) VALUES (1, 'web', 'plain-refresh-token', '2099-01-01');
+INSERT INTO todo (id, user_id, title, description, todo_date, complete) VALUES
+	(1, 1, 'dentist appointment', '', '2025-05-13', 0), (2, 3, 'groceries', 'milk', '2025-05-14', 1);
+"""
+
+def schema(engine) -> set:
+    with engine.connect() as conn:
+        return set(conn.exec_driver_sql("SELECT type, name FROM sqlite_master WHERE name NOT LIKE 'sqlite_%'").all())
+
+def test_upgrade_baseline_database(tmp_path):
+    path = tmp_path / 'old.db'
+    with sqlite3.connect(path) as conn:
+        conn.executescript(BASELINE_DDL)
+    engine = create_engine(f'sqlite:///{path}')
+    fresh = create_engine(f'sqlite:///{tmp_path / "fresh.db"}')
+    Base.metadata.create_all(bind=fresh)
+
+    applied = upgrade_db.upgrade(engine)
+    assert 'rename users_token.refresh_token -> refresh_token_hash' in applied
+    assert 'rebuild users with AUTOINCREMENT' in applied
+    assert 'rebuild todo with AUTOINCREMENT' in applied
+    # 두 번째 실행은 변경 없음, 결과 스키마는 새로 만든 DB 와 같음
+    assert upgrade_db.upgrade(engine) == []
+    assert schema(engine) == schema(fresh)
+
+    with engine.begin() as conn:
+        assert conn.exec_driver_sql('SELECT refresh_token_hash FROM users_token').scalar() == hash_token('plain-refresh-token')
+        assert conn.exec_driver_sql('SELECT id, seq FROM todo ORDER BY id').all() == [(1, 1), (2, 2)]
+        assert conn.exec_driver_sql('SELECT value, purged FROM todo_change_seq').one() == (2, 0)
+        assert conn.exec_driver_sql("SELECT rowid FROM todo_fts WHERE todo_fts MATCH 'dentist'").scalars().all() == [1]
+        # 기존 데이터 이후로 순번 / 삭제 기록 / id 가 이어짐
+        conn.exec_driver_sql("INSERT INTO todo (user_id, title, complete) VALUES (1, 'new', 0)")
+        assert conn.exec_driver_sql("SELECT seq FROM todo WHERE title = 'new'").scalar() == 3
+        conn.exec_driver_sql("DELETE FROM todo WHERE title = 'new'")
+        conn.exec_driver_sql("INSERT INTO todo (user_id, title, complete) VALUES (1, 'newer', 0)")
+        assert conn.exec_driver_sql("SELECT id FROM todo WHERE title = 'newer'").scalar() == 4
+    with engine.connect() as conn:
+        # PRAGMA foreign_keys 는 트랜잭션 밖에서만 변경 가능
+        conn.exec_driver_sql('PRAGMA foreign_keys=ON')
+        conn.exec_driver_sql('DELETE FROM users WHERE id = 3')
+        assert conn.exec_driver_sql('SELECT count(*) FROM todo WHERE user_id = 3').scalar() == 0
+        conn.exec_driver_sql("INSERT INTO users (email) VALUES ('new@example.com')")
+        assert conn.exec_driver_sql("SELECT id FROM users WHERE email = 'new@example.com'").scalar() == 4
+        conn.commit()
+    engine.dispose()
+    fresh.dispose()
+
+def test_upgrade_rebuilds_todo_with_triggers(tmp_path):
+    # todo 만 AUTOINCREMENT 가 아닌 이전 버전 DB : 재생성 후 seq / FTS 트리거가 다시 만들어져야 함
+    path = tmp_path / 'previous.db'
+    engine = create_engine(f'sqlite:///{path}')
+    Base.metadata.create_all(bind=engine)
+    with sqlite3.connect(path) as conn:
+        conn.execute("INSERT INTO users (id, email) VALUES (1, 'previous@example.com')")
+        conn.execute("INSERT INTO todo (user_id, title, complete) VALUES (1, 'dentist appointment', 0), (1, 'groceries', 0)")
+        conn.execute('PRAGMA writable_schema=ON')
+        conn.execute("UPDATE sqlite_master SET sql = replace(sql, ' AUTOINCREMENT', '') WHERE type = 'table' AND name = 'todo'")
+    engine.dispose()
+    triggers = "SELECT name FROM sqlite_master WHERE type = 'trigger' AND tbl_name = 'todo' ORDER BY name"
+    with engine.connect() as conn:
+        expected = conn.exec_driver_sql(triggers).scalars().all()
+        assert 'AUTOINCREMENT' not in upgrade_db._table_sql(conn, 'todo').upper()
+
+    applied = upgrade_db.upgrade(engine)
+    assert 'rebuild todo with AUTOINCREMENT' in applied
+    assert upgrade_db.upgrade(engine) == []
+    with engine.begin() as conn:
+        assert conn.exec_driver_sql(triggers).scalars().all() == expected
+        conn.exec_driver_sql("DELETE FROM todo WHERE id = 2")
+        conn.exec_driver_sql("INSERT INTO todo (user_id, title, complete) VALUES (1, 'dentist again', 0)")
+        assert conn.exec_driver_sql("SELECT id, seq FROM todo WHERE title = 'dentist again'").one() == (3, 4)
+        assert conn.exec_driver_sql("SELECT todo_id, seq FROM todo_tombstone").all() == [(2, 3)]
+        assert conn.exec_driver_sql("SELECT rowid FROM todo_fts WHERE todo_fts MATCH 'dentist' ORDER BY rowid").scalars().all() == [1, 3]
+    engine.dispose()
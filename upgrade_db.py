@@ -0,0 +1,144 @@
+# FastAPI_JWT_Sample/upgrade_db.py
+# 기존 DB 를 현재 모델 스키마로 변경 (데이터 유지, 여러 번 실행해도 같은 결과)
+#   python upgrade_db.py
+#  create_all 은 이미 있는 테이블을 변경하지 않으므로 init_db.py 대신 운영 DB 에 사용
+#   - users_token.refresh_token -> refresh_token_hash (기존 토큰은 sha256 으로 변환하여 그대로 사용 가능)
+#   - users.token_version 추가, users / todo 를 AUTOINCREMENT 테이블로 재생성 (삭제된 id 재사용 방지)
+#     (재생성으로 삭제된 todo 의 seq / FTS 트리거는 아래에서 다시 생성)
+#   - todo.seq 추가 및 기존 행 순번 발급, todo_tombstone / todo_change_seq(purged 포함) / seq 트리거
+#   - todo_fts(FTS5) 와 동기화 트리거 (FTS5 를 지원하는 SQLite 만), 누락된 인덱스 추가
+
+from sqlalchemy import MetaData, inspect
+from sqlalchemy.schema import CreateColumn, CreateTable
+from app.db.database import engine, Base
+from app.db import models
+from app.utils.jwt_handler import hash_token
+
+# 이전 버전에만 있던 인덱스 (ETag 목록 버전은 ix_todo_user_seq 로 계산)
+OBSOLETE_INDEXES = ('ix_todo_user_version',)
+
+def _table_sql(conn, name: str) -> str:
+    return conn.exec_driver_sql("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)).scalar() or ''
+
+def _rename_refresh_token(conn) -> bool:
+    columns = {column['name'] for column in inspect(conn).get_columns('users_token')}
+    if 'refresh_token' not in columns or 'refresh_token_hash' in columns:
+        return False
+    conn.exec_driver_sql('ALTER TABLE users_token RENAME COLUMN refresh_token TO refresh_token_hash')
+    rows = conn.exec_driver_sql('SELECT id, refresh_token_hash FROM users_token WHERE refresh_token_hash IS NOT NULL').all()
+    if rows:
+        conn.exec_driver_sql('UPDATE users_token SET refresh_token_hash = ? WHERE id = ?',
+                             [(hash_token(token), row_id) for row_id, token in rows])
+    return True
+
+def _add_missing_columns(conn) -> list:
+    added = []
+    for table in Base.metadata.sorted_tables:
+        existing = {column['name'] for column in inspect(conn).get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing:
+                conn.exec_driver_sql(f'ALTER TABLE {table.name} ADD COLUMN {CreateColumn(column).compile(dialect=conn.dialect)}')
+                added.append(f'{table.name}.{column.name}')
+    return added
+
+def _rebuild_with_autoincrement(conn, table) -> bool:
+    # SQLite 는 AUTOINCREMENT 를 ALTER 로 추가할 수 없으므로 새 테이블로 복사 후 교체 (foreign_keys=OFF 상태에서)
+    if 'AUTOINCREMENT' in _table_sql(conn, table.name).upper():
+        return False
+    # 외래키 대상 테이블도 같은 MetaData 에 있어야 CREATE TABLE 의 REFERENCES 를 만들 수 있음
+    metadata = MetaData()
+    for foreign_key in table.foreign_keys:
+        foreign_key.column.table.to_metadata(metadata)
+    rebuilt = table.to_metadata(metadata, name=f'{table.name}_new')
+    columns = ', '.join(column.name for column in table.columns)
+    conn.execute(CreateTable(rebuilt))
+    conn.exec_driver_sql(f'INSERT INTO {rebuilt.name} ({columns}) SELECT {columns} FROM {table.name}')
+    conn.exec_driver_sql(f'DROP TABLE {table.name}')
+    conn.exec_driver_sql(f'ALTER TABLE {rebuilt.name} RENAME TO {table.name}')
+    return True
+
+def _create_missing_indexes(conn) -> list:
+    existing = set(inspect(conn).get_table_names())
+    created = []
+    for table in Base.metadata.sorted_tables:
+        names = {index['name'] for index in inspect(conn).get_indexes(table.name)} if table.name in existing else set()
+        for index in table.indexes:
+            if index.name not in names:
+                index.create(conn)
+                created.append(index.name)
+    return created
+
+def _backfill_todo_seq(conn) -> int:
+    # 순번이 없는 기존 일정은 id 순으로 발급 (seq 를 바꾸는 UPDATE 라 todo_seq_au 트리거는 실행되지 않음)
+    ids = conn.exec_driver_sql('SELECT id FROM todo WHERE seq IS NULL ORDER BY id').scalars().all()
+    start = conn.exec_driver_sql('SELECT value FROM todo_change_seq').scalar()
+    if ids:
+        conn.exec_driver_sql('UPDATE todo SET seq = ? WHERE id = ?', [(start + n, todo_id) for n, todo_id in enumerate(ids, 1)])
+    conn.exec_driver_sql('UPDATE todo_change_seq SET value = max(value, '
+                         '(SELECT coalesce(max(seq), 0) FROM todo), (SELECT coalesce(max(seq), 0) FROM todo_tombstone))')
+    return len(ids)
+
+def _create_fts(conn) -> bool:
+    # todo_fts 가 이미 있으면 (todo 재생성으로 삭제되었을 수 있는) 동기화 트리거만 다시 생성
+    if not models.fts5_supported(None, None, conn):
+        return False
+    if inspect(conn).has_table('todo_fts'):
+        for statement in models.TODO_FTS_DDL:
+            if statement.startswith('CREATE TRIGGER'):
+                conn.exec_driver_sql(statement)
+        return False
+    for statement in models.TODO_FTS_DDL:
+        conn.exec_driver_sql(statement)
+    conn.exec_driver_sql("INSERT INTO todo_fts(todo_fts) VALUES ('rebuild')")
+    return True
+
+def upgrade(bind=engine) -> list:
+    # 적용한 변경 목록 반환 (이미 최신이면 빈 목록)
+    applied = []
+    with bind.connect() as conn:
+        # 테이블 재생성 중 ON DELETE CASCADE 가 실행되지 않도록 (트랜잭션 밖에서만 변경 가능)
+        conn.exec_driver_sql('PRAGMA foreign_keys=OFF')
+        try:
+            missing = [table.name for table in Base.metadata.sorted_tables if not inspect(conn).has_table(table.name)]
+            Base.metadata.create_all(conn)
+            applied += [f'create table {name}' for name in missing]
+            if _rename_refresh_token(conn):
+                applied.append('rename users_token.refresh_token -> refresh_token_hash')
+            applied += [f'add column {name}' for name in _add_missing_columns(conn)]
+            for table in (models.User.__table__, models.Todo.__table__):
+                if _rebuild_with_autoincrement(conn, table):
+                    applied.append(f'rebuild {table.name} with AUTOINCREMENT')
+            applied += [f'create index {name}' for name in _create_missing_indexes(conn)]
+            for name in OBSOLETE_INDEXES:
+                if conn.exec_driver_sql("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)).first():
+                    conn.exec_driver_sql(f'DROP INDEX {name}')
+                    applied.append(f'drop index {name}')
+
+            triggers = set(conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").scalars())
+            for statement in models.TODO_SEQ_DDL:
+                conn.exec_driver_sql(statement)
+            if 'purged' not in {row[1] for row in conn.exec_driver_sql('PRAGMA table_info(todo_change_seq)')}:
+                conn.exec_driver_sql('ALTER TABLE todo_change_seq ADD COLUMN purged INTEGER NOT NULL DEFAULT 0')
+                applied.append('add column todo_change_seq.purged')
+            backfilled = _backfill_todo_seq(conn)
+            if backfilled:
+                applied.append(f'backfill todo.seq ({backfilled} rows)')
+            if _create_fts(conn):
+                applied.append('create todo_fts')
+            added = set(conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'").scalars()) - triggers
+            applied += [f'create trigger {name}' for name in sorted(added)]
+
+            violations = conn.exec_driver_sql('PRAGMA foreign_key_check').all()
+            if violations:
+                raise RuntimeError(f'foreign key violations after upgrade: {violations[:10]}')
+            conn.commit()
+        finally:
+            conn.rollback()
+            conn.exec_driver_sql('PRAGMA foreign_keys=ON')
+    return applied
+
+if __name__ == '__main__':
+    print('Upgrading tables...')
+    for change in upgrade():
+        print(f'  {change}')
+    print('Done.')